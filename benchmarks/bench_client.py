@@ -0,0 +1,182 @@
+"""Benchmark: JiraClient throughput and latency against a mock Jira server
+
+Starts ``mock_jira.MockJiraServer`` in-process and times the bulk paths of
+``JiraClient`` (create, search pagination, bulk update, transitions and
+export, plus sharded parallel search) at several concurrency levels. Each scenario reports wall time,
+items per second, HTTP requests made, retries after injected 429s and the
+p50/p95 request latency seen by the client.
+
+Usage:
+    python benchmarks/bench_client.py [--issues 500] [--latency 0.02]
+        [--page-size 100] [--throttle-rate 0.0] [--concurrency 1,4,8,16]
+        [--scenarios create,search,parallel-search,update,transition,export]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from mock_jira import MockJiraServer  # noqa: E402
+from src.jira_manager import Config, JiraClient, MetricsRecorder, RequestScheduler  # noqa: E402
+from src.jira_manager.export import export_issues  # noqa: E402
+
+PROJECT = 'BENCH'
+
+
+def scenario_create(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    rows = [{'summary': f'Benchmark issue {n}', 'labels': ['bench']} for n in range(args.issues)]
+    client.bulk_create_issues(rows, concurrency=concurrency)
+    return len(rows)
+
+
+def scenario_search(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    jql = f'project = {PROJECT} ORDER BY key'
+    return sum(1 for _ in client.iter_issues(
+        jql, page_size=args.page_size, prefetch=concurrency > 1, records=True
+    ))
+
+
+def scenario_parallel_search(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    jql = f'project = {PROJECT} ORDER BY key'
+    return len(client.search_parallel(
+        jql, page_size=args.page_size, concurrency=concurrency, shard_by=args.shard_by
+    ))
+
+
+def scenario_update(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    stamp = str(time.perf_counter_ns())
+    changes = {key: {'labels': ['bench', stamp]} for key in server.jira.issues}
+    client.bulk_update(changes, concurrency=concurrency)
+    return len(changes)
+
+
+def scenario_transition(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    keys = list(server.jira.issues)
+    client.bulk_transition(keys, 'Start Progress', concurrency=concurrency)
+    client.bulk_transition(keys, 'Stop Progress', concurrency=concurrency)
+    return 2 * len(keys)
+
+
+def scenario_export(client: JiraClient, server: MockJiraServer, args: Any, concurrency: int) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        return export_issues(
+            client,
+            f'project = {PROJECT} ORDER BY key',
+            os.path.join(tmp, 'issues.jsonl.gz'),
+            page_size=args.page_size,
+            resume=False
+        )
+
+
+SCENARIOS: Dict[str, Callable[..., int]] = {
+    'create': scenario_create,
+    'search': scenario_search,
+    'parallel-search': scenario_parallel_search,
+    'update': scenario_update,
+    'transition': scenario_transition,
+    'export': scenario_export,
+}
+
+
+def run(name: str, server: MockJiraServer, args: Any, concurrency: int) -> Dict[str, Any]:
+    """Run one scenario on a fresh client and collect its numbers"""
+    if name != 'create' and not server.jira.issues:
+        server.jira.seed_issues(args.issues, PROJECT)
+    recorder = MetricsRecorder(slow_threshold=float('inf'))
+    scheduler = RequestScheduler(backoff=args.backoff, max_concurrency=max(concurrency, 1))
+    client = JiraClient(
+        Config(),
+        pool_size=max(concurrency, 10),
+        scheduler=scheduler,
+        instrumentation=recorder
+    )
+    server.jira.reset_stats()
+    
+    started = time.perf_counter()
+    items = SCENARIOS[name](client, server, args, concurrency)
+    elapsed = time.perf_counter() - started
+    
+    requests = sum(server.jira.requests.values())
+    endpoints = recorder.snapshot()['endpoints'].values()
+    total = sum(e['count'] for e in endpoints) or 1
+    return {
+        'scenario': name,
+        'concurrency': concurrency,
+        'items': items,
+        'seconds': elapsed,
+        'rate': items / elapsed if elapsed > 0 else 0.0,
+        'requests': requests,
+        'retries': scheduler.retries,
+        'p50_ms': 1000 * sum(e['p50'] * e['count'] for e in endpoints) / total,
+        'p95_ms': 1000 * max((e['p95'] for e in endpoints), default=0.0),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--issues', type=int, default=500)
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='Server-side delay per request in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=100,
+                        help='maxResults requested by the client')
+    parser.add_argument('--max-page-size', type=int, default=100,
+                        help='Server-side cap on maxResults')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='Fraction of requests answered with HTTP 429')
+    parser.add_argument('--retry-after', type=float, default=0.0,
+                        help='Retry-After seconds sent with injected 429s')
+    parser.add_argument('--backoff', type=float, default=0.05,
+                        help='Client backoff base when no Retry-After is sent')
+    parser.add_argument('--shard-by', choices=['offset', 'id'], default='offset',
+                        help='Split mode for the parallel-search scenario')
+    parser.add_argument('--cloud', action='store_true',
+                        help='Page with nextPageToken like Jira Cloud')
+    parser.add_argument('--concurrency', default='1,4,8,16')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS))
+    parser.add_argument('--verbose', action='store_true', help='Show client log output')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.ERROR)
+    
+    levels = [int(n) for n in args.concurrency.split(',')]
+    names = [n.strip() for n in args.scenarios.split(',')]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    
+    print(f"{'scenario':<16} {'conc':>4} {'items':>6} {'seconds':>8} {'items/s':>9} "
+          f"{'requests':>8} {'retries':>7} {'p50 ms':>7} {'p95 ms':>7}")
+    for name in names:
+        for concurrency in levels:
+            with MockJiraServer(
+                latency=args.latency,
+                jitter=args.jitter,
+                max_page_size=args.max_page_size,
+                throttle_rate=args.throttle_rate,
+                retry_after=args.retry_after,
+                cloud=args.cloud
+            ) as server:
+                os.environ.update({
+                    'JIRA_URL': server.url,
+                    'JIRA_EMAIL': 'bench@example.com',
+                    'JIRA_API_TOKEN': 'bench-token',
+                    'JIRA_PROJECT_KEY': PROJECT,
+                    'PROJECT_ISSUE_TYPE': 'Task',
+                })
+                r = run(name, server, args, concurrency)
+            print(f"{r['scenario']:<16} {r['concurrency']:>4} {r['items']:>6} "
+                  f"{r['seconds']:>8.2f} {r['rate']:>9.1f} {r['requests']:>8} "
+                  f"{r['retries']:>7} {r['p50_ms']:>7.1f} {r['p95_ms']:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: start-up latency of short-lived Jira Manager processes
+
+Runs each scenario in a fresh interpreter several times and reports the
+median wall-clock time. No Jira instance is needed; clients are created
+with ``lazy=True`` so no connection is attempted.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    'python (baseline)': 'pass',
+    'import jira (python-jira)': 'import jira',
+    'import src.jira_manager': 'import src.jira_manager',
+    'JiraClient(lazy=True)': (
+        'from src.jira_manager import JiraClient, Config\n'
+        'JiraClient(Config(), lazy=True)'
+    ),
+    'jira-manager --help': (
+        'import sys\n'
+        'from src.jira_manager.cli import main\n'
+        'try:\n'
+        '    main(["--help"])\n'
+        'except SystemExit:\n'
+        '    pass'
+    ),
+}
+
+BENCH_ENV = {
+    'JIRA_URL': 'https://bench.example.invalid',
+    'JIRA_EMAIL': 'bench@example.com',
+    'JIRA_API_TOKEN': 'bench-token',
+}
+
+
+def time_snippet(code: str, runs: int) -> float:
+    """Return the median run time of ``code`` in a fresh interpreter, in ms"""
+    env = dict(os.environ, **BENCH_ENV)
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=ROOT,
+            env=env,
+            check=True,
+            stdout=subprocess.DEVNULL
+        )
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    
+    print(f"{'scenario':<30} {'median ms':>10}")
+    for name, code in SCENARIOS.items():
+        print(f"{name:<30} {time_snippet(code, args.runs):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,321 @@
+"""In-process stand-in for the Jira REST API, for benchmarks
+
+Implements the endpoints ``JiraClient`` uses (server info, issues, bulk
+create, search with ``startAt`` or ``nextPageToken`` paging, transitions and
+comments) on a threaded HTTP/1.1 server with keep-alive. With ``cloud=True``
+the legacy ``search`` endpoint answers 410 Gone, as on Jira Cloud. Latency, the
+server-side page size cap and 429 injection are configurable, so client
+changes can be measured without a real Jira instance.
+
+Usage:
+    with MockJiraServer(latency=0.02, throttle_rate=0.05) as server:
+        os.environ['JIRA_URL'] = server.url
+        ...
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+API = '/rest/api/2/'
+
+# Tiny workflow: status -> [(transition id, transition name, target status)]
+WORKFLOW = {
+    'To Do': [('11', 'Start Progress', 'In Progress'), ('31', 'Done', 'Done')],
+    'In Progress': [('21', 'Stop Progress', 'To Do'), ('31', 'Done', 'Done')],
+    'Done': [('41', 'Reopen', 'To Do')],
+}
+
+_KEY_IN = re.compile(r'\bkey\s+in\s*\(([^)]*)\)', re.IGNORECASE)
+_PROJECT_EQ = re.compile(r'\bproject\s*=\s*"?([A-Za-z0-9_]+)"?', re.IGNORECASE)
+_ID_BOUND = re.compile(r'\bid\s*(>=|<)\s*(\d+)', re.IGNORECASE)
+
+
+class MockJira:
+    """Issue store and request accounting shared by the handler threads"""
+    
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        max_page_size: int = 100,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0.0,
+        cloud: bool = False,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.max_page_size = max_page_size
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.cloud = cloud
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.requests: Dict[Tuple[str, str], int] = {}
+        self.throttled = 0
+        self._next_id = 10000
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def seed_issues(self, count: int, project_key: str = 'BENCH') -> List[str]:
+        """Add ``count`` issues in status "To Do" and return their keys"""
+        return [
+            self.create({
+                'project': {'key': project_key},
+                'summary': f'Seeded issue {n}',
+                'issuetype': {'name': 'Task'},
+            })['key']
+            for n in range(count)
+        ]
+    
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.throttled = 0
+    
+    def should_throttle(self, method: str, route: str) -> bool:
+        """Count the request and decide whether to answer it with a 429"""
+        with self._lock:
+            self.requests[(method, route)] = self.requests.get((method, route), 0) + 1
+            if self.throttle_rate and self._random.random() < self.throttle_rate:
+                self.throttled += 1
+                return True
+            return False
+    
+    def delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+    
+    def create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        project_key = (fields.get('project') or {}).get('key', 'BENCH')
+        now = time.strftime('%Y-%m-%dT%H:%M:%S.000+0000', time.gmtime())
+        with self._lock:
+            self._next_id += 1
+            issue_id = str(self._next_id)
+            key = f"{project_key}-{len(self.issues) + 1}"
+            stored = dict(fields)
+            stored.update({
+                'project': {'key': project_key},
+                'status': {'name': 'To Do'},
+                'priority': fields.get('priority') or {'name': 'Medium'},
+                'assignee': fields.get('assignee'),
+                'labels': fields.get('labels', []),
+                'comment': {'comments': [], 'total': 0},
+                'created': now,
+                'updated': now,
+            })
+            self.issues[key] = {'id': issue_id, 'key': key, 'fields': stored}
+        return {'id': issue_id, 'key': key, 'self': f'{API}issue/{issue_id}'}
+    
+    def view(self, issue: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        """Project an issue onto the requested fields"""
+        if not fields or '*all' in fields or '*navigable' in fields:
+            projected = dict(issue['fields'])
+        else:
+            projected = {f: issue['fields'].get(f) for f in fields}
+        return {'id': issue['id'], 'key': issue['key'], 'self': f"{API}issue/{issue['id']}",
+                'fields': projected}
+    
+    def search(self, jql: str) -> List[Dict[str, Any]]:
+        """Evaluate the JQL subset the client emits: ``key in (...)``, ``project =``
+        and ``id`` bounds; results are in id order
+        """
+        with self._lock:
+            issues = list(self.issues.values())
+        match = _KEY_IN.search(jql)
+        if match:
+            wanted = {k.strip().strip('"\'') for k in match.group(1).split(',')}
+            issues = [i for i in issues if i['key'] in wanted]
+        match = _PROJECT_EQ.search(jql)
+        if match:
+            issues = [i for i in issues if i['fields']['project']['key'] == match.group(1)]
+        for op, bound in _ID_BOUND.findall(jql):
+            if op == '>=':
+                issues = [i for i in issues if int(i['id']) >= int(bound)]
+            else:
+                issues = [i for i in issues if int(i['id']) < int(bound)]
+        if re.search(r'ORDER\s+BY\s+\w+\s+DESC', jql, re.IGNORECASE):
+            return sorted(issues, key=lambda i: int(i['id']), reverse=True)
+        return sorted(issues, key=lambda i: int(i['id']))
+    
+    def transition(self, key: str, transition_id: str) -> bool:
+        with self._lock:
+            fields = self.issues[key]['fields']
+            for tid, _, target in WORKFLOW[fields['status']['name']]:
+                if tid == transition_id:
+                    fields['status'] = {'name': target}
+                    return True
+        return False
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: "MockJiraServer"
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def do_GET(self) -> None:
+        self._dispatch('GET')
+    
+    def do_POST(self) -> None:
+        self._dispatch('POST')
+    
+    def do_PUT(self) -> None:
+        self._dispatch('PUT')
+    
+    def do_DELETE(self) -> None:
+        self._dispatch('DELETE')
+    
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length) or b'null') if length else None
+        url = urlparse(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        path = url.path[len(API):] if url.path.startswith(API) else url.path
+        parts = path.strip('/').split('/')
+        route = '/'.join(parts)
+        if parts[0] == 'issue' and len(parts) > 1 and parts[1] != 'bulk':
+            route = '/'.join(['issue', '{key}'] + parts[2:])
+        
+        jira = self.server.jira
+        time.sleep(jira.delay())
+        if jira.should_throttle(method, route):
+            headers = {'Retry-After': f'{jira.retry_after:g}'} if jira.retry_after else {}
+            self._send(429, {'errorMessages': ['Rate limit exceeded']}, headers)
+            return
+        
+        try:
+            status, payload = self._route(jira, method, parts, params, body)
+        except KeyError:
+            status, payload = 404, {'errorMessages': ['Issue does not exist']}
+        self._send(status, payload)
+    
+    def _route(
+        self,
+        jira: MockJira,
+        method: str,
+        parts: List[str],
+        params: Dict[str, str],
+        body: Any
+    ) -> Tuple[int, Any]:
+        if parts == ['serverInfo']:
+            return 200, {
+                'baseUrl': self.server.url,
+                'version': '9.12.0',
+                'versionNumbers': [9, 12, 0],
+                'deploymentType': 'Cloud' if jira.cloud else 'Server',
+            }
+        if parts == ['field']:
+            return 200, [{'id': 'summary', 'name': 'Summary', 'clauseNames': ['summary']}]
+        if parts == ['search'] and jira.cloud:
+            return 410, {'errorMessages': ['The requested API has been removed.']}
+        if parts[0] == 'search':
+            return 200, self._search(jira, method, parts, params, body)
+        if parts == ['issue'] and method == 'POST':
+            return 201, jira.create(body['fields'])
+        if parts == ['issue', 'bulk'] and method == 'POST':
+            created = [jira.create(update['fields']) for update in body['issueUpdates']]
+            return 201, {'issues': created, 'errors': []}
+        
+        key = parts[1]
+        issue = jira.issues[key]
+        if len(parts) == 2:
+            if method == 'GET':
+                fields = params.get('fields')
+                return 200, jira.view(issue, fields.split(',') if fields else None)
+            if method == 'PUT':
+                with jira._lock:
+                    issue['fields'].update(body.get('fields', {}))
+                    issue['fields']['updated'] = time.strftime(
+                        '%Y-%m-%dT%H:%M:%S.000+0000', time.gmtime()
+                    )
+                return 204, None
+            if method == 'DELETE':
+                with jira._lock:
+                    del jira.issues[key]
+                return 204, None
+        if parts[2] == 'transitions':
+            if method == 'GET':
+                status = issue['fields']['status']['name']
+                return 200, {'transitions': [
+                    {'id': tid, 'name': name, 'to': {'name': target}}
+                    for tid, name, target in WORKFLOW[status]
+                ]}
+            if jira.transition(key, str(body['transition']['id'])):
+                return 204, None
+            return 400, {'errorMessages': ['Transition is not valid for this issue']}
+        if parts[2] == 'comment' and method == 'POST':
+            with jira._lock:
+                comments = issue['fields']['comment']
+                comment = {'id': str(comments['total'] + 1), 'body': body['body']}
+                comments['comments'].append(comment)
+                comments['total'] += 1
+            return 201, comment
+        return 404, {'errorMessages': [f"No mock for {method} {'/'.join(parts)}"]}
+    
+    @staticmethod
+    def _search(
+        jira: MockJira,
+        method: str,
+        parts: List[str],
+        params: Dict[str, str],
+        body: Any
+    ) -> Dict[str, Any]:
+        query = dict(body or {}) if method == 'POST' else dict(params)
+        fields = query.get('fields')
+        if isinstance(fields, str):
+            fields = fields.split(',')
+        page_size = min(int(query.get('maxResults') or 50), jira.max_page_size)
+        matches = jira.search(query.get('jql', ''))
+        
+        if parts == ['search', 'jql']:
+            start = int(query.get('nextPageToken') or 0)
+        else:
+            start = int(query.get('startAt') or 0)
+        page = [jira.view(issue, fields) for issue in matches[start:start + page_size]]
+        end = start + len(page)
+        
+        if parts == ['search', 'jql']:
+            result: Dict[str, Any] = {'issues': page, 'isLast': end >= len(matches)}
+            if end < len(matches):
+                result['nextPageToken'] = str(end)
+            return result
+        return {'startAt': start, 'maxResults': page_size, 'total': len(matches), 'issues': page}
+    
+    def _send(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """Serve a ``MockJira`` on localhost from a daemon thread"""
+    
+    daemon_threads = True
+    request_queue_size = 128
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, **options: Any):
+        super().__init__((host, port), _Handler)
+        self.jira = MockJira(**options)
+        self.url = f"http://{host}:{self.server_port}"
+        self._thread: Optional[threading.Thread] = None
+    
+    def __enter__(self) -> "MockJiraServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+        self.server_close()
@@ -6,13 +6,25 @@ __version__ = "1.0.0"
 __author__ = "Jeevi"
 __license__ = "MIT"
 
+from .cache import ClientCache
 from .core import JiraClient
 from .config import Config
+from .metrics import MetricsRecorder
+from .mirror import IssueMirror
+from .pool import JiraClientPool
+from .records import IssueRecord
+from .throttle import RequestScheduler
 from .exceptions import JiraManagerError, AuthenticationError, ConnectionError
 
 __all__ = [
     "JiraClient",
     "Config",
+    "ClientCache",
+    "MetricsRecorder",
+    "IssueMirror",
+    "JiraClientPool",
+    "IssueRecord",
+    "RequestScheduler",
     "JiraManagerError",
     "AuthenticationError",
     "ConnectionError",
@@ -0,0 +1,7 @@
+"""Allow running Jira Manager with ``python -m jira_manager``"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,367 @@
+"""asyncio-native Jira client
+
+Requires the optional ``httpx`` package (``pip install httpx``).
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from .config import Config
+from .core import JiraClient, build_issue_fields
+from .exceptions import (
+    AuthenticationError,
+    ConfigurationError,
+    ConnectionError,
+    IssueNotFoundError,
+    JiraManagerError,
+    PermissionError,
+)
+from .jql import Query
+from .throttle import RETRYABLE_STATUSES, backoff_delay, parse_retry_after, request_not_sent
+
+
+logger = logging.getLogger(__name__)
+
+
+def _import_httpx() -> Any:
+    """Import httpx, explaining how to install it when it is missing"""
+    try:
+        import httpx
+    except ImportError as e:
+        raise ConfigurationError(
+            "AsyncJiraClient requires the 'httpx' package. "
+            "Install it with: pip install httpx"
+        ) from e
+    return httpx
+
+
+class AsyncJiraClient:
+    """Async counterpart of ``JiraClient`` built on a pooled ``httpx.AsyncClient``
+    
+    Methods mirror ``JiraClient`` but return the raw JSON dicts from the REST
+    API instead of python-jira resources. At most ``concurrency`` requests are
+    in flight at once, so thousands of calls can be fanned out with
+    ``asyncio.gather``. Use as an async context manager or call ``aclose``.
+    """
+    
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        concurrency: int = 20,
+        max_connections: int = 100,
+        timeout: float = 30.0,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 60.0,
+        cloud: Optional[bool] = None,
+        transport: Any = None
+    ):
+        httpx = _import_httpx()
+        self.config = config or Config()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        base_url = self.config.jira_url.rstrip('/')
+        self.cloud = cloud if cloud is not None else base_url.endswith('.atlassian.net')
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._http = httpx.AsyncClient(
+            base_url=f"{base_url}/rest/api/2/",
+            auth=(self.config.jira_email, self.config.jira_api_token),
+            headers={'Accept': 'application/json'},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=timeout,
+            transport=transport
+        )
+        self._httpx = httpx
+    
+    async def __aenter__(self) -> "AsyncJiraClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections"""
+        await self._http.aclose()
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        action: str,
+        issue_key: Optional[str] = None,
+        idempotent: Optional[bool] = None,
+        **kwargs: Any
+    ) -> Any:
+        """Send one request, retrying transient failures, and map failures to our errors
+        
+        Only idempotent requests (every method but POST, unless told
+        otherwise) are retried on 5xx; the others only on 429 or when the
+        connection failed before anything was sent.
+        """
+        if idempotent is None:
+            idempotent = method != 'POST'
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await self._http.request(method, path, **kwargs)
+            except self._httpx.TransportError as e:
+                if not request_not_sent(e) or attempt >= self.max_retries:
+                    raise ConnectionError(f"Failed to connect to Jira: {e}") from e
+                delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+                attempt += 1
+                logger.warning(
+                    f"Could not reach Jira; retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            
+            status = response.status_code
+            retryable = status in RETRYABLE_STATUSES if idempotent else status == 429
+            if retryable and attempt < self.max_retries:
+                delay = parse_retry_after(response.headers.get('Retry-After'))
+                if delay is None:
+                    delay = backoff_delay(attempt, self.backoff, self.max_backoff)
+                attempt += 1
+                logger.warning(
+                    f"Jira returned HTTP {status}; retry {attempt}/{self.max_retries} "
+                    f"in {delay:.2f}s"
+                )
+                await asyncio.sleep(min(delay, self.max_backoff))
+                continue
+            
+            if status < 400:
+                return response.json() if response.content else None
+            if status == 401:
+                raise AuthenticationError(
+                    "Authentication failed. Please check your email and API token."
+                )
+            if status == 403:
+                raise PermissionError(f"Failed to {action}: permission denied")
+            if status == 404 and issue_key is not None:
+                raise IssueNotFoundError(f"Issue {issue_key} not found")
+            raise JiraManagerError(f"Failed to {action}: HTTP {status} {response.text}")
+    
+    async def create_issue(
+        self,
+        summary: str,
+        description: str = "",
+        issue_type: Optional[str] = None,
+        project_key: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Create a new Jira issue; returns its ``id``, ``key`` and ``self``"""
+        fields = build_issue_fields(
+            self.config,
+            summary,
+            description=description,
+            issue_type=issue_type,
+            project_key=project_key,
+            priority=priority,
+            assignee=assignee,
+            labels=labels,
+            **kwargs
+        )
+        issue = await self._request('POST', 'issue', 'create issue', json={'fields': fields})
+        logger.info(f"Created issue: {issue['key']}")
+        return issue
+    
+    async def get_issue(
+        self,
+        issue_key: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Get an issue by key"""
+        params = {}
+        if fields:
+            params['fields'] = ','.join(fields)
+        if expand:
+            params['expand'] = JiraClient._resolve_expand(expand)
+        return await self._request(
+            'GET', f'issue/{issue_key}', 'get issue', issue_key=issue_key, params=params
+        )
+    
+    async def get_issues(self, issue_keys: Iterable[str], **kwargs: Any) -> List[Dict[str, Any]]:
+        """Get many issues concurrently, in the order given"""
+        return await asyncio.gather(*(self.get_issue(key, **kwargs) for key in issue_keys))
+    
+    async def update_issue(
+        self,
+        issue_key: str,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        assignee: Optional[str] = None,
+        priority: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        **kwargs
+    ) -> None:
+        """Update fields of an existing issue"""
+        update_fields: Dict[str, Any] = {}
+        if summary:
+            update_fields['summary'] = summary
+        if description:
+            update_fields['description'] = description
+        if assignee:
+            update_fields['assignee'] = {'name': assignee}
+        if priority:
+            update_fields['priority'] = {'name': priority}
+        if labels is not None:
+            update_fields['labels'] = labels
+        update_fields.update(kwargs)
+        
+        await self._request(
+            'PUT', f'issue/{issue_key}', 'update issue',
+            issue_key=issue_key, json={'fields': update_fields}
+        )
+        logger.info(f"Updated issue: {issue_key}")
+    
+    async def delete_issue(self, issue_key: str) -> None:
+        """Delete an issue"""
+        await self._request('DELETE', f'issue/{issue_key}', 'delete issue', issue_key=issue_key)
+        logger.info(f"Deleted issue: {issue_key}")
+    
+    async def add_comment(self, issue_key: str, comment: str) -> Dict[str, Any]:
+        """Add a comment to an issue"""
+        result = await self._request(
+            'POST', f'issue/{issue_key}/comment', 'add comment',
+            issue_key=issue_key, json={'body': comment}
+        )
+        logger.info(f"Added comment to {issue_key}")
+        return result
+    
+    async def get_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
+        """Get available transitions for an issue"""
+        data = await self._request(
+            'GET', f'issue/{issue_key}/transitions', 'get transitions', issue_key=issue_key
+        )
+        return [{'id': t['id'], 'name': t['name']} for t in data.get('transitions', [])]
+    
+    async def transition_issue(self, issue_key: str, transition_name: str) -> None:
+        """Transition an issue by transition name or id"""
+        transition_id = transition_name
+        if not transition_name.isdigit():
+            transitions = await self.get_transitions(issue_key)
+            matches = [t['id'] for t in transitions if t['name'].lower() == transition_name.lower()]
+            if not matches:
+                raise JiraManagerError(
+                    f"Failed to transition issue: '{transition_name}' is not available for {issue_key}"
+                )
+            transition_id = matches[0]
+        await self._request(
+            'POST', f'issue/{issue_key}/transitions', 'transition issue',
+            issue_key=issue_key, json={'transition': {'id': transition_id}}
+        )
+        logger.info(f"Transitioned {issue_key} to {transition_name}")
+    
+    async def assign_issue(self, issue_key: str, assignee: str) -> None:
+        """Assign an issue to a user"""
+        body = {'accountId': assignee} if self.cloud else {'name': assignee}
+        await self._request(
+            'PUT', f'issue/{issue_key}/assignee', 'assign issue',
+            issue_key=issue_key, json=body
+        )
+        logger.info(f"Assigned {issue_key} to {assignee}")
+    
+    async def _search_page(
+        self,
+        jql: str,
+        cursor: Union[int, str],
+        page_size: int,
+        fields: Union[List[str], str],
+        expand: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Union[int, str, None]]:
+        """Fetch one page of raw issues and the cursor of the page after it"""
+        body: Dict[str, Any] = {
+            'jql': jql,
+            'maxResults': page_size,
+            'fields': [fields] if isinstance(fields, str) else fields,
+        }
+        if expand:
+            body['expand'] = expand
+        
+        if self.cloud:
+            if cursor:
+                body['nextPageToken'] = cursor
+            data = await self._request('POST', 'search/jql', 'search issues', idempotent=True, json=body)
+            issues = data.get('issues', [])
+            return issues, None if data.get('isLast', True) else data.get('nextPageToken')
+        
+        if expand:
+            body['expand'] = expand.split(',')
+        body['startAt'] = cursor
+        data = await self._request('POST', 'search', 'search issues', idempotent=True, json=body)
+        issues = data.get('issues', [])
+        next_start = cursor + len(issues)
+        if not issues or next_start >= data.get('total', 0):
+            return issues, None
+        return issues, next_start
+    
+    async def iter_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every raw issue matching JQL, fetching pages lazily"""
+        fields = JiraClient._resolve_fields(fields, all_fields)
+        expand = JiraClient._resolve_expand(expand)
+        cursor: Union[int, str, None] = 0
+        while cursor is not None:
+            page, cursor = await self._search_page(jql, cursor, page_size, fields, expand)
+            for raw in page:
+                yield raw
+    
+    async def search_issues(
+        self,
+        jql: str,
+        max_results: int = 50,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Search issues using JQL, returning up to ``max_results`` raw issues"""
+        issues = []
+        async for raw in self.iter_issues(
+            jql,
+            page_size=min(max_results, 100),
+            fields=fields,
+            expand=expand,
+            all_fields=all_fields
+        ):
+            issues.append(raw)
+            if len(issues) >= max_results:
+                break
+        logger.info(f"Found {len(issues)} issues")
+        return issues
+    
+    async def list_issues(
+        self,
+        project_key: Optional[str] = None,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        fields: Optional[List[str]] = None,
+        all_fields: bool = False
+    ) -> List[Dict[str, Any]]:
+        """List issues with filters"""
+        query = (
+            Query()
+            .where('project', project_key or self.config.project_key)
+            .where('assignee', assignee or None)
+            .where('status', status or None)
+            .order_by('created', 'DESC')
+        )
+        return await self.search_issues(
+            str(query), max_results=limit, fields=fields, all_fields=all_fields
+        )
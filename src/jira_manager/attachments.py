@@ -0,0 +1,232 @@
+"""Streaming attachment upload and download with a per-issue manifest"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+from .utils import chunked, run_concurrently
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+# Bytes read or written per step when streaming attachments
+ATTACHMENT_CHUNK_SIZE = 1024 * 1024
+
+# Per-issue record of downloaded attachments, used to skip unchanged files
+ATTACHMENT_MANIFEST = '.attachments.json'
+
+
+def _file_size(path: str) -> Optional[int]:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def _sha256(path: str, chunk_size: int = ATTACHMENT_CHUNK_SIZE) -> str:
+    """Hash a file without reading it whole into memory"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_attachments(
+    client: "JiraClient",
+    issue_key: str,
+    paths: Iterable[str],
+    concurrency: int = 4
+) -> List[Dict[str, Any]]:
+    """Attach files to an issue, streaming each from disk
+    
+    Files are sent as streamed multipart bodies, never read whole into
+    memory, ``concurrency`` at a time. Returns one result per path with
+    ``path``, ``status`` (``Success``/``Error``), ``id`` and ``error``.
+    """
+    from jira import JIRAError
+    
+    def upload(path: str) -> Dict[str, Any]:
+        try:
+            with open(path, 'rb') as handle:
+                attachment = client._request(
+                    'add_attachment', client._jira.add_attachment,
+                    issue_key, handle, os.path.basename(path)
+                )
+        except (JIRAError, OSError) as e:
+            return {'path': path, 'status': 'Error', 'id': None, 'error': str(e)}
+        return {'path': path, 'status': 'Success', 'id': attachment.id, 'error': None}
+    
+    results = run_concurrently(upload, list(paths), concurrency)
+    client._invalidate(issue_key)
+    uploaded = sum(1 for r in results if r['status'] == 'Success')
+    logger.info(f"Uploaded {uploaded}/{len(results)} attachments to {issue_key}")
+    return results
+
+
+def download_attachments(
+    client: "JiraClient",
+    dest_dir: str,
+    issue_keys: Optional[Iterable[str]] = None,
+    jql: Optional[str] = None,
+    concurrency: int = 8,
+    chunk_size: int = ATTACHMENT_CHUNK_SIZE
+) -> List[Dict[str, Any]]:
+    """Save the attachments of some issues under ``dest_dir/<issue key>/``
+    
+    Pass ``issue_keys`` or a ``jql`` query (e.g. a whole project). Issues
+    are listed a page at a time and files stream to disk in ``chunk_size``
+    pieces, ``concurrency`` at a time, so memory stays bounded however much
+    is archived. Each file is written to ``<name>.part`` and renamed once
+    complete, so an interrupted download never leaves a truncated file under
+    the final name. A file whose size and SHA-256 match those recorded when
+    it was last downloaded is skipped. Returns one result per attachment
+    with ``issue``, ``id``, ``path``, ``status``
+    (``Downloaded``/``Skipped``/``Error``) and ``error``.
+    """
+    if (issue_keys is None) == (jql is None):
+        raise ValueError("Pass exactly one of issue_keys or jql")
+    if jql is not None:
+        pages: Iterable[List[Dict[str, Any]]] = (
+            page for page, _ in client.iter_pages(jql, fields=['attachment'])
+        )
+    else:
+        pages = (
+            list(client._fetch_raw_issues(keys, ['attachment']).values())
+            for keys in chunked(issue_keys, 100)
+        )
+    
+    results = []
+    for page in pages:
+        jobs = []
+        for raw in page:
+            attachments = (raw.get('fields') or {}).get('attachment') or []
+            if attachments:
+                jobs.extend(_attachment_jobs(raw['key'], attachments, dest_dir))
+        page_results = run_concurrently(
+            lambda job: _download_attachment(client, *job, chunk_size=chunk_size),
+            jobs,
+            concurrency
+        )
+        _update_manifests(page_results)
+        results.extend(page_results)
+    
+    downloaded = sum(1 for r in results if r['status'] == 'Downloaded')
+    skipped = sum(1 for r in results if r['status'] == 'Skipped')
+    logger.info(
+        f"Attachments: {downloaded} downloaded, {skipped} unchanged, "
+        f"{len(results) - downloaded - skipped} failed"
+    )
+    return results
+
+
+def _attachment_jobs(
+    issue_key: str,
+    attachments: List[Dict[str, Any]],
+    dest_dir: str
+) -> List[Tuple[str, Dict[str, Any], str, Optional[Dict[str, Any]]]]:
+    """Pick a local path and the manifest entry for each attachment of an issue"""
+    directory = os.path.join(dest_dir, issue_key)
+    try:
+        with open(os.path.join(directory, ATTACHMENT_MANIFEST), encoding='utf-8') as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError):
+        manifest = {}
+    
+    jobs = []
+    names = set()
+    for attachment in sorted(attachments, key=lambda a: int(a['id'])):
+        name = os.path.basename(attachment['filename'].replace('\\', '/')) or attachment['id']
+        # Jira allows several attachments with one name on an issue
+        if name in names or name == ATTACHMENT_MANIFEST:
+            name = f"{attachment['id']}_{name}"
+        names.add(name)
+        jobs.append((
+            issue_key, attachment, os.path.join(directory, name),
+            manifest.get(str(attachment['id']))
+        ))
+    return jobs
+
+
+def _download_attachment(
+    client: "JiraClient",
+    issue_key: str,
+    attachment: Dict[str, Any],
+    path: str,
+    recorded: Optional[Dict[str, Any]],
+    chunk_size: int = ATTACHMENT_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Stream one attachment to ``path`` unless the local copy is current"""
+    from jira import JIRAError
+    
+    result = {'issue': issue_key, 'id': str(attachment['id']), 'path': path,
+              'size': attachment.get('size'), 'sha256': None, 'status': 'Downloaded',
+              'error': None}
+    if (
+        recorded is not None
+        and recorded.get('size') == attachment.get('size')
+        and _file_size(path) == attachment.get('size')
+        and _sha256(path, chunk_size) == recorded.get('sha256')
+    ):
+        result.update(status='Skipped', sha256=recorded['sha256'])
+        return result
+    
+    def fetch() -> str:
+        response = client._jira._session.get(attachment['content'], stream=True)
+        try:
+            if response.status_code >= 400:
+                raise JIRAError(
+                    status_code=response.status_code, text=response.reason,
+                    url=attachment['content'], response=response
+                )
+            digest = hashlib.sha256()
+            written = 0
+            partial = f"{path}.part"
+            with open(partial, 'wb') as handle:
+                for chunk in response.iter_content(chunk_size):
+                    handle.write(chunk)
+                    digest.update(chunk)
+                    written += len(chunk)
+            expected = attachment.get('size')
+            if expected is not None and written != expected:
+                raise OSError(f"Downloaded {written} of {expected} bytes")
+            os.replace(partial, path)
+            return digest.hexdigest()
+        finally:
+            response.close()
+    
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        result['sha256'] = client._request('download_attachment', fetch)
+    except (JIRAError, OSError) as e:
+        result.update(status='Error', error=str(e))
+    return result
+
+
+def _update_manifests(results: List[Dict[str, Any]]) -> None:
+    """Record size and checksum of fetched files next to them"""
+    by_dir: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        if result['sha256'] is not None:
+            by_dir.setdefault(os.path.dirname(result['path']), []).append(result)
+    for directory, entries in by_dir.items():
+        path = os.path.join(directory, ATTACHMENT_MANIFEST)
+        try:
+            with open(path, encoding='utf-8') as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            manifest = {}
+        for entry in entries:
+            manifest[entry['id']] = {
+                'file': os.path.basename(entry['path']),
+                'size': entry['size'],
+                'sha256': entry['sha256'],
+            }
+        with open(f"{path}.tmp", 'w', encoding='utf-8') as handle:
+            json.dump(manifest, handle, indent=1, sort_keys=True)
+        os.replace(f"{path}.tmp", path)
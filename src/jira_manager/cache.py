@@ -0,0 +1,98 @@
+"""Client-side caching for Jira lookups"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# Returned by ClientCache.get when nothing usable is cached
+MISSING = object()
+
+# Seconds each kind of entry stays fresh. Search results and issues change
+# often; workflow transitions, priorities and issue types almost never do.
+DEFAULT_TTLS = {
+    'search': 10.0,
+    'issue': 30.0,
+    'transitions': 3600.0,
+    'priorities': 3600.0,
+    'issue_types': 3600.0,
+    'createmeta': 3600.0,
+}
+
+
+class ClientCache:
+    """Size-bounded LRU cache with a time-to-live per kind of entry
+    
+    Entries are keyed by ``(kind, key)``. Any object providing ``get``,
+    ``set`` and ``invalidate`` with the same signatures can be passed to
+    ``JiraClient(cache=...)`` instead.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        self.evictions = 0
+    
+    def get(self, kind: str, key: Hashable, default: Any = MISSING) -> Any:
+        """Return a fresh cached value, or ``default``"""
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end((kind, key))
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[(kind, key)]
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+            return default
+    
+    def set(self, kind: str, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        expires = self._clock() + self.ttls.get(kind, self.default_ttl)
+        with self._lock:
+            self._entries[(kind, key)] = (expires, value)
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def invalidate(self, kind: str, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry of ``kind`` when ``key`` is None"""
+        with self._lock:
+            if key is not None:
+                self._entries.pop((kind, key), None)
+                return
+            for entry_key in [k for k in self._entries if k[0] == kind]:
+                del self._entries[entry_key]
+    
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters per kind plus size and eviction totals"""
+        with self._lock:
+            return {
+                'hits': dict(self.hits),
+                'misses': dict(self.misses),
+                'evictions': self.evictions,
+                'size': len(self._entries),
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
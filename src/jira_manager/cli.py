@@ -0,0 +1,175 @@
+"""Command-line interface for Jira Manager"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from .config import Config
+from .exceptions import JiraManagerError
+
+
+def cmd_bulk_create(args: argparse.Namespace) -> int:
+    """Import issues from a CSV file, resumably, through the bulk-create endpoint"""
+    from .core import JiraClient
+    from .importer import import_csv
+    
+    client = JiraClient(Config(args.config), lazy=True)
+    summary = import_csv(
+        args.from_csv,
+        client,
+        journal_path=args.journal,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        validate=not args.no_validate,
+        config_file=args.config
+    )
+    
+    for error in summary['errors']:
+        print(f"❌ Row {error['row'] + 1}: {error['error']}", file=sys.stderr)
+    if summary['skipped']:
+        print(f"⏭️  Skipped {summary['skipped']} rows created by an earlier run")
+    print(f"✅ Created {summary['created']} issues, {summary['failed']} failed")
+    return 1 if summary['failed'] else 0
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    """Search with JQL, printing results or streaming them to a file"""
+    from .core import DEFAULT_FIELDS, JiraClient
+    
+    client = JiraClient(Config(args.config), lazy=True)
+    fields = None
+    if args.fields:
+        extra = [f.strip() for f in args.fields.split(',') if f.strip()]
+        fields = list(dict.fromkeys(list(DEFAULT_FIELDS) + extra))
+    
+    if args.export:
+        from .export import export_issues
+        
+        count = export_issues(
+            client,
+            args.jql,
+            args.export,
+            format=args.format,
+            fields=fields,
+            page_size=args.page_size,
+            resume=not args.restart
+        )
+        print(f"✅ Exported {count} issues to {args.export}")
+        return 0
+    
+    for record in client.search_issues(
+        args.jql,
+        max_results=args.limit,
+        fields=fields,
+        records=True,
+        concurrency=args.concurrency,
+        shard_by=args.shard_by
+    ):
+        print(f"{record.key}\t{record.status or ''}\t{record.summary or ''}")
+    return 0
+
+
+def cmd_serve_webhooks(args: argparse.Namespace) -> int:
+    """Receive Jira webhooks and keep a local issue mirror up to date"""
+    from .core import JiraClient
+    from .mirror import IssueMirror
+    from .webhooks import WebhookProcessor, serve_webhooks
+    
+    config = Config(args.config)
+    projects = [p.strip() for p in (args.projects or config.project_key or '').split(',') if p.strip()]
+    if not projects:
+        raise JiraManagerError("No projects to mirror; pass --projects or set JIRA_PROJECT_KEY")
+    mirror = IssueMirror(args.mirror, projects=projects)
+    client = JiraClient(config, lazy=True, mirror=mirror)
+    processor = WebhookProcessor(client, projects=projects)
+    
+    # Start from a current copy, then let events and reconcile passes keep it so
+    processor.reconcile()
+    server = serve_webhooks(
+        processor,
+        host=args.host,
+        port=args.port,
+        path=args.path,
+        secret=args.secret or config.get('webhook_secret'),
+        reconcile_interval=args.reconcile_interval or None
+    )
+    print(f"✅ Listening on http://{args.host}:{server.server_port}{args.path} (Ctrl+C to stop)")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        mirror.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all sub-commands"""
+    parser = argparse.ArgumentParser(
+        prog='jira-manager',
+        description='A powerful CLI tool for Jira automation'
+    )
+    parser.add_argument('--config', default=None, help='Path to config.ini')
+    parser.add_argument('--log-level', default=None, help='Logging level')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    bulk = subparsers.add_parser('bulk-create', help='Bulk create issues from CSV')
+    bulk.add_argument('--from-csv', required=True, help='CSV file with one issue per row')
+    bulk.add_argument('--workers', type=int, default=None,
+                      help='Worker processes sending batches (default: CPU count)')
+    bulk.add_argument('--journal', default=None,
+                      help='Progress journal used to resume (default: <csv>.journal)')
+    bulk.add_argument('--no-validate', action='store_true',
+                      help='Skip checking rows against the create screen before sending')
+    bulk.add_argument('--batch-size', type=int, default=50, help='Issues per bulk request (max 50)')
+    bulk.set_defaults(func=cmd_bulk_create)
+    
+    search = subparsers.add_parser('search', help='Search issues with JQL')
+    search.add_argument('jql', help='JQL query')
+    search.add_argument('--limit', type=int, default=50, help='Maximum issues to print')
+    search.add_argument('--fields', default=None,
+                        help='Comma-separated fields to fetch in addition to the defaults '
+                             '(summary, status, assignee, priority, updated)')
+    search.add_argument('--export', default=None, help='Stream all results to this file')
+    search.add_argument('--format', choices=['jsonl', 'csv', 'parquet'], default=None,
+                        help='Export format (default: from file extension)')
+    search.add_argument('--page-size', type=int, default=100, help='Issues per search request')
+    search.add_argument('--restart', action='store_true',
+                        help='Ignore any checkpoint and export from the beginning')
+    search.add_argument('--concurrency', type=int, default=1,
+                        help='Fetch result pages with this many parallel requests')
+    search.add_argument('--shard-by', choices=['offset', 'id', 'created'], default='offset',
+                        help='How parallel searches split the query')
+    search.set_defaults(func=cmd_search)
+    
+    hooks = subparsers.add_parser('serve-webhooks', help='Apply Jira webhooks to a local mirror')
+    hooks.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    hooks.add_argument('--port', type=int, default=8085, help='Port to listen on')
+    hooks.add_argument('--path', default='/webhooks', help='URL path Jira posts to')
+    hooks.add_argument('--mirror', default='jira_mirror.db', help='SQLite mirror file')
+    hooks.add_argument('--projects', default=None,
+                       help='Comma-separated projects to mirror (default: JIRA_PROJECT_KEY)')
+    hooks.add_argument('--secret', default=None,
+                       help='Webhook secret for X-Hub-Signature checks (default: JIRA_WEBHOOK_SECRET)')
+    hooks.add_argument('--reconcile-interval', type=float, default=300,
+                       help='Seconds between catch-up syncs (0 disables)')
+    hooks.set_defaults(func=cmd_serve_webhooks)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the ``jira-manager`` command"""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=(args.log_level or 'WARNING').upper())
+    try:
+        return args.func(args)
+    except JiraManagerError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,73 +2,160 @@
 
 import os
 import configparser
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from .exceptions import ConfigurationError
 
+# Environment variables read by Config, and the key each one sets
+ENV_VARS = {
+    'JIRA_URL': 'url',
+    'JIRA_EMAIL': 'email',
+    'JIRA_API_TOKEN': 'api_token',
+    'JIRA_PROJECT_KEY': 'project_key',
+    'PROJECT_ISSUE_TYPE': 'issue_type',
+    'JIRA_LOG_LEVEL': 'log_level',
+    'JIRA_POOL_SIZE': 'pool_size',
+    'JIRA_WEBHOOK_SECRET': 'webhook_secret',
+}
 
-class Config:
-    """Manages configuration from multiple sources"""
+# Seconds between checks of .env/config.ini for changes
+RELOAD_INTERVAL = 1.0
+
+# Every spelling of a key (``url``, ``JIRA_URL``, ``jira_url``) -> its name
+_KEY_ALIASES = {
+    **{name: name for name in ENV_VARS.values()},
+    **{env.lower(): name for env, name in ENV_VARS.items()},
+}
+
+
+def _normalize(key: str) -> str:
+    key = key.lower()
+    return _KEY_ALIASES.get(key, key)
+
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _FileSnapshot:
+    """Normalized values parsed from one (.env, config.ini) pair"""
     
-    def __init__(self, config_file: Optional[str] = None):
-        self.config_file = config_file or "config.ini"
-        self._config = {}
-        self._load_configuration()
+    def __init__(self, env_file: Path, config_file: Path):
+        self.env_file = env_file
+        self.config_file = config_file
+        self.stamps: Tuple[Any, Any] = (None, None)
+        self.values: Dict[str, str] = {}
+        self.dotenv: Dict[str, str] = {}
+        self.checked_at = float('-inf')
+        self.version = 0
     
-    def _load_configuration(self):
-        """Load configuration from .env, config.ini, and environment variables"""
-        # Load .env file if it exists
-        env_file = Path(".env")
-        if env_file.exists():
-            load_dotenv(env_file)
+    def refresh(self) -> None:
+        """Re-parse both files if either changed since the last parse"""
+        stamps = (_stamp(self.env_file), _stamp(self.config_file))
+        self.checked_at = time.monotonic()
+        if stamps == self.stamps:
+            return
         
-        # Load from config.ini
-        if Path(self.config_file).exists():
+        values = {}
+        if stamps[1] is not None:
             parser = configparser.ConfigParser()
             parser.read(self.config_file)
             if 'jira' in parser:
-                self._config.update(dict(parser['jira']))
-        
-        # Override with environment variables (highest priority)
-        env_vars = {
-            'JIRA_URL': 'url',
-            'JIRA_EMAIL': 'email',
-            'JIRA_API_TOKEN': 'api_token',
-            'JIRA_PROJECT_KEY': 'project_key',
-            'PROJECT_ISSUE_TYPE': 'issue_type',
-            'JIRA_LOG_LEVEL': 'log_level',
-        }
+                values = {_normalize(k): v for k, v in parser['jira'].items()}
+        dotenv = {}
+        if stamps[0] is not None:
+            dotenv = {k: v for k, v in dotenv_values(self.env_file).items() if v}
+        self.values, self.dotenv, self.stamps = values, dotenv, stamps
+        self.version += 1
+
+
+# Parsed files shared by every Config in the process, by absolute path
+_snapshots: Dict[Tuple[str, str], _FileSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def _snapshot(config_file: str, reload_interval: float) -> _FileSnapshot:
+    env_file = Path(".env").absolute()
+    path = Path(config_file).absolute()
+    key = (str(env_file), str(path))
+    with _snapshots_lock:
+        snapshot = _snapshots.get(key)
+        if snapshot is None:
+            snapshot = _snapshots[key] = _FileSnapshot(env_file, path)
+        if time.monotonic() - snapshot.checked_at >= reload_interval:
+            snapshot.refresh()
+    return snapshot
+
+
+class Config:
+    """Manages configuration from multiple sources
+    
+    ``.env`` and ``config.ini`` are parsed once per process and shared by
+    every ``Config`` using them; each file is checked for changes at most
+    every ``reload_interval`` seconds and re-read when it changed, so a
+    rotated API token is picked up without a restart. Environment variables
+    take precedence over ``.env``, which takes precedence over config.ini.
+    """
+    
+    def __init__(self, config_file: Optional[str] = None, reload_interval: float = RELOAD_INTERVAL):
+        self.config_file = config_file or "config.ini"
+        self.reload_interval = reload_interval
+        self._config: Dict[str, Any] = {}
+        self._snapshot_version = -1
+        self._check_at = 0.0
+        self._load_configuration()
+    
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "Config":
+        """Build a config from explicit values only, ignoring files and environment
         
-        for env_var, config_key in env_vars.items():
-            value = os.getenv(env_var)
+        Keys may use any spelling ``get`` accepts (``url``, ``JIRA_URL``, ...).
+        """
+        config = cls.__new__(cls)
+        config.config_file = "<dict>"
+        config.reload_interval = float('inf')
+        config._config = {_normalize(k): v for k, v in values.items() if v is not None}
+        config._snapshot_version = 0
+        config._check_at = float('inf')
+        return config
+    
+    def _load_configuration(self):
+        """Merge config.ini, .env and environment variables into one key map"""
+        snapshot = _snapshot(self.config_file, self.reload_interval)
+        config = dict(snapshot.values)
+        for env_var, config_key in ENV_VARS.items():
+            value = os.environ.get(env_var) or snapshot.dotenv.get(env_var)
             if value:
-                self._config[config_key] = value
+                config[config_key] = value
+        self._config = config
+        self._snapshot_version = snapshot.version
+        self._check_at = time.monotonic() + self.reload_interval
+    
+    @property
+    def version(self) -> int:
+        """Changes whenever a reload changed the underlying files"""
+        self._maybe_reload()
+        return self._snapshot_version
+    
+    def _maybe_reload(self) -> Dict[str, Any]:
+        """Current key map, reloaded first if the check interval has passed"""
+        if time.monotonic() >= self._check_at:
+            self._load_configuration()
+        return self._config
     
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value"""
-        # Try direct key first
-        if key in self._config:
-            return self._config[key]
-        
-        # Try uppercase version
-        upper_key = key.upper()
-        if upper_key in self._config:
-            return self._config[upper_key]
-        
-        # Try from config.ini naming
-        ini_mappings = {
-            'url': 'JIRA_URL',
-            'email': 'JIRA_EMAIL',
-            'api_token': 'JIRA_API_TOKEN',
-            'project_key': 'JIRA_PROJECT_KEY',
-            'issue_type': 'PROJECT_ISSUE_TYPE',
-        }
-        
-        if key in ini_mappings and ini_mappings[key] in self._config:
-            return self._config[ini_mappings[key]]
-        
-        return default
+        """Get configuration value by name, env var name, or either's lower case"""
+        values = self._maybe_reload()
+        if key in values:
+            return values[key]
+        return values.get(_normalize(key), default)
     
     def get_required(self, key: str) -> str:
         """Get required configuration value or raise error"""
@@ -107,4 +194,4 @@ class Config:
     
     def to_dict(self) -> Dict[str, Any]:
         """Return configuration as dictionary"""
-        return self._config.copy()
+        return self._maybe_reload().copy()
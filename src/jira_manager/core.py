@@ -1,37 +1,265 @@
 """Core Jira operations"""
 
+import functools
+import json
 import logging
-from typing import Optional, List, Dict, Any
-from jira import JIRA, JIRAError
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+from . import attachments
+from .cache import MISSING, ClientCache
 from .config import Config
+from .jql import Query, canonical
 from .exceptions import (
     AuthenticationError,
     ConnectionError,
     IssueNotFoundError,
     JiraManagerError,
 )
+from .metrics import Instrumentation, dispatch_response, reporting_to
+from .records import IssueRecord
+from .throttle import RequestScheduler
+from .session import configure_pool, registry as session_registry
+from .utils import MicroBatcher, chunked, run_concurrently
+
+if TYPE_CHECKING:
+    from jira import JIRA, JIRAError
+    from jira.resources import Comment, Issue
+    from .mirror import IssueMirror
 
 
 logger = logging.getLogger(__name__)
 
+# python-jira (and requests under it) takes a noticeable fraction of a second
+# to import, so its names below are bound lazily by _load_jira()
+_LAZY_JIRA_NAMES = {
+    'JIRA': 'jira',
+    'JIRAError': 'jira',
+    'Comment': 'jira.resources',
+    'Issue': 'jira.resources',
+}
+
+
+def _load_jira() -> None:
+    """Import python-jira on first use and bind its names in this module
+    
+    Names used inside this module (``Issue`` and the ``JIRAError`` in
+    ``except`` clauses) are not resolved through ``__getattr__``, so every
+    method that needs them calls this first; after the first call it costs
+    a few dict lookups.
+    """
+    module_globals = globals()
+    missing = [name for name in _LAZY_JIRA_NAMES if name not in module_globals]
+    if not missing:
+        return
+    import importlib
+    
+    for name in missing:
+        module_globals[name] = getattr(importlib.import_module(_LAZY_JIRA_NAMES[name]), name)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_JIRA_NAMES:
+        _load_jira()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Maximum number of issues Jira accepts per call to /rest/api/2/issue/bulk
+BULK_CREATE_BATCH_SIZE = 50
+
+# Fields requested by list/search unless the caller asks for more; the issue
+# key is always part of the response
+DEFAULT_FIELDS = ('summary', 'status', 'assignee', 'priority', 'updated')
+
+# ``expand`` values the search API understands
+ALLOWED_EXPANDS = frozenset({
+    'renderedFields',
+    'names',
+    'schema',
+    'transitions',
+    'operations',
+    'editmeta',
+    'changelog',
+    'versionedRepresentations',
+})
+
+# How search_issues(concurrency=...) splits a query: by page offsets, or into
+# windows of issue id or created date for orderings that shift while paging
+SHARD_MODES = ('offset', 'id', 'created')
+
+# Operations that POST new content: a 5xx may come after Jira applied them, so
+# they are retried only on 429 or when the request never reached Jira
+NON_IDEMPOTENT_OPERATIONS = frozenset({
+    'create_issue',
+    'create_issues',
+    'add_comment',
+    'add_attachment',
+    'transition_issue',
+})
+
+_ORDER_BY = re.compile(r'\s*\bORDER\s+BY\b.*$', re.IGNORECASE | re.DOTALL)
+
+
+def build_issue_fields(
+    config: Config,
+    summary: str,
+    description: str = "",
+    issue_type: Optional[str] = None,
+    project_key: Optional[str] = None,
+    priority: Optional[str] = None,
+    assignee: Optional[str] = None,
+    labels: Optional[List[str]] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """Build the ``fields`` payload for a new issue, defaulting from config"""
+    project_key = project_key or config.project_key
+    issue_type = issue_type or config.issue_type
+    
+    issue_dict = {
+        'project': {'key': project_key},
+        'summary': summary,
+        'description': description,
+        'issuetype': {'name': issue_type},
+    }
+    
+    if priority:
+        issue_dict['priority'] = {'name': priority}
+    
+    if assignee:
+        issue_dict['assignee'] = {'name': assignee}
+    
+    if labels:
+        issue_dict['labels'] = labels
+    
+    # Add any additional fields
+    issue_dict.update(kwargs)
+    return issue_dict
+
+
+def _field_matches(current: Any, wanted: Any) -> bool:
+    """Return whether a current field value already satisfies a requested one
+    
+    Requested objects only need to match on the keys they specify (so
+    ``{'name': 'High'}`` matches a full priority object), and lists of plain
+    values are compared without regard to order.
+    """
+    if isinstance(wanted, dict):
+        return isinstance(current, dict) and all(
+            _field_matches(current.get(k), v) for k, v in wanted.items()
+        )
+    if isinstance(wanted, list):
+        if not isinstance(current, list) or len(current) != len(wanted):
+            return False
+        if all(not isinstance(v, (dict, list)) for v in wanted + current):
+            return sorted(map(str, current)) == sorted(map(str, wanted))
+        return all(any(_field_matches(c, w) for c in current) for w in wanted)
+    if wanted in (None, '') and current in (None, ''):
+        return True
+    return current == wanted
+
 
 class JiraClient:
     """Enhanced Jira client with additional features"""
     
-    def __init__(self, config: Optional[Config] = None):
-        """Initialize Jira client"""
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        shared_session: bool = False,
+        pool_size: Optional[int] = None,
+        keep_alive: bool = True,
+        server_info: bool = True,
+        cloud: Optional[bool] = None,
+        lazy: bool = False,
+        cache: Optional[ClientCache] = None,
+        mirror: Optional["IssueMirror"] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        batch_window: float = 0.0
+    ):
+        """Initialize Jira client
+        
+        With ``shared_session`` the underlying connection is taken from a
+        process-wide registry keyed by (url, email) and the connection
+        options below, so clients created per job reuse one pooled HTTP
+        session. ``server_info=False`` skips the
+        server-info round trip made when a connection is first built; Jira
+        Cloud is then recognised by its ``*.atlassian.net`` host, or by
+        passing ``cloud=True``. ``lazy=True`` defers connecting until the
+        first API call. Pass a
+        ``ClientCache`` as ``cache`` to cache issue and metadata lookups, and
+        an ``IssueMirror`` as ``mirror`` to answer ``list_issues`` locally.
+        Every request goes through ``scheduler``; share one
+        ``RequestScheduler`` between clients to share its rate limit.
+        ``instrumentation`` (e.g. a ``MetricsRecorder``) is told about every
+        operation and HTTP response of this client, also on a shared session. A ``batch_window`` in seconds (e.g.
+        ``0.005``) lets concurrent ``get_issue`` calls be merged into one
+        search.
+        """
         self.config = config or Config()
-        self._jira = None
-        self._connect()
+        self._shared_session = shared_session
+        self._pool_size = pool_size or int(self.config.get('pool_size', 0)) or None
+        self._keep_alive = keep_alive
+        self._server_info = server_info
+        self._cloud = cloud
+        self.cache = cache
+        self.mirror = mirror
+        self.scheduler = scheduler or RequestScheduler()
+        self.instrumentation = instrumentation
+        self._transitions: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        self._transition_lock = threading.Lock()
+        self._issue_batcher = MicroBatcher(
+            self._fetch_issues, window=batch_window, default=MISSING
+        ) if batch_window > 0 else None
+        self._inflight: Dict[Any, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._connection = None
+        self._config_version = self.config.version
+        self._credentials: Optional[Tuple[str, str, str]] = None
+        self._connect_lock = threading.Lock()
+        if not lazy:
+            self._connect()
+    
+    @property
+    def _jira(self) -> Any:
+        """Underlying JIRA connection, established on first use
+        
+        Rebuilt when a config reload changed the URL or credentials.
+        """
+        if self._connection is None or self._config_version != self.config.version:
+            with self._connect_lock:
+                if self._connection is None:
+                    self._connect()
+                elif self._config_version != self.config.version:
+                    self._config_version = self.config.version
+                    if self._credentials != self._current_credentials():
+                        logger.info("Jira credentials changed; reconnecting")
+                        self._connect()
+        return self._connection
+    
+    def _current_credentials(self) -> Tuple[str, str, str]:
+        return (self.config.jira_url, self.config.jira_email, self.config.jira_api_token)
     
     def _connect(self):
         """Establish connection to Jira"""
+        _load_jira()
+        self._config_version = self.config.version
+        self._credentials = self._current_credentials()
         try:
-            self._jira = JIRA(
-                server=self.config.jira_url,
-                basic_auth=(self.config.jira_email, self.config.jira_api_token)
-            )
-            logger.info(f"Connected to Jira: {self.config.jira_url}")
+            if self._shared_session:
+                self._connection = session_registry.get(
+                    self.config.jira_url,
+                    self.config.jira_email,
+                    self.config.jira_api_token,
+                    lambda: self._request('connect', self._create_connection),
+                    options=(self._pool_size, self._keep_alive, self._server_info, self._cloud)
+                )
+            else:
+                self._connection = self._request('connect', self._create_connection)
         except JIRAError as e:
             if e.status_code == 401:
                 raise AuthenticationError(
@@ -41,6 +269,109 @@ class JiraClient:
                 f"Failed to connect to Jira: {e}"
             ) from e
     
+    def close(self) -> None:
+        """Close this client's HTTP connections (a shared session stays open)"""
+        with self._connect_lock:
+            connection, self._connection = self._connection, None
+        if connection is not None and not self._shared_session:
+            connection.close()
+    
+    def _create_connection(self) -> Any:
+        """Build a new JIRA connection with a tuned HTTP connection pool"""
+        jira = JIRA(
+            server=self.config.jira_url,
+            basic_auth=(self.config.jira_email, self.config.jira_api_token),
+            get_server_info=self._server_info,
+            max_retries=0  # retries are handled by self.scheduler
+        )
+        if self._cloud is not None:
+            jira.deploymentType = 'Cloud' if self._cloud else 'Server'
+        elif jira.deploymentType is None:
+            # No server info was read; python-jira and the paging here both
+            # need to know about Cloud, whose legacy search API is gone
+            hostname = urlparse(self.config.jira_url).hostname or ''
+            if hostname.endswith('.atlassian.net'):
+                jira.deploymentType = 'Cloud'
+        configure_pool(jira._session, self._pool_size, self._keep_alive)
+        # Reports to whichever client is making the request (see _request)
+        jira._session.hooks['response'].append(dispatch_response)
+        logger.info(f"Connected to Jira: {self.config.jira_url}")
+        return jira
+    
+    def _request(self, operation: str, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run one Jira API call through the request scheduler"""
+        idempotent = operation not in NON_IDEMPOTENT_OPERATIONS
+        if self.instrumentation is None:
+            return self.scheduler.call(func, *args, idempotent=idempotent, **kwargs)
+        
+        attempts = 0
+        
+        def attempt() -> Any:
+            nonlocal attempts
+            attempts += 1
+            with reporting_to(self.instrumentation):
+                return func(*args, **kwargs)
+        
+        detail = args[0] if operation == 'search_issues' and args else None
+        started = time.perf_counter()
+        error = None
+        try:
+            return self.scheduler.call(attempt, idempotent=idempotent)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.instrumentation.record_operation(
+                operation,
+                time.perf_counter() - started,
+                retries=max(0, attempts - 1),
+                error=error,
+                detail=detail
+            )
+    
+    def _cached(self, kind: str, key: Any, loader: Any) -> Any:
+        """Return a cached value, calling ``loader`` and caching it on a miss"""
+        if self.cache is None:
+            return loader()
+        value = self.cache.get(kind, key)
+        if value is MISSING:
+            value = loader()
+            self.cache.set(kind, key, value)
+        return value
+    
+    def _invalidate(self, issue_key: str, *kinds: str) -> None:
+        """Drop cached entries for an issue, and all cached searches, after a local write"""
+        if self.cache is not None:
+            for kind in kinds or ('issue',):
+                self.cache.invalidate(kind, issue_key)
+            self.cache.invalidate('search')
+    
+    def _single_flight(self, key: Any, func: Any, *args: Any) -> Any:
+        """Call ``func`` once for all threads asking for ``key`` at the same time
+        
+        The first caller runs it; the others wait and receive the same result
+        or exception.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            value = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
     @classmethod
     def from_env(cls) -> "JiraClient":
         """Create client from environment variables"""
@@ -58,44 +389,217 @@ class JiraClient:
         **kwargs
     ) -> Any:
         """Create a new Jira issue"""
-        project_key = project_key or self.config.project_key
-        issue_type = issue_type or self.config.issue_type
+        _load_jira()
+        issue_dict = self._build_issue_fields(
+            summary,
+            description=description,
+            issue_type=issue_type,
+            project_key=project_key,
+            priority=priority,
+            assignee=assignee,
+            labels=labels,
+            **kwargs
+        )
+        
+        try:
+            new_issue = self._request('create_issue', self._jira.create_issue, fields=issue_dict)
+            logger.info(f"Created issue: {new_issue.key}")
+            return new_issue
+        except JIRAError as e:
+            raise JiraManagerError(f"Failed to create issue: {e}") from e
+    
+    def _build_issue_fields(self, summary: str, **kwargs) -> Dict[str, Any]:
+        """Build the ``fields`` payload for a new issue"""
+        return build_issue_fields(self.config, summary, **kwargs)
+    
+    def bulk_create_issues(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        concurrency: int = 4,
+        batch_size: int = BULK_CREATE_BATCH_SIZE
+    ) -> List[Dict[str, Any]]:
+        """Create many issues through the bulk-create endpoint
         
-        issue_dict = {
-            'project': {'key': project_key},
-            'summary': summary,
-            'description': description,
-            'issuetype': {'name': issue_type},
-        }
+        Each row takes the same keys as ``create_issue``. Rows are sent in
+        batches of up to 50 (the Jira limit per call) on a pool of
+        ``concurrency`` workers. Returns one result per row, in input order,
+        with ``row``, ``status`` (``Success``/``Error``), ``key`` and ``error``.
+        """
+        if not 1 <= batch_size <= BULK_CREATE_BATCH_SIZE:
+            raise ValueError(
+                f"batch_size must be between 1 and {BULK_CREATE_BATCH_SIZE}"
+            )
         
-        if priority:
-            issue_dict['priority'] = {'name': priority}
+        numbered = ((index, dict(row)) for index, row in enumerate(rows))
+        batches = list(chunked(numbered, batch_size))
         
-        if assignee:
-            issue_dict['assignee'] = {'name': assignee}
+        started = time.perf_counter()
+        results = []
+        for batch_results in run_concurrently(self._create_batch, batches, concurrency):
+            results.extend(batch_results)
+        elapsed = time.perf_counter() - started
         
-        if labels:
-            issue_dict['labels'] = labels
+        created = sum(1 for r in results if r['status'] == 'Success')
+        rate = created / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Bulk created {created}/{len(results)} issues in {elapsed:.2f}s "
+            f"({rate:.1f} issues/s)"
+        )
+        return results
+    
+    def _create_batch(
+        self,
+        batch: List[Tuple[int, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Send one bulk-create call for ``(row number, row)`` pairs"""
+        _load_jira()
+        results = []
+        field_list = []
+        for index, row in batch:
+            try:
+                field_list.append((index, self._build_issue_fields(**row)))
+            except TypeError as e:
+                results.append(
+                    {'row': index, 'status': 'Error', 'key': None, 'error': str(e)}
+                )
+        
+        if field_list:
+            try:
+                created = self._request(
+                    'create_issues',
+                    self._jira.create_issues,
+                    [fields for _, fields in field_list],
+                    prefetch=False
+                )
+            except JIRAError as e:
+                created = [{'status': 'Error', 'issue': None, 'error': str(e)}] * len(field_list)
+            
+            for (index, _), outcome in zip(field_list, created):
+                issue = outcome.get('issue')
+                results.append({
+                    'row': index,
+                    'status': outcome['status'],
+                    'key': issue.key if issue is not None else None,
+                    'error': outcome.get('error'),
+                })
         
-        # Add any additional fields
-        issue_dict.update(kwargs)
+        return sorted(results, key=lambda r: r['row'])
+    
+    def get_create_meta(self, project_key: str, issue_type: str) -> Dict[str, Dict[str, Any]]:
+        """Describe the fields that can be set when creating an issue
+        
+        Returns ``{field id: {'name', 'required', 'has_default', 'allowed'}}``
+        for the project's create screen, where ``allowed`` lists the accepted
+        names/values/ids or is None when any value goes. Cached as
+        ``createmeta`` when a cache is attached.
+        """
+        _load_jira()
+        def load() -> Dict[str, Dict[str, Any]]:
+            types = self._createmeta_values(f"issue/createmeta/{project_key}/issuetypes")
+            matches = [t for t in types if t.get('name', '').lower() == issue_type.lower()]
+            if not matches:
+                raise JiraManagerError(
+                    f"Issue type '{issue_type}' is not available in project {project_key}"
+                )
+            fields = self._createmeta_values(
+                f"issue/createmeta/{project_key}/issuetypes/{matches[0]['id']}"
+            )
+            meta = {}
+            for field in fields:
+                allowed = field.get('allowedValues')
+                meta[field.get('fieldId') or field.get('key')] = {
+                    'name': field.get('name'),
+                    'required': bool(field.get('required')),
+                    'has_default': bool(field.get('hasDefaultValue')),
+                    'allowed': None if not allowed else sorted({
+                        str(v[attr]) for v in allowed
+                        for attr in ('name', 'value', 'id') if attr in v
+                    }),
+                }
+            return meta
         
         try:
-            new_issue = self._jira.create_issue(fields=issue_dict)
-            logger.info(f"Created issue: {new_issue.key}")
-            return new_issue
+            return self._cached('createmeta', (project_key.upper(), issue_type.lower()), load)
         except JIRAError as e:
-            raise JiraManagerError(f"Failed to create issue: {e}") from e
+            raise JiraManagerError(f"Failed to get create metadata: {e}") from e
+    
+    def _createmeta_values(self, path: str) -> List[Dict[str, Any]]:
+        """Read every page of a createmeta listing (Server ``values`` or Cloud lists)"""
+        values: List[Dict[str, Any]] = []
+        while True:
+            data = self._request(
+                'get_create_meta', self._jira._get_json, path,
+                params={'startAt': len(values), 'maxResults': 200}
+            )
+            page = data.get('values') or data.get('issueTypes') or data.get('fields') or []
+            values.extend(page)
+            if not page or data.get('isLast') or len(values) >= data.get('total', len(values)):
+                return values
     
     def get_issue(self, issue_key: str) -> Any:
-        """Get an issue by key"""
+        """Get an issue by key
+        
+        Concurrent calls for the same key share one request. With
+        ``batch_window`` set, calls for different keys made within the window
+        are answered by a single ``key IN (...)`` search.
+        """
+        _load_jira()
         try:
-            return self._jira.issue(issue_key)
+            return self._cached('issue', issue_key, lambda: self._single_flight(
+                ('issue', issue_key), self._load_issue, issue_key
+            ))
         except JIRAError as e:
             if e.status_code == 404:
                 raise IssueNotFoundError(f"Issue {issue_key} not found") from e
             raise JiraManagerError(f"Failed to get issue: {e}") from e
     
+    def _load_issue(self, issue_key: str) -> Any:
+        """Fetch an issue through the micro-batcher, or with its own GET"""
+        if self._issue_batcher is not None:
+            issue = self._issue_batcher.get(issue_key)
+            if issue is not MISSING:
+                return issue
+        # Not batched, or not returned by the search (e.g. the issue moved)
+        return self._request('get_issue', self._jira.issue, issue_key)
+    
+    def _fetch_issues(self, issue_keys: List[str]) -> Dict[str, Any]:
+        """Fetch full issues for the micro-batcher with one search"""
+        found = self._fetch_raw_issues(issue_keys, '*all', batch_size=len(issue_keys))
+        return {key: self._issue_from_raw(raw) for key, raw in found.items()}
+    
+    def get_changelog(self, issue_key: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """Get every change history entry of an issue, oldest first
+        
+        Reads the paged ``issue/{key}/changelog`` endpoint; Jira versions
+        without it get the issue with ``expand=changelog`` instead.
+        """
+        _load_jira()
+        histories: List[Dict[str, Any]] = []
+        try:
+            while True:
+                data = self._request(
+                    'get_changelog', self._jira._get_json, f"issue/{issue_key}/changelog",
+                    params={'startAt': len(histories), 'maxResults': page_size}
+                )
+                page = data.get('values', [])
+                histories.extend(page)
+                if not page or data.get('isLast') or len(histories) >= data.get('total', 0):
+                    break
+        except JIRAError as e:
+            if e.status_code != 404:
+                raise JiraManagerError(f"Failed to get changelog: {e}") from e
+            try:
+                data = self._request(
+                    'get_changelog', self._jira._get_json, f"issue/{issue_key}",
+                    params={'fields': 'updated', 'expand': 'changelog'}
+                )
+            except JIRAError as e:
+                if e.status_code == 404:
+                    raise IssueNotFoundError(f"Issue {issue_key} not found") from e
+                raise JiraManagerError(f"Failed to get changelog: {e}") from e
+            histories = (data.get('changelog') or {}).get('histories', [])
+        return sorted(histories, key=lambda h: h.get('created', ''))
+    
     def update_issue(
         self,
         issue_key: str,
@@ -104,10 +608,16 @@ class JiraClient:
         assignee: Optional[str] = None,
         priority: Optional[str] = None,
         labels: Optional[List[str]] = None,
+        fetch: bool = True,
         **kwargs
     ) -> Any:
-        """Update an existing issue"""
-        issue = self.get_issue(issue_key)
+        """Update an existing issue
+        
+        Returns the issue, which is fetched (or taken from the cache) first.
+        With ``fetch=False`` the fields are sent in a single PUT and nothing
+        is returned.
+        """
+        _load_jira()
         update_fields = {}
         
         if summary:
@@ -123,90 +633,831 @@ class JiraClient:
         
         update_fields.update(kwargs)
         
+        if not fetch:
+            try:
+                self._request('update_issue', self._put_fields, issue_key, update_fields)
+            except JIRAError as e:
+                if e.status_code == 404:
+                    raise IssueNotFoundError(f"Issue {issue_key} not found") from e
+                raise JiraManagerError(f"Failed to update issue: {e}") from e
+            self._invalidate(issue_key)
+            logger.info(f"Updated issue: {issue_key}")
+            return None
+        
+        issue = self.get_issue(issue_key)
         try:
-            issue.update(fields=update_fields)
+            self._request('update_issue', issue.update, fields=update_fields)
+            self._invalidate(issue_key)
             logger.info(f"Updated issue: {issue_key}")
             return issue
         except JIRAError as e:
             raise JiraManagerError(f"Failed to update issue: {e}") from e
     
-    def add_comment(self, issue_key: str, comment: str) -> Any:
-        """Add a comment to an issue"""
+    def bulk_update(
+        self,
+        changes: Dict[str, Dict[str, Any]],
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Apply per-issue field updates, sending only values that differ
+        
+        ``changes`` maps issue keys to REST ``fields`` payloads, e.g.
+        ``{'PROJ-1': {'priority': {'name': 'High'}, 'labels': ['ops']}}``.
+        Current values are read with one projected search per 100 keys, so
+        issues that already match are skipped without a write. Returns one
+        result per key with ``status`` ``Updated``, ``Unchanged`` or ``Error``
+        and the names of the ``fields`` sent.
+        """
+        _load_jira()
+        field_names = sorted({name for fields in changes.values() for name in fields})
+        found = self._fetch_raw_issues(list(changes), field_names)
+        
+        def update(issue_key: str) -> Dict[str, Any]:
+            raw = found.get(issue_key)
+            if raw is None:
+                return {'key': issue_key, 'status': 'Error', 'fields': [],
+                        'error': 'Issue not found'}
+            current = raw.get('fields', {})
+            diff = {
+                name: value for name, value in changes[issue_key].items()
+                if not _field_matches(current.get(name), value)
+            }
+            if not diff:
+                return {'key': issue_key, 'status': 'Unchanged', 'fields': [], 'error': None}
+            try:
+                self._request('update_issue', self._put_fields, issue_key, diff)
+                self._invalidate(issue_key)
+                return {'key': issue_key, 'status': 'Updated', 'fields': sorted(diff),
+                        'error': None}
+            except JIRAError as e:
+                return {'key': issue_key, 'status': 'Error', 'fields': sorted(diff),
+                        'error': str(e)}
+        
+        results = run_concurrently(update, list(changes), concurrency)
+        updated = sum(1 for r in results if r['status'] == 'Updated')
+        unchanged = sum(1 for r in results if r['status'] == 'Unchanged')
+        logger.info(
+            f"Bulk update: {updated} updated, {unchanged} unchanged, "
+            f"{len(results) - updated - unchanged} failed"
+        )
+        return results
+    
+    def _put_fields(self, issue_key: str, fields: Dict[str, Any]) -> None:
+        """Send a single PUT with the given fields
+        
+        ``Issue.update`` in python-jira re-fetches the issue after writing;
+        bulk writes do not need that extra GET.
+        """
+        url = self._jira._get_url(f"issue/{issue_key}")
+        self._jira._session.put(url, data=json.dumps({'fields': fields}))
+    
+    def bulk_comment(
+        self,
+        issue_keys: Iterable[str],
+        comment: str,
+        concurrency: int = 4,
+        skip_existing: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Add the same comment to many issues in parallel
+        
+        With ``skip_existing`` one projected search per 100 keys finds issues
+        that already carry an identical comment, and those are skipped, so
+        re-running a job does not post duplicates. Returns one result per key
+        with ``status`` ``Added``, ``Skipped`` or ``Error``.
+        """
+        _load_jira()
+        issue_keys = list(dict.fromkeys(issue_keys))
+        existing = set()
+        if skip_existing:
+            found = self._fetch_raw_issues(issue_keys, ['comment'])
+            for issue_key, raw in found.items():
+                comments = ((raw.get('fields') or {}).get('comment') or {}).get('comments', [])
+                if any(c.get('body') == comment for c in comments):
+                    existing.add(issue_key)
+        
+        def add(issue_key: str) -> Dict[str, Any]:
+            if issue_key in existing:
+                return {'key': issue_key, 'status': 'Skipped', 'error': None}
+            try:
+                self._request('add_comment', self._jira.add_comment, issue_key, comment)
+                self._invalidate(issue_key)
+                return {'key': issue_key, 'status': 'Added', 'error': None}
+            except JIRAError as e:
+                return {'key': issue_key, 'status': 'Error', 'error': str(e)}
+        
+        results = run_concurrently(add, issue_keys, concurrency)
+        added = sum(1 for r in results if r['status'] == 'Added')
+        logger.info(f"Bulk comment: added to {added}, skipped {len(existing)}")
+        return results
+    
+    def add_comment(
+        self,
+        issue_key: str,
+        comment: str,
+        properties: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """Add a comment to an issue
+        
+        ``properties`` are stored on the new comment as entity properties
+        (``{key: JSON value}``) in the same request.
+        """
+        _load_jira()
         try:
-            result = self._jira.add_comment(issue_key, comment)
+            if properties:
+                result = self._request(
+                    'add_comment', self._post_comment, issue_key, comment, properties
+                )
+            else:
+                result = self._request('add_comment', self._jira.add_comment, issue_key, comment)
+            self._invalidate(issue_key)
             logger.info(f"Added comment to {issue_key}")
             return result
         except JIRAError as e:
             raise JiraManagerError(f"Failed to add comment: {e}") from e
     
+    def _post_comment(self, issue_key: str, comment: str, properties: Dict[str, Any]) -> Any:
+        """POST a comment with entity properties, which python-jira cannot send"""
+        url = self._jira._get_url(f"issue/{issue_key}/comment")
+        response = self._jira._session.post(url, data=json.dumps({
+            'body': comment,
+            'properties': [{'key': key, 'value': value} for key, value in properties.items()],
+        }))
+        return Comment(self._jira._options, self._jira._session, raw=response.json())
+    
     def transition_issue(self, issue_key: str, transition_name: str) -> None:
         """Transition an issue to a new status"""
+        _load_jira()
         try:
-            self._jira.transition_issue(issue_key, transition_name)
+            self._request(
+                'transition_issue', self._jira.transition_issue, issue_key, transition_name
+            )
+            self._invalidate(issue_key)
             logger.info(f"Transitioned {issue_key} to {transition_name}")
         except JIRAError as e:
             raise JiraManagerError(f"Failed to transition issue: {e}") from e
     
+    def bulk_transition(
+        self,
+        issue_keys: Iterable[str],
+        transition_name: str,
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Apply the same named transition to many issues in parallel
+        
+        Current project, issue type and status are read with one projected
+        search per 100 keys. The transition id is then resolved once per
+        (project, issue type, status) and reused, so each issue costs a
+        single POST. Returns ``key``, ``status`` and ``error`` per issue.
+        """
+        _load_jira()
+        issue_keys = list(dict.fromkeys(issue_keys))
+        found = self._fetch_raw_issues(issue_keys, ['project', 'issuetype', 'status'])
+        
+        # Resolve each workflow state once, up front, before fanning out
+        resolved: Dict[str, Union[str, JiraManagerError]] = {}
+        for issue_key in issue_keys:
+            if issue_key not in found:
+                continue
+            try:
+                resolved[issue_key] = self._resolve_transition_id(
+                    issue_key, self._workflow_state(found[issue_key]), transition_name
+                )
+            except JIRAError as e:
+                resolved[issue_key] = JiraManagerError(f"Failed to get transitions: {e}")
+            except JiraManagerError as e:
+                resolved[issue_key] = e
+        
+        def transition(issue_key: str) -> Dict[str, Any]:
+            transition_id = resolved.get(issue_key)
+            if transition_id is None:
+                return {'key': issue_key, 'status': 'Error', 'error': 'Issue not found'}
+            if isinstance(transition_id, JiraManagerError):
+                return {'key': issue_key, 'status': 'Error', 'error': str(transition_id)}
+            try:
+                self._request(
+                    'transition_issue', self._jira.transition_issue, issue_key, transition_id
+                )
+                self._invalidate(issue_key)
+                return {'key': issue_key, 'status': 'Success', 'error': None}
+            except JIRAError as e:
+                return {'key': issue_key, 'status': 'Error', 'error': str(e)}
+        
+        results = run_concurrently(transition, issue_keys, concurrency)
+        done = sum(1 for r in results if r['status'] == 'Success')
+        logger.info(f"Transitioned {done}/{len(results)} issues to {transition_name}")
+        return results
+    
+    def _resolve_transition_id(
+        self,
+        issue_key: str,
+        state: Tuple[str, str, str],
+        transition_name: str
+    ) -> str:
+        """Map a transition name to its id for a (project, type, status) state"""
+        ids = {t['name'].lower(): t['id'] for t in self._state_transitions(issue_key, state)}
+        transition_id = ids.get(transition_name.lower())
+        if transition_id is None:
+            raise JiraManagerError(
+                f"Transition '{transition_name}' is not available for {issue_key} "
+                f"in status '{state[2]}'"
+            )
+        return transition_id
+    
+    def _state_transitions(self, issue_key: str, state: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+        """Transitions available in a workflow state, fetched through ``issue_key``
+        
+        Transitions only depend on the workflow step an issue is in, so they
+        are fetched once per (project, type, status): kept in the attached
+        cache when there is one, otherwise for the life of the client.
+        """
+        if self.cache is not None:
+            return self._cached('transitions', state, lambda: self._load_transitions(issue_key))
+        with self._transition_lock:
+            transitions = self._transitions.get(state)
+        if transitions is None:
+            transitions = self._load_transitions(issue_key)
+            with self._transition_lock:
+                self._transitions[state] = transitions
+        return transitions
+    
+    def _load_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
+        return [
+            {'id': t['id'], 'name': t['name']}
+            for t in self._request('get_transitions', self._jira.transitions, issue_key)
+        ]
+    
+    @staticmethod
+    def _workflow_state(raw: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Return (project, issue type, status) from a raw issue"""
+        fields = raw.get('fields', {})
+        return (
+            (fields.get('project') or {}).get('key', ''),
+            (fields.get('issuetype') or {}).get('name', ''),
+            (fields.get('status') or {}).get('name', ''),
+        )
+    
     def delete_issue(self, issue_key: str) -> None:
         """Delete an issue"""
+        _load_jira()
         try:
             issue = self.get_issue(issue_key)
-            issue.delete()
+            self._request('delete_issue', issue.delete)
+            self._invalidate(issue_key)
             logger.info(f"Deleted issue: {issue_key}")
         except JIRAError as e:
             raise JiraManagerError(f"Failed to delete issue: {e}") from e
     
+    def upload_attachments(
+        self,
+        issue_key: str,
+        paths: Iterable[str],
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Attach files to an issue, streaming each from disk
+        
+        See ``attachments.upload_attachments``.
+        """
+        return attachments.upload_attachments(self, issue_key, paths, concurrency)
+    
+    def download_attachments(
+        self,
+        dest_dir: str,
+        issue_keys: Optional[Iterable[str]] = None,
+        jql: Optional[str] = None,
+        concurrency: int = 8,
+        chunk_size: int = attachments.ATTACHMENT_CHUNK_SIZE
+    ) -> List[Dict[str, Any]]:
+        """Save the attachments of some issues under ``dest_dir/<issue key>/``
+        
+        See ``attachments.download_attachments``.
+        """
+        return attachments.download_attachments(
+            self, dest_dir, issue_keys, jql, concurrency, chunk_size
+        )
+    
     def search_issues(
         self,
         jql: str,
-        max_results: int = 50,
-        fields: Optional[List[str]] = None
+        max_results: Optional[int] = 50,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False,
+        records: bool = False,
+        concurrency: int = 1,
+        shard_by: str = 'offset'
+    ) -> List[Any]:
+        """Search issues using JQL
+        
+        Only ``DEFAULT_FIELDS`` are requested unless ``fields`` is given or
+        ``all_fields`` is set. With ``records=True`` compact ``IssueRecord``
+        objects are returned instead of python-jira resources.
+        ``max_results=None`` pages until every match is returned.
+        
+        With ``concurrency`` above 1 the result set is fetched in parallel;
+        see ``search_parallel`` for the ``shard_by`` modes.
+        
+        Identical searches made at the same time share one request, and with
+        a ``cache`` attached results are reused until its ``search`` TTL runs
+        out or the client writes to an issue. Queries are compared in their
+        ``jql.canonical`` form, so spacing and keyword case do not matter.
+        """
+        projection = self._resolve_fields(fields, all_fields)
+        key = (
+            canonical(jql),
+            max_results,
+            tuple(projection) if isinstance(projection, list) else projection,
+            self._resolve_expand(expand),
+            records,
+            concurrency,
+            shard_by,
+        )
+        return self._cached('search', key, lambda: self._single_flight(
+            ('search',) + key,
+            self._search_issues,
+            jql, max_results, fields, expand, all_fields, records, concurrency, shard_by
+        ))
+    
+    def _search_issues(
+        self,
+        jql: str,
+        max_results: Optional[int],
+        fields: Optional[List[str]],
+        expand: Optional[List[str]],
+        all_fields: bool,
+        records: bool,
+        concurrency: int,
+        shard_by: str
     ) -> List[Any]:
-        """Search issues using JQL"""
+        """Run a search without caching or request sharing"""
+        _load_jira()
+        if concurrency > 1:
+            raws = self.search_parallel(
+                jql,
+                max_results=max_results,
+                fields=fields,
+                expand=expand,
+                all_fields=all_fields,
+                concurrency=concurrency,
+                shard_by=shard_by
+            )
+            wrap = IssueRecord.from_json if records else self._issue_from_raw
+            return [wrap(raw) for raw in raws]
+        
+        if records:
+            issues = list(islice(self.iter_issues(
+                jql,
+                page_size=min(max_results or 100, 100),
+                fields=fields,
+                prefetch=False,
+                expand=expand,
+                all_fields=all_fields,
+                records=True
+            ), max_results))
+            logger.info(f"Found {len(issues)} issues")
+            return issues
+        
         try:
-            issues = self._jira.search_issues(
+            issues = self._request(
+                'search_issues',
+                self._jira.search_issues,
                 jql,
                 maxResults=max_results,
-                fields=fields or '*all'
+                fields=self._resolve_fields(fields, all_fields),
+                expand=self._resolve_expand(expand)
             )
             logger.info(f"Found {len(issues)} issues")
             return issues
         except JIRAError as e:
             raise JiraManagerError(f"Failed to search issues: {e}") from e
     
+    def iter_issues(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+        prefetch: bool = True,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False,
+        records: bool = False
+    ) -> Iterator[Any]:
+        """Lazily yield every issue matching JQL, one page in memory at a time
+        
+        While the caller consumes the current page, the next one is fetched
+        on a background thread so the walk does not stall between pages.
+        ``records=True`` yields ``IssueRecord`` objects built directly from
+        the response JSON.
+        """
+        wrap = IssueRecord.from_json if records else self._issue_from_raw
+        for page, _ in self.iter_pages(
+            jql,
+            page_size=page_size,
+            fields=fields,
+            prefetch=prefetch,
+            expand=expand,
+            all_fields=all_fields
+        ):
+            for raw in page:
+                yield wrap(raw)
+    
+    def iter_pages(
+        self,
+        jql: str,
+        page_size: int = 100,
+        fields: Optional[List[str]] = None,
+        prefetch: bool = True,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False,
+        cursor: Union[int, str] = 0
+    ) -> Iterator[Tuple[List[Dict[str, Any]], Union[int, str, None]]]:
+        """Yield ``(raw issues, next cursor)`` for each page of a JQL search
+        
+        The next cursor is None on the last page. Passing a cursor from an
+        earlier walk as ``cursor`` resumes the search from that page.
+        """
+        fetch = functools.partial(
+            self._search_page,
+            jql,
+            page_size=page_size,
+            fields=self._resolve_fields(fields, all_fields),
+            expand=self._resolve_expand(expand)
+        )
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page, next_cursor = fetch(cursor)
+            while True:
+                pending = None
+                if next_cursor is not None and executor is not None:
+                    pending = executor.submit(fetch, next_cursor)
+                yield page, next_cursor
+                if next_cursor is None:
+                    return
+                if pending is not None:
+                    page, next_cursor = pending.result()
+                else:
+                    page, next_cursor = fetch(next_cursor)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    def _issue_from_raw(self, raw: Dict[str, Any]) -> Any:
+        """Wrap raw issue JSON in a python-jira Issue resource"""
+        _load_jira()
+        return Issue(self._jira._options, self._jira._session, raw=raw)
+    
+    def _search_page(
+        self,
+        jql: str,
+        cursor: Union[int, str],
+        page_size: int,
+        fields: Union[List[str], str],
+        expand: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Union[int, str, None]]:
+        """Fetch one page of raw issues and the cursor of the page after it
+        
+        Jira Cloud pages with ``nextPageToken``; Server/Data Center pages
+        with ``startAt`` offsets.
+        """
+        _load_jira()
+        try:
+            if getattr(self._jira, 'deploymentType', None) == 'Cloud':
+                data = self._request(
+                    'search_issues',
+                    self._jira.enhanced_search_issues,
+                    jql,
+                    nextPageToken=cursor or None,
+                    maxResults=page_size,
+                    fields=fields,
+                    expand=expand,
+                    json_result=True
+                )
+                issues = data.get('issues', [])
+                next_cursor = None if data.get('isLast', True) else data.get('nextPageToken')
+                return issues, next_cursor
+            
+            data = self._request(
+                'search_issues',
+                self._jira.search_issues,
+                jql,
+                startAt=cursor,
+                maxResults=page_size,
+                fields=fields,
+                expand=expand,
+                json_result=True
+            )
+        except JIRAError as e:
+            raise JiraManagerError(f"Failed to search issues: {e}") from e
+        
+        issues = data.get('issues', [])
+        next_start = cursor + len(issues)
+        if not issues or next_start >= data.get('total', 0):
+            return issues, None
+        return issues, next_start
+    
+    def _fetch_raw_issues(
+        self,
+        issue_keys: List[str],
+        fields: Union[List[str], str],
+        batch_size: int = 100,
+        expand: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch raw issues by key with ``key IN (...)`` searches
+        
+        Jira rejects the whole query with a 400 when any key in it does not
+        exist or is not visible, so a rejected batch is split in half and
+        retried until the offending keys are isolated and left out.
+        """
+        found = {}
+        batches = list(chunked(issue_keys, batch_size))
+        while batches:
+            batch = batches.pop()
+            jql = str(Query().where('key', batch, 'IN'))
+            try:
+                cursor: Union[int, str, None] = 0
+                while cursor is not None:
+                    page, cursor = self._search_page(jql, cursor, batch_size, fields, expand)
+                    for raw in page:
+                        found[raw['key']] = raw
+            except JiraManagerError as e:
+                if getattr(e.__cause__, 'status_code', None) != 400:
+                    raise
+                if len(batch) == 1:
+                    logger.debug(f"Skipping issue {batch[0]}: {e}")
+                    continue
+                middle = len(batch) // 2
+                batches += [batch[:middle], batch[middle:]]
+        return found
+    
+    def search_parallel(
+        self,
+        jql: str,
+        max_results: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        all_fields: bool = False,
+        page_size: int = 100,
+        concurrency: int = 8,
+        shard_by: str = 'offset'
+    ) -> List[Dict[str, Any]]:
+        """Fetch a large result set with ``concurrency`` parallel requests
+        
+        ``shard_by='offset'`` reads the total from the first page and then
+        fetches the remaining ``startAt`` offsets concurrently; results keep
+        the query's order. It needs a stable ordering such as ``ORDER BY key``.
+        ``'id'`` and ``'created'`` instead split the query into one window
+        of issue ids or created dates per worker and walk each window on its
+        own, so edits made during the walk cannot shift issues between pages.
+        Those modes return issues in id or created order. Jira Cloud has no
+        ``startAt`` paging, so offset mode falls back to ``'id'`` there.
+        
+        Issues are deduplicated by id. Returns up to ``max_results`` raw
+        issue dicts (all of them when it is None).
+        """
+        if shard_by not in SHARD_MODES:
+            raise ValueError(
+                f"Unsupported shard_by '{shard_by}'. Use one of: {', '.join(SHARD_MODES)}"
+            )
+        fields = self._resolve_fields(fields, all_fields)
+        expand = self._resolve_expand(expand)
+        if shard_by == 'offset' and getattr(self._jira, 'deploymentType', None) == 'Cloud':
+            shard_by = 'id'
+        
+        started = time.perf_counter()
+        if shard_by == 'offset':
+            pages = self._search_offsets(jql, max_results, page_size, fields, expand, concurrency)
+        else:
+            pages = self._search_shards(jql, shard_by, page_size, fields, expand, concurrency)
+        
+        issues = []
+        seen = set()
+        for page in pages:
+            for raw in page:
+                if raw['id'] not in seen:
+                    seen.add(raw['id'])
+                    issues.append(raw)
+        if max_results is not None:
+            issues = issues[:max_results]
+        logger.info(
+            f"Parallel search ({shard_by}) found {len(issues)} issues "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return issues
+    
+    def _search_offsets(
+        self,
+        jql: str,
+        max_results: Optional[int],
+        page_size: int,
+        fields: Union[List[str], str],
+        expand: Optional[str],
+        concurrency: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Fetch the first page for the total, then every other page at once"""
+        _load_jira()
+        try:
+            first = self._request(
+                'search_issues',
+                self._jira.search_issues,
+                jql,
+                startAt=0,
+                maxResults=page_size,
+                fields=fields,
+                expand=expand,
+                json_result=True
+            )
+        except JIRAError as e:
+            raise JiraManagerError(f"Failed to search issues: {e}") from e
+        
+        issues = first.get('issues', [])
+        total = first.get('total', len(issues))
+        if max_results is not None:
+            total = min(total, max_results)
+        # The server may cap maxResults below page_size
+        step = len(issues) or page_size
+        offsets = list(range(len(issues), total, step))
+        
+        def fetch(start: int) -> List[Dict[str, Any]]:
+            return self._search_page(jql, start, step, fields, expand)[0]
+        
+        return [issues] + run_concurrently(fetch, offsets, concurrency)
+    
+    def _search_shards(
+        self,
+        jql: str,
+        shard_by: str,
+        page_size: int,
+        fields: Union[List[str], str],
+        expand: Optional[str],
+        concurrency: int
+    ) -> List[List[Dict[str, Any]]]:
+        """Split JQL into ``concurrency`` id or created windows and walk each"""
+        where = _ORDER_BY.sub('', jql).strip()
+        bounds = []
+        for direction in ('ASC', 'DESC'):
+            query = f"{where} ORDER BY {shard_by} {direction}".strip()
+            page, _ = self._search_page(query, 0, 1, ['created'])
+            if not page:
+                return []
+            bounds.append(page[0])
+        
+        clauses = self._shard_clauses(shard_by, bounds[0], bounds[1], concurrency)
+        
+        def walk(clause: str) -> List[Dict[str, Any]]:
+            query = f"({where}) AND {clause}" if where else clause
+            query += f" ORDER BY {shard_by} ASC"
+            issues: List[Dict[str, Any]] = []
+            cursor: Union[int, str, None] = 0
+            while cursor is not None:
+                page, cursor = self._search_page(query, cursor, page_size, fields, expand)
+                issues.extend(page)
+            return issues
+        
+        return run_concurrently(walk, clauses, concurrency)
+    
+    @staticmethod
+    def _shard_clauses(
+        shard_by: str,
+        first: Dict[str, Any],
+        last: Dict[str, Any],
+        count: int
+    ) -> List[str]:
+        """Build JQL windows covering everything; the outer ones are open-ended"""
+        if shard_by == 'id':
+            low, high = int(first['id']), int(last['id'])
+            points = sorted({low + (high - low + 1) * n // count for n in range(1, count)})
+            literals = [str(p) for p in points if low < p <= high]
+        else:
+            low = datetime.strptime(first['fields']['created'], '%Y-%m-%dT%H:%M:%S.%f%z')
+            high = datetime.strptime(last['fields']['created'], '%Y-%m-%dT%H:%M:%S.%f%z')
+            span = high - low
+            # JQL dates have minute precision, so windows narrower than that merge
+            literals = sorted({
+                f'"{(low + span * n / count).strftime("%Y/%m/%d %H:%M")}"'
+                for n in range(1, count)
+            })
+        
+        if not literals:
+            return [f"{shard_by} is not EMPTY"]
+        clauses = [f"{shard_by} < {literals[0]}"]
+        for lower, upper in zip(literals, literals[1:]):
+            clauses.append(f"{shard_by} >= {lower} AND {shard_by} < {upper}")
+        clauses.append(f"{shard_by} >= {literals[-1]}")
+        return clauses
+    
+    @staticmethod
+    def _resolve_fields(
+        fields: Optional[List[str]],
+        all_fields: bool = False
+    ) -> Union[List[str], str]:
+        """Return the field projection to request from the search API"""
+        if all_fields:
+            return '*all'
+        return list(fields) if fields else list(DEFAULT_FIELDS)
+    
+    @staticmethod
+    def _resolve_expand(expand: Optional[List[str]]) -> Optional[str]:
+        """Validate ``expand`` against the whitelist and join it for the API"""
+        if not expand:
+            return None
+        if isinstance(expand, str):
+            expand = [part.strip() for part in expand.split(',')]
+        unknown = sorted(set(expand) - ALLOWED_EXPANDS)
+        if unknown:
+            raise ValueError(
+                f"Unsupported expand value(s): {', '.join(unknown)}. "
+                f"Allowed: {', '.join(sorted(ALLOWED_EXPANDS))}"
+            )
+        return ','.join(expand)
+    
     def list_issues(
         self,
         project_key: Optional[str] = None,
         assignee: Optional[str] = None,
         status: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        fields: Optional[List[str]] = None,
+        all_fields: bool = False,
+        records: bool = False
     ) -> List[Any]:
-        """List issues with filters"""
-        project_key = project_key or self.config.project_key
-        jql_parts = [f"project = {project_key}"]
-        
-        if assignee:
-            jql_parts.append(f"assignee = {assignee}")
-        if status:
-            jql_parts.append(f"status = '{status}'")
+        """List issues with filters
         
-        jql = " AND ".join(jql_parts)
-        jql += " ORDER BY created DESC"
+        Answered from the attached ``IssueMirror`` when it covers the project
+        and the default field projection is requested.
+        """
+        project_key = project_key or self.config.project_key
+        if (
+            self.mirror is not None
+            and fields is None
+            and not all_fields
+            and self.mirror.covers(project_key)
+        ):
+            raws = self.mirror.list_issues(project_key, assignee, status, limit)
+            wrap = IssueRecord.from_json if records else self._issue_from_raw
+            return [wrap(raw) for raw in raws]
         
-        return self.search_issues(jql, max_results=limit)
+        query = (
+            Query()
+            .where('project', project_key)
+            .where('assignee', assignee or None)
+            .where('status', status or None)
+            .order_by('created', 'DESC')
+        )
+        return self.search_issues(
+            str(query), max_results=limit, fields=fields, all_fields=all_fields, records=records
+        )
     
     def get_transitions(self, issue_key: str) -> List[Dict[str, Any]]:
-        """Get available transitions for an issue"""
+        """Get available transitions for an issue
+        
+        With a cache attached, transitions are cached per workflow state
+        (project, issue type, status), not per issue, so an issue whose
+        status changed elsewhere gets the entry for its new state. This only
+        saves requests for issues that are cached themselves, whose state is
+        known locally; any other issue costs one request, as without a
+        cache, which reads its state and transitions together and refreshes
+        the entry for that state.
+        """
+        _load_jira()
         try:
-            transitions = self._jira.transitions(issue_key)
-            return [{'id': t['id'], 'name': t['name']} for t in transitions]
+            if self.cache is None:
+                return self._load_transitions(issue_key)
+            issue = self.cache.get('issue', issue_key)
+            if issue is not MISSING:
+                return self._state_transitions(issue_key, self._workflow_state(issue.raw))
+            raw = self._request(
+                'get_transitions', self._jira._get_json, f"issue/{issue_key}",
+                params={'fields': 'project,issuetype,status', 'expand': 'transitions'}
+            )
+            transitions = [{'id': t['id'], 'name': t['name']} for t in raw.get('transitions', [])]
+            self.cache.set('transitions', self._workflow_state(raw), transitions)
+            return transitions
         except JIRAError as e:
             raise JiraManagerError(f"Failed to get transitions: {e}") from e
     
+    def get_priorities(self) -> List[Dict[str, Any]]:
+        """Get the priorities defined on the Jira instance"""
+        _load_jira()
+        try:
+            return self._cached('priorities', None, lambda: [
+                {'id': p.id, 'name': p.name} for p in self._request('get_priorities', self._jira.priorities)
+            ])
+        except JIRAError as e:
+            raise JiraManagerError(f"Failed to get priorities: {e}") from e
+    
+    def get_issue_types(self) -> List[Dict[str, Any]]:
+        """Get the issue types defined on the Jira instance"""
+        _load_jira()
+        try:
+            return self._cached('issue_types', None, lambda: [
+                {'id': t.id, 'name': t.name} for t in self._request('get_issue_types', self._jira.issue_types)
+            ])
+        except JIRAError as e:
+            raise JiraManagerError(f"Failed to get issue types: {e}") from e
+    
     def assign_issue(self, issue_key: str, assignee: str) -> None:
         """Assign an issue to a user"""
+        _load_jira()
         try:
-            self._jira.assign_issue(issue_key, assignee)
+            self._request('assign_issue', self._jira.assign_issue, issue_key, assignee)
+            self._invalidate(issue_key)
             logger.info(f"Assigned {issue_key} to {assignee}")
         except JIRAError as e:
             raise JiraManagerError(f"Failed to assign issue: {e}") from e
@@ -0,0 +1,251 @@
+"""Streaming export of search results to JSON Lines, CSV and Parquet"""
+
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .exceptions import ConfigurationError, JiraManagerError
+from .records import IssueRecord
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'parquet')
+
+# Columns every export starts with; further projected fields follow
+BASE_COLUMNS = ['key', 'id', 'summary', 'status', 'assignee', 'priority', 'updated']
+
+# Pages buffered into one Parquet part file (one row group each)
+PARQUET_PAGES_PER_PART = 10
+
+
+def infer_format(path: str) -> str:
+    """Guess the export format from a file name, defaulting to JSON Lines"""
+    suffixes = [s.lower() for s in Path(path).suffixes if s.lower() != '.gz']
+    suffix = suffixes[-1] if suffixes else ''
+    if suffix == '.csv':
+        return 'csv'
+    if suffix in ('.parquet', '.pq'):
+        return 'parquet'
+    return 'jsonl'
+
+
+def _flatten(raw: Dict[str, Any], columns: List[str]) -> Dict[str, Any]:
+    """Turn one raw issue into a flat row with scalar values"""
+    row = IssueRecord.from_json(raw).to_dict()
+    flat = {}
+    for column in columns:
+        value = row.get(column)
+        if isinstance(value, (dict, list)):
+            value = json.dumps(value, separators=(',', ':'))
+        flat[column] = value
+    return flat
+
+
+class Checkpoint:
+    """Export progress persisted next to the output after every page"""
+    
+    def __init__(self, path: str):
+        self.path = path
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved state, or None when there is none"""
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+    
+    def save(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the saved state"""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as handle:
+            json.dump(state, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, self.path)
+    
+    def clear(self) -> None:
+        """Remove the saved state"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def export_issues(
+    client: "JiraClient",
+    jql: str,
+    path: str,
+    format: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    page_size: int = 100,
+    compress: Optional[bool] = None,
+    resume: bool = True
+) -> int:
+    """Stream every issue matching JQL to a file, one page at a time
+    
+    ``format`` is ``jsonl``, ``csv`` or ``parquet`` (inferred from ``path``
+    when omitted). JSON Lines and CSV output is gzip-compressed when
+    ``compress`` is set or ``path`` ends in ``.gz``. Each page is written as
+    a self-contained gzip member, so the file can be cut back to any page
+    boundary. Parquet output is a directory of part files.
+    
+    After every page the output position and the search cursor are saved to
+    ``<path>.checkpoint``. If an export of the same query is interrupted, the
+    next call with ``resume=True`` discards the partial page and continues
+    where it stopped. Add ``ORDER BY key`` to the JQL so offsets stay stable
+    between runs. Returns the number of issues exported.
+    """
+    format = format or infer_format(path)
+    if format not in EXPORT_FORMATS:
+        raise ConfigurationError(
+            f"Unsupported export format '{format}'. Use one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    if compress is None:
+        compress = path.endswith('.gz')
+    columns = BASE_COLUMNS + [f for f in (fields or []) if f not in BASE_COLUMNS]
+    request_fields = [c for c in columns if c not in ('key', 'id')]
+    
+    checkpoint = Checkpoint(f"{path}.checkpoint")
+    state = checkpoint.load() if resume else None
+    if state is not None and (state.get('jql') != jql or state.get('columns') != columns):
+        raise JiraManagerError(
+            f"{checkpoint.path} belongs to a different export; "
+            "delete it or pass resume=False"
+        )
+    if state is None:
+        state = {'jql': jql, 'columns': columns, 'cursor': 0, 'rows': 0, 'offset': 0, 'part': 0}
+    elif state['cursor'] is None:
+        logger.info(f"Export to {path} already complete")
+        checkpoint.clear()
+        return state['rows']
+    else:
+        logger.info(f"Resuming export to {path} after {state['rows']} issues")
+    
+    writer_cls = _ParquetWriter if format == 'parquet' else _TextWriter
+    writer = writer_cls(path, format, columns, compress, state)
+    try:
+        for page, next_cursor in client.iter_pages(
+            jql, page_size=page_size, fields=request_fields, cursor=state['cursor']
+        ):
+            writer.write_page([_flatten(raw, columns) for raw in page])
+            state['rows'] += len(page)
+            state['cursor'] = next_cursor
+            if writer.flush_point(last=next_cursor is None):
+                writer.save_position(state)
+                checkpoint.save(state)
+    finally:
+        writer.close()
+    
+    checkpoint.clear()
+    logger.info(f"Exported {state['rows']} issues to {path}")
+    return state['rows']
+
+
+class _TextWriter:
+    """Appends JSON Lines or CSV pages to a single file"""
+    
+    def __init__(self, path: str, format: str, columns: List[str], compress: bool, state: Dict[str, Any]):
+        self.format = format
+        self.columns = columns
+        self.compress = compress
+        self._file = open(path, 'ab')
+        # Drop anything written after the last checkpoint (a partial page)
+        self._file.truncate(state['offset'])
+        self._file.seek(state['offset'])
+        self._write_header = state['offset'] == 0 and format == 'csv'
+    
+    def write_page(self, rows: List[Dict[str, Any]]) -> None:
+        buffer = io.StringIO()
+        if self.format == 'csv':
+            writer = csv.DictWriter(buffer, fieldnames=self.columns, lineterminator='\n')
+            if self._write_header:
+                writer.writeheader()
+                self._write_header = False
+            writer.writerows(rows)
+        else:
+            for row in rows:
+                buffer.write(json.dumps(row, separators=(',', ':')))
+                buffer.write('\n')
+        data = buffer.getvalue().encode('utf-8')
+        if self.compress:
+            data = gzip.compress(data)
+        self._file.write(data)
+    
+    def flush_point(self, last: bool = False) -> bool:
+        """Every page ends on a clean boundary"""
+        return True
+    
+    def save_position(self, state: Dict[str, Any]) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        state['offset'] = self._file.tell()
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Buffers pages into column batches written as Parquet part files
+    
+    Every column is stored as a string, so all part files share one schema
+    even when a column is empty throughout one of them.
+    """
+    
+    def __init__(self, path: str, format: str, columns: List[str], compress: bool, state: Dict[str, Any]):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ConfigurationError(
+                "Parquet export requires the 'pyarrow' package. "
+                "Install it with: pip install pyarrow"
+            ) from e
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.columns = columns
+        self.schema = pyarrow.schema([(column, pyarrow.string()) for column in columns])
+        self.compression = 'gzip' if compress else 'snappy'
+        self.directory = Path(path)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.part = state['part']
+        # Remove part files written after the last checkpoint
+        for stale in self.directory.glob('part-*.parquet'):
+            if int(stale.stem.split('-')[1]) >= self.part:
+                stale.unlink()
+        self._batch: Dict[str, List[Any]] = {c: [] for c in columns}
+        self._pages = 0
+    
+    def write_page(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            for column in self.columns:
+                value = row[column]
+                self._batch[column].append(None if value is None else str(value))
+        self._pages += 1
+    
+    def flush_point(self, last: bool = False) -> bool:
+        """Write a part file every few pages and at the end"""
+        if self._pages == 0 or (self._pages < PARQUET_PAGES_PER_PART and not last):
+            return False
+        table = self._pa.table(self._batch, schema=self.schema)
+        target = self.directory / f"part-{self.part:05d}.parquet"
+        self._pq.write_table(table, target, compression=self.compression)
+        self.part += 1
+        self._batch = {c: [] for c in self.columns}
+        self._pages = 0
+        return True
+    
+    def save_position(self, state: Dict[str, Any]) -> None:
+        state['part'] = self.part
+    
+    def close(self) -> None:
+        pass
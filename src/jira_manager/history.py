@@ -0,0 +1,161 @@
+"""Bulk issue history: status transitions for cycle-time analytics"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .utils import chunked
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+# Timestamp format of Jira's REST API
+JIRA_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    key TEXT PRIMARY KEY,
+    updated TEXT NOT NULL,
+    events TEXT NOT NULL
+);
+"""
+
+
+class StatusTransition(NamedTuple):
+    """One status change of an issue"""
+    issue: str
+    from_status: Optional[str]
+    to_status: Optional[str]
+    timestamp: datetime
+    author: Optional[str]
+
+
+def status_transitions(issue_key: str, histories: List[Dict[str, Any]]) -> List[StatusTransition]:
+    """Extract the status changes from changelog histories, oldest first"""
+    events = []
+    for history in sorted(histories, key=lambda h: h.get('created', '')):
+        for item in history.get('items', []):
+            if item.get('field') != 'status':
+                continue
+            author = history.get('author') or {}
+            events.append(StatusTransition(
+                issue_key,
+                item.get('fromString'),
+                item.get('toString'),
+                datetime.strptime(history['created'], JIRA_TIME_FORMAT),
+                author.get('accountId') or author.get('name'),
+            ))
+    return events
+
+
+class HistoryStore:
+    """SQLite cache of each issue's status transitions, keyed by ``updated``
+    
+    An entry is reused only while the issue's ``updated`` timestamp matches
+    the one it was stored with, so any edit to an issue refetches its history.
+    """
+    
+    def __init__(self, path: str = "jira_history.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+    
+    def lookup(self, updated: Dict[str, str]) -> Dict[str, List[StatusTransition]]:
+        """Return cached events for the issues in ``{key: updated}`` still current"""
+        found = {}
+        for keys in chunked(list(updated), 500):
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT key, updated, events FROM history WHERE key IN ({','.join('?' * len(keys))})",
+                    keys
+                ).fetchall()
+            for key, stamp, events in rows:
+                if stamp == updated[key]:
+                    found[key] = [
+                        StatusTransition(key, f, t, datetime.strptime(ts, JIRA_TIME_FORMAT), a)
+                        for f, t, ts, a in json.loads(events)
+                    ]
+        return found
+    
+    def store(self, entries: Dict[str, Tuple[str, List[StatusTransition]]]) -> None:
+        """Save ``{key: (updated, events)}``"""
+        rows = [
+            (key, updated, json.dumps([
+                [e.from_status, e.to_status, e.timestamp.strftime(JIRA_TIME_FORMAT), e.author]
+                for e in events
+            ]))
+            for key, (updated, events) in entries.items()
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO history (key, updated, events) VALUES (?, ?, ?)", rows
+            )
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def iter_status_transitions(
+    client: "JiraClient",
+    jql: str,
+    store: Optional[HistoryStore] = None,
+    page_size: int = 100
+) -> Iterator[StatusTransition]:
+    """Stream the status transitions of every issue matching ``jql``
+    
+    Histories come from searches with ``expand=changelog``, a page of issues
+    per request instead of one request per issue. Jira truncates embedded
+    histories (to 100 entries), so longer ones are completed with
+    ``JiraClient.get_changelog``. With a ``store``, a first pass fetches only
+    keys and ``updated`` stamps, and changelogs are requested just for
+    issues that changed since they were stored; an issue deleted or moved
+    in between is skipped. Events are yielded grouped by issue, oldest
+    first within each issue.
+    """
+    if store is None:
+        for page, _ in client.iter_pages(jql, page_size=page_size, fields=['updated'],
+                                         expand=['changelog']):
+            for raw in page:
+                yield from _issue_transitions(client, raw)[1]
+        return
+    
+    for page, _ in client.iter_pages(jql, page_size=page_size, fields=['updated']):
+        updated = {raw['key']: raw['fields'].get('updated') or '' for raw in page}
+        cached = store.lookup(updated)
+        stale = [key for key in updated if key not in cached]
+        fetched = {}
+        if stale:
+            found = client._fetch_raw_issues(stale, ['updated'], batch_size=len(stale),
+                                             expand='changelog')
+            for key in stale:
+                if key in found:
+                    fetched[key] = _issue_transitions(client, found[key])
+                else:
+                    logger.info(f"Skipping history of {key}: no longer returned by Jira")
+            store.store(fetched)
+        logger.debug(f"History page: {len(cached)} cached, {len(fetched)} fetched")
+        for key in updated:
+            if key in cached:
+                yield from cached[key]
+            elif key in fetched:
+                yield from fetched[key][1]
+
+
+def _issue_transitions(
+    client: "JiraClient",
+    raw: Dict[str, Any]
+) -> Tuple[str, List[StatusTransition]]:
+    """Return ``(updated, events)`` for a search result with its changelog"""
+    changelog = raw.get('changelog') or {}
+    histories = changelog.get('histories', [])
+    if len(histories) < changelog.get('total', len(histories)):
+        histories = client.get_changelog(raw['key'])
+    return raw['fields'].get('updated') or '', status_transitions(raw['key'], histories)
@@ -0,0 +1,329 @@
+"""Restartable, multi-process bulk import of issues from CSV"""
+
+import csv
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from .config import Config
+from .core import BULK_CREATE_BATCH_SIZE, build_issue_fields
+from .jql import Query
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+# CSV column names accepted as aliases of ``create_issue`` arguments
+CSV_COLUMN_ALIASES = {
+    'type': 'issue_type',
+    'issuetype': 'issue_type',
+    'project': 'project_key',
+}
+
+# Fields Jira fills in itself or that are set from the row's project/type
+_IMPLICIT_FIELDS = frozenset({'project', 'issuetype', 'reporter'})
+
+# Extra minutes searched when checking whether an interrupted batch was created
+RECONCILE_OVERLAP_MINUTES = 2
+
+# Longest summary Jira accepts
+MAX_SUMMARY_LENGTH = 255
+
+
+def read_csv_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield ``create_issue`` keyword arguments for each row of a CSV file"""
+    with open(path, newline='', encoding='utf-8') as handle:
+        for record in csv.DictReader(handle):
+            row = {}
+            for column, value in record.items():
+                if column is None or value in (None, ''):
+                    continue
+                name = column.strip().lower()
+                name = CSV_COLUMN_ALIASES.get(name, name)
+                if name == 'labels':
+                    row[name] = [label.strip() for label in value.split(';') if label.strip()]
+                else:
+                    row[name] = value
+            yield row
+
+
+def validate_fields(fields: Dict[str, Any], meta: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Check a ``fields`` payload against ``JiraClient.get_create_meta`` output
+    
+    Returns a list of problems; empty when the row can be sent.
+    """
+    errors = []
+    summary = fields.get('summary') or ''
+    if len(summary) > MAX_SUMMARY_LENGTH:
+        errors.append(f"Summary is longer than {MAX_SUMMARY_LENGTH} characters")
+    for field_id, spec in meta.items():
+        if (
+            spec['required']
+            and not spec['has_default']
+            and field_id not in _IMPLICIT_FIELDS
+            and fields.get(field_id) in (None, '', [])
+        ):
+            errors.append(f"Missing required field '{spec['name'] or field_id}'")
+    for field_id, value in fields.items():
+        if field_id in _IMPLICIT_FIELDS or value in (None, '', []):
+            continue
+        spec = meta.get(field_id)
+        if spec is None:
+            errors.append(f"Field '{field_id}' cannot be set on the create screen")
+            continue
+        allowed = spec['allowed']
+        if allowed and isinstance(value, dict):
+            wanted = next((str(value[a]) for a in ('name', 'value', 'id') if a in value), None)
+            if wanted is not None and wanted.lower() not in {a.lower() for a in allowed}:
+                errors.append(f"'{wanted}' is not an allowed value for '{spec['name'] or field_id}'")
+    return errors
+
+
+class ImportJournal:
+    """Append-only JSON Lines log of an import's progress
+    
+    A ``sent`` entry is written before each batch goes out and a ``done``
+    entry once Jira answered. Rows of a batch with no ``done`` entry may or
+    may not have been created; ``import_csv`` checks Jira before retrying
+    them. A partly written last line (from a crash) is ignored.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.created: Dict[int, str] = {}
+        self.unresolved: Dict[int, Dict[str, Any]] = {}
+        self.next_batch = 0
+        self._load()
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def _load(self) -> None:
+        try:
+            handle = open(self.path, 'rb')
+        except FileNotFoundError:
+            return
+        with handle:
+            valid = 0
+            for line in handle:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                valid += len(line)
+                self.next_batch = max(self.next_batch, entry['batch'] + 1)
+                if entry['event'] == 'sent':
+                    self.unresolved[entry['batch']] = entry
+                elif entry['event'] == 'done':
+                    self.unresolved.pop(entry['batch'], None)
+                    self.created.update({int(row): key for row, key in entry['created'].items()})
+        # Drop a torn final line so new entries start on a line of their own
+        if valid < os.path.getsize(self.path):
+            os.truncate(self.path, valid)
+    
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def sent(self, batch: int, rows: List[Tuple[int, str, str]]) -> None:
+        """Record ``(row number, summary, project key)`` for a batch about to go out"""
+        self.next_batch = max(self.next_batch, batch + 1)
+        self._append({'event': 'sent', 'batch': batch, 'time': time.time(), 'rows': rows})
+    
+    def done(self, batch: int, created: Dict[int, str]) -> None:
+        self.created.update(created)
+        self.unresolved.pop(batch, None)
+        self._append({'event': 'done', 'batch': batch, 'created': created})
+    
+    def close(self) -> None:
+        self._file.close()
+
+
+# Client held by each worker process, built once by _init_worker
+_worker_client: Optional["JiraClient"] = None
+
+
+def _init_worker(config_values: Dict[str, Any]) -> None:
+    global _worker_client
+    from .core import JiraClient
+    
+    _worker_client = JiraClient(Config.from_dict(config_values), shared_session=True, lazy=True)
+
+
+def _create_in_worker(batch: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    return _worker_client._create_batch(batch)
+
+
+def import_csv(
+    path: str,
+    client: "JiraClient",
+    journal_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    batch_size: int = BULK_CREATE_BATCH_SIZE,
+    validate: bool = True,
+    config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """Create one issue per CSV row, surviving crashes without duplicates
+    
+    Rows are streamed from ``path`` and checked against cached create
+    metadata (required fields, allowed values) before anything is sent;
+    invalid rows are reported, not sent. Valid rows go out in bulk-create
+    batches spread over ``workers`` processes (default: CPU count), each
+    with its own pooled ``JiraClient`` using the values of ``client.config``
+    (or of ``config_file`` when given) as they were when the import started.
+    With ``workers=1`` batches are sent from this process through ``client``.
+    
+    Progress is journaled to ``journal_path`` (default ``<path>.journal``).
+    Rerunning the same import skips rows already created; rows whose batch
+    was interrupted are first looked up in Jira (same reporter, summary and
+    project, created since the batch was sent) so they are not created
+    twice. Returns counts of ``created``, ``skipped`` and ``failed`` rows
+    and the ``errors`` as ``{'row', 'error'}`` dicts.
+    """
+    if not 1 <= batch_size <= BULK_CREATE_BATCH_SIZE:
+        raise ValueError(f"batch_size must be between 1 and {BULK_CREATE_BATCH_SIZE}")
+    workers = workers or os.cpu_count() or 1
+    journal = ImportJournal(journal_path or f"{path}.journal")
+    summary: Dict[str, Any] = {'created': 0, 'skipped': 0, 'failed': 0, 'errors': []}
+    metas: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+    
+    def fail(row: int, error: str) -> None:
+        summary['failed'] += 1
+        summary['errors'].append({'row': row, 'error': error})
+    
+    try:
+        if journal.unresolved:
+            _reconcile(client, journal)
+        skip = set(journal.created)
+        batch_no = journal.next_batch
+        
+        executor = None
+        if workers > 1:
+            config = Config(config_file) if config_file else client.config
+            executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(config.to_dict(),)
+            )
+        pending: Dict[Future, Tuple[int, List[Tuple[int, Dict[str, Any]]]]] = {}
+        
+        def collect(futures: Set[Future]) -> None:
+            for future in futures:
+                number, batch = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    # The batch may or may not have been created; leave it
+                    # unresolved so the next run checks Jira first
+                    for index, _ in batch:
+                        fail(index, f"Batch interrupted: {e}")
+                    continue
+                created = {r['row']: r['key'] for r in results if r['status'] == 'Success'}
+                journal.done(number, created)
+                summary['created'] += len(created)
+                for r in results:
+                    if r['status'] != 'Success':
+                        fail(r['row'], str(r['error']))
+        
+        def send(batch: List[Tuple[int, Dict[str, Any]]], described: List[Tuple[int, str, str]]) -> None:
+            nonlocal batch_no
+            journal.sent(batch_no, described)
+            if executor is None:
+                future: Future = Future()
+                try:
+                    future.set_result(client._create_batch(batch))
+                except Exception as e:
+                    future.set_exception(e)
+            else:
+                future = executor.submit(_create_in_worker, batch)
+            pending[future] = (batch_no, batch)
+            batch_no += 1
+            # Keep a bounded number of batches in flight so the CSV streams
+            while len(pending) >= workers * 2 or (executor is None and pending):
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                collect(done)
+        
+        try:
+            batch: List[Tuple[int, Dict[str, Any]]] = []
+            described: List[Tuple[int, str, str]] = []
+            for index, row in enumerate(read_csv_rows(path)):
+                if index in skip:
+                    summary['skipped'] += 1
+                    continue
+                try:
+                    fields = build_issue_fields(client.config, **row)
+                except TypeError as e:
+                    fail(index, str(e))
+                    continue
+                project = fields['project']['key']
+                if validate:
+                    screen = (project, fields['issuetype']['name'])
+                    if screen not in metas:
+                        metas[screen] = client.get_create_meta(*screen)
+                    errors = validate_fields(fields, metas[screen])
+                    if errors:
+                        fail(index, '; '.join(errors))
+                        continue
+                batch.append((index, row))
+                described.append((index, fields.get('summary'), project))
+                if len(batch) >= batch_size:
+                    send(batch, described)
+                    batch, described = [], []
+            if batch:
+                send(batch, described)
+            if pending:
+                collect(wait(list(pending)).done)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    finally:
+        journal.close()
+    
+    logger.info(
+        f"Import of {path}: {summary['created']} created, {summary['skipped']} already done, "
+        f"{summary['failed']} failed"
+    )
+    return summary
+
+
+def _reconcile(client: "JiraClient", journal: ImportJournal) -> None:
+    """Find issues created by batches that were interrupted before their reply
+    
+    Each journaled row is matched, in row order, to the oldest unclaimed
+    issue with its summary in its project (read from the issue's ``project``
+    field, as the journal may hold the key in another case). Bulk create
+    keeps row order, so rows sharing a summary and project get their issues
+    in key order.
+    """
+    for number, entry in sorted(journal.unresolved.items()):
+        minutes = int((time.time() - entry['time']) / 60) + RECONCILE_OVERLAP_MINUTES
+        projects = sorted({project.upper() for _, _, project in entry['rows']})
+        query = (
+            Query()
+            .where('reporter', 'currentUser()')
+            .where('project', projects, 'IN')
+            .where('created', f'-{minutes}m', '>=')
+            .order_by('key', 'ASC')
+        )
+        taken = set(journal.created.values())
+        candidates: Dict[Tuple[str, str], List[str]] = {}
+        for record in client.iter_issues(str(query), fields=['summary', 'project'], records=True):
+            if record.key not in taken:
+                extra = record.extra or {}
+                project = (extra.get('project') or {}).get('key') or record.key.rsplit('-', 1)[0]
+                match = (project.upper(), (record.summary or '').strip())
+                candidates.setdefault(match, []).append(record.key)
+        created = {}
+        for index, summary_text, project in sorted(entry['rows']):
+            keys = candidates.get((project.upper(), (summary_text or '').strip()))
+            if keys:
+                created[index] = keys.pop(0)
+        logger.info(
+            f"Interrupted batch {number}: {len(created)} of {len(entry['rows'])} rows "
+            f"were already created"
+        )
+        journal.done(number, created)
@@ -0,0 +1,138 @@
+"""Composable, escaped JQL queries with a canonical form"""
+
+import re
+from typing import Any, Optional, Tuple
+
+# Values written verbatim instead of quoted, e.g. ``currentUser()``
+_FUNCTION = re.compile(r'^[A-Za-z]\w*\([^()"]*\)$')
+
+# Reserved words normalised to upper case by ``canonical``
+_KEYWORDS = frozenset({
+    'and', 'or', 'not', 'in', 'is', 'was', 'changed', 'empty', 'null',
+    'order', 'by', 'asc', 'desc', 'from', 'to', 'after', 'before', 'on', 'during',
+})
+
+# String literals, which canonical() leaves untouched
+_STRING = re.compile(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')')
+
+_OPERATORS = frozenset({
+    '=', '!=', '>', '>=', '<', '<=', '~', '!~', 'IN', 'NOT IN', 'IS', 'IS NOT', 'WAS',
+})
+
+
+def quote(value: Any) -> str:
+    """Render a value as a JQL string literal, escaping quotes and backslashes"""
+    text = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{text}"'
+
+
+def literal(value: Any) -> str:
+    """Render a value for the right-hand side of a JQL clause
+    
+    Function calls such as ``currentUser()`` and ``EMPTY`` stay bare; lists
+    become ``("a", "b")``; everything else is quoted.
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted({literal(v) for v in value})
+        return f"({', '.join(items)})"
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    text = str(value)
+    if _FUNCTION.match(text) or text.upper() in ('EMPTY', 'NULL'):
+        return text
+    return quote(text)
+
+
+def canonical(jql: str) -> str:
+    """Normalise whitespace and keyword case outside string literals
+    
+    Two strings that differ only in spacing or in the case of reserved words
+    map to the same canonical text, which can then serve as a cache key.
+    """
+    parts = []
+    for index, part in enumerate(_STRING.split(jql.strip())):
+        if index % 2:
+            if part[0] == "'":
+                part = '"' + part[1:-1].replace('"', '\\"') + '"'
+            parts.append(part)
+            continue
+        part = re.sub(r'\s*(!=|>=|<=|!~|=|~|>|<)\s*', r' \1 ', part)
+        part = re.sub(r'\s*,\s*', ', ', part)
+        part = re.sub(r'\(\s+', '(', re.sub(r'\s+\)', ')', part))
+        part = re.sub(r'\s+', ' ', part)
+        parts.append(re.sub(
+            r'(?<![\w.-])[A-Za-z]+(?![\w.(-])',
+            lambda m: m.group(0).upper() if m.group(0).lower() in _KEYWORDS else m.group(0),
+            part
+        ))
+    return ''.join(parts).strip()
+
+
+class Query:
+    """Immutable JQL builder; every method returns a new query
+    
+    >>> str(Query().where('project', 'PROJ').where('status', ['Done', 'Open'], 'in')
+    ...     .order_by('created', 'DESC'))
+    'project = "PROJ" AND status IN ("Done", "Open") ORDER BY created DESC'
+    
+    Clauses are ANDed. Field names are lower-cased and clauses sorted, so
+    queries built in any order share one canonical string.
+    """
+    
+    def __init__(self, clauses: Tuple[str, ...] = (), order: Tuple[Tuple[str, str], ...] = ()):
+        self._clauses = clauses
+        self._order = order
+    
+    def where(self, field: str, value: Any, operator: str = '=') -> "Query":
+        """Add ``field <operator> value``; a None value adds nothing"""
+        if value is None:
+            return self
+        operator = operator.upper()
+        if operator not in _OPERATORS:
+            raise ValueError(f"Unsupported JQL operator '{operator}'")
+        if isinstance(value, (list, tuple, set, frozenset)) and operator == '=':
+            operator = 'IN'
+        clause = f"{_field(field)} {operator} {literal(value)}"
+        return Query(self._clauses + (clause,), self._order)
+    
+    def raw(self, clause: Optional[str]) -> "Query":
+        """Add a pre-built JQL fragment, parenthesised"""
+        if not clause:
+            return self
+        return Query(self._clauses + (f"({canonical(clause)})",), self._order)
+    
+    def order_by(self, field: str, direction: str = 'ASC') -> "Query":
+        """Append a sort key"""
+        direction = direction.upper()
+        if direction not in ('ASC', 'DESC'):
+            raise ValueError(f"Unsupported sort direction '{direction}'")
+        return Query(self._clauses, self._order + ((_field(field), direction),))
+    
+    @property
+    def where_clause(self) -> str:
+        return ' AND '.join(sorted(set(self._clauses)))
+    
+    def __str__(self) -> str:
+        text = self.where_clause
+        if self._order:
+            order = ', '.join(f"{f} {d}" for f, d in self._order)
+            text = f"{text} ORDER BY {order}" if text else f"ORDER BY {order}"
+        return text
+    
+    def __repr__(self) -> str:
+        return f"Query({str(self)!r})"
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Query):
+            return str(self) == str(other)
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+def _field(name: str) -> str:
+    """Lower-case plain field names; quote ones with spaces (custom fields)"""
+    if re.fullmatch(r'[A-Za-z][\w.]*|cf\[\d+\]', name):
+        return name if name.startswith('cf[') else name.lower()
+    return quote(name)
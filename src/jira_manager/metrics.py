@@ -0,0 +1,357 @@
+"""Client-side request instrumentation and latency histograms"""
+
+import bisect
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Collapse issue keys and numeric ids so endpoints group into few series
+_ENDPOINT_PATTERNS = [
+    (re.compile(r'/secure/(attachment|thumbnail)/\d+/[^/]+$'), r'/secure/\1/{id}/{filename}'),
+    (re.compile(r'/attachment/content/\d+(?=/|$)'), '/attachment/content/{id}'),
+    (re.compile(r'/[A-Z][A-Z0-9_]*-\d+(?=/|$)'), '/{key}'),
+    (re.compile(r'(?<!/api)/\d+(?=/|$)'), '/{id}'),
+]
+
+
+def normalize_endpoint(url: str) -> str:
+    """Turn a request URL into an endpoint label such as ``/rest/api/2/issue/{key}``"""
+    path = urlparse(url).path
+    for pattern, replacement in _ENDPOINT_PATTERNS:
+        path = pattern.sub(replacement, path)
+    return path
+
+
+def _content_length(headers: Any) -> Optional[int]:
+    try:
+        return int(headers.get('Content-Length'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _request_size(request: Any) -> int:
+    """Size of a request body, including streamed multipart uploads"""
+    size = _content_length(getattr(request, 'headers', None))
+    if size is not None:
+        return size
+    body = getattr(request, 'body', None)
+    return len(body) if isinstance(body, (bytes, str)) else 0
+
+
+def _response_size(response: Any) -> int:
+    """Size of a response body, without reading a streamed one
+    
+    Taken from ``Content-Length`` when present; a ``stream=True`` body
+    that has not been read yet (e.g. an attachment download) counts as 0.
+    """
+    size = _content_length(getattr(response, 'headers', None))
+    if size is not None:
+        return size
+    if getattr(response, '_content', None) is False:
+        return 0
+    return len(response.content or b'')
+
+
+class Instrumentation:
+    """Hook interface called by ``JiraClient`` around every operation
+    
+    Subclass and override the methods you need; the defaults do nothing.
+    """
+    
+    def record_operation(
+        self,
+        operation: str,
+        duration: float,
+        retries: int = 0,
+        error: Optional[BaseException] = None,
+        detail: Optional[str] = None
+    ) -> None:
+        """Called once per client operation, after any retries"""
+    
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        duration: float,
+        request_bytes: int,
+        response_bytes: int
+    ) -> None:
+        """Called for every HTTP response received by the client's session"""
+    
+    def response_hook(self, response: Any, *args: Any, **kwargs: Any) -> Any:
+        """``requests`` response hook feeding ``record_response``"""
+        request = response.request
+        self.record_response(
+            request.method,
+            normalize_endpoint(request.url),
+            response.status_code,
+            response.elapsed.total_seconds(),
+            _request_size(request),
+            _response_size(response)
+        )
+        return response
+
+
+# Instrumentation of the client whose request runs on this thread; several
+# clients can share one session, so its response hook looks it up here
+_active = threading.local()
+
+
+@contextmanager
+def reporting_to(instrumentation: Optional[Instrumentation]) -> Iterator[None]:
+    """Send responses received on this thread to ``instrumentation``"""
+    previous = getattr(_active, 'instrumentation', None)
+    _active.instrumentation = instrumentation
+    try:
+        yield
+    finally:
+        _active.instrumentation = previous
+
+
+def dispatch_response(response: Any, *args: Any, **kwargs: Any) -> Any:
+    """``requests`` response hook feeding the instrumentation of the calling client"""
+    instrumentation = getattr(_active, 'instrumentation', None)
+    if instrumentation is not None:
+        instrumentation.response_hook(response)
+    return response
+
+
+class LatencyHistogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside its bucket"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return ``(le, cumulative count)`` pairs including ``+Inf``"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append(('+Inf' if bound == float('inf') else repr(bound), total))
+        return pairs
+
+
+def _labels(**labels: Any) -> str:
+    parts = []
+    for name, value in labels.items():
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        parts.append(f'{name}="{escaped}"')
+    return '{' + ','.join(parts) + '}'
+
+
+class MetricsRecorder(Instrumentation):
+    """Collects per-operation and per-endpoint latency, size, retry and error metrics
+    
+    Pass it as ``JiraClient(instrumentation=...)``. Read the results with
+    ``snapshot()`` or ``to_prometheus()``, or expose them over HTTP with
+    ``serve_metrics``. Searches slower than ``slow_threshold`` seconds are
+    logged and kept, with their JQL, in ``slow_queries``.
+    """
+    
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+        slow_threshold: float = 2.0,
+        max_slow_queries: int = 20
+    ):
+        self.buckets = buckets
+        self.slow_threshold = slow_threshold
+        self.max_slow_queries = max_slow_queries
+        self._lock = threading.Lock()
+        self.operations: Dict[str, LatencyHistogram] = {}
+        self.retries: Dict[str, int] = {}
+        self.errors: Dict[Tuple[str, str], int] = {}
+        self.endpoints: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.responses: Dict[Tuple[str, str, int], int] = {}
+        self.request_bytes: Dict[Tuple[str, str], int] = {}
+        self.response_bytes: Dict[Tuple[str, str], int] = {}
+        self.slow_queries: List[Tuple[float, str]] = []
+    
+    def record_operation(
+        self,
+        operation: str,
+        duration: float,
+        retries: int = 0,
+        error: Optional[BaseException] = None,
+        detail: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            histogram = self.operations.get(operation)
+            if histogram is None:
+                histogram = self.operations[operation] = LatencyHistogram(self.buckets)
+            histogram.observe(duration)
+            if retries:
+                self.retries[operation] = self.retries.get(operation, 0) + retries
+            if error is not None:
+                key = (operation, type(error).__name__)
+                self.errors[key] = self.errors.get(key, 0) + 1
+            if detail is not None and duration >= self.slow_threshold:
+                self.slow_queries.append((duration, detail))
+                self.slow_queries.sort(reverse=True)
+                del self.slow_queries[self.max_slow_queries:]
+        if detail is not None and duration >= self.slow_threshold:
+            logger.warning(f"Slow {operation} ({duration:.2f}s): {detail}")
+    
+    def record_response(
+        self,
+        method: str,
+        endpoint: str,
+        status: int,
+        duration: float,
+        request_bytes: int,
+        response_bytes: int
+    ) -> None:
+        key = (method, endpoint)
+        with self._lock:
+            histogram = self.endpoints.get(key)
+            if histogram is None:
+                histogram = self.endpoints[key] = LatencyHistogram(self.buckets)
+            histogram.observe(duration)
+            self.responses[key + (status,)] = self.responses.get(key + (status,), 0) + 1
+            self.request_bytes[key] = self.request_bytes.get(key, 0) + request_bytes
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + response_bytes
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable summary with p50/p95/p99 latencies"""
+        def summary(histogram: LatencyHistogram) -> Dict[str, Any]:
+            return {
+                'count': histogram.count,
+                'mean': histogram.sum / histogram.count if histogram.count else 0.0,
+                'p50': histogram.quantile(0.50),
+                'p95': histogram.quantile(0.95),
+                'p99': histogram.quantile(0.99),
+            }
+        
+        with self._lock:
+            return {
+                'operations': {
+                    name: dict(
+                        summary(h),
+                        retries=self.retries.get(name, 0),
+                        errors={e: n for (o, e), n in self.errors.items() if o == name},
+                    )
+                    for name, h in self.operations.items()
+                },
+                'endpoints': {
+                    f"{method} {endpoint}": dict(
+                        summary(h),
+                        request_bytes=self.request_bytes.get((method, endpoint), 0),
+                        response_bytes=self.response_bytes.get((method, endpoint), 0),
+                    )
+                    for (method, endpoint), h in self.endpoints.items()
+                },
+                'slow_queries': [
+                    {'duration': d, 'jql': jql} for d, jql in self.slow_queries
+                ],
+            }
+    
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        lines: List[str] = []
+        
+        def histogram(name: str, help_text: str, series: Dict[Any, LatencyHistogram], label_names: Tuple[str, ...]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, h in sorted(series.items()):
+                values = key if isinstance(key, tuple) else (key,)
+                labels = dict(zip(label_names, values))
+                for le, count in h.cumulative():
+                    lines.append(f"{name}_bucket{_labels(**labels, le=le)} {count}")
+                lines.append(f"{name}_sum{_labels(**labels)} {h.sum}")
+                lines.append(f"{name}_count{_labels(**labels)} {h.count}")
+        
+        def counter(name: str, help_text: str, series: Dict[Any, int], label_names: Tuple[str, ...]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                values = key if isinstance(key, tuple) else (key,)
+                lines.append(f"{name}{_labels(**dict(zip(label_names, values)))} {value}")
+        
+        with self._lock:
+            histogram('jira_manager_operation_duration_seconds',
+                      'Duration of JiraClient operations including retries.',
+                      self.operations, ('operation',))
+            counter('jira_manager_operation_retries_total',
+                    'Retries performed by JiraClient operations.',
+                    self.retries, ('operation',))
+            counter('jira_manager_operation_errors_total',
+                    'Failed JiraClient operations by error class.',
+                    self.errors, ('operation', 'error'))
+            histogram('jira_manager_http_request_duration_seconds',
+                      'Duration of HTTP requests to Jira.',
+                      self.endpoints, ('method', 'endpoint'))
+            counter('jira_manager_http_responses_total',
+                    'HTTP responses from Jira by status.',
+                    self.responses, ('method', 'endpoint', 'status'))
+            counter('jira_manager_http_request_bytes_total',
+                    'Bytes sent in HTTP request bodies.',
+                    self.request_bytes, ('method', 'endpoint'))
+            counter('jira_manager_http_response_bytes_total',
+                    'Bytes received in HTTP response bodies.',
+                    self.response_bytes, ('method', 'endpoint'))
+        return '\n'.join(lines) + '\n'
+
+
+def serve_metrics(recorder: MetricsRecorder, host: str = '127.0.0.1', port: int = 9464) -> Any:
+    """Serve ``recorder.to_prometheus()`` at ``/metrics`` on a daemon thread
+    
+    Returns the ``ThreadingHTTPServer``; call ``shutdown()`` on it to stop.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = recorder.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+    
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{server.server_port}/metrics")
+    return server
@@ -0,0 +1,228 @@
+"""Local SQLite mirror of Jira issues"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .records import user_id
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+# Fields stored for every mirrored issue; enough to answer list_issues
+MIRROR_FIELDS = [
+    'summary', 'status', 'assignee', 'priority', 'updated',
+    'created', 'project', 'issuetype',
+]
+
+# Extra minutes re-fetched on every incremental sync to absorb clock skew
+# between this host and the Jira server
+SYNC_OVERLAP_MINUTES = 5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT,
+    status TEXT COLLATE NOCASE,
+    assignee TEXT,
+    priority TEXT,
+    created TEXT,
+    updated TEXT,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues (project, status, created);
+CREATE INDEX IF NOT EXISTS idx_issues_assignee ON issues (project, assignee, created);
+CREATE INDEX IF NOT EXISTS idx_issues_created ON issues (project, created);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL
+);
+"""
+
+
+class IssueMirror:
+    """Keeps a local SQLite copy of the issues in a set of projects
+    
+    The first ``sync`` loads every issue of each project; later calls only
+    fetch issues updated since the previous sync. Issues deleted in Jira are
+    dropped on the next ``sync(full=True)``. Changes pushed by webhooks are
+    written with ``apply`` and ``delete`` (see ``jira_manager.webhooks``).
+    """
+    
+    def __init__(self, path: str = "jira_mirror.db", projects: Optional[Iterable[str]] = None):
+        self.path = path
+        self.projects = {p.upper() for p in (projects or [])}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+    
+    def covers(self, project_key: str) -> bool:
+        """Return whether the project is mirrored and has been synced"""
+        if project_key.upper() not in self.projects:
+            return False
+        return self.last_sync(project_key) is not None
+    
+    def last_sync(self, project_key: str) -> Optional[float]:
+        """Return the epoch time the project's last sync started, if any"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT last_sync FROM sync_state WHERE project = ?",
+                (project_key.upper(),)
+            ).fetchone()
+        return row['last_sync'] if row else None
+    
+    def sync(self, client: "JiraClient", full: bool = False, page_size: int = 100) -> int:
+        """Pull new and updated issues for every mirrored project
+        
+        Returns the number of issues written.
+        """
+        total = 0
+        for project_key in sorted(self.projects):
+            total += self.sync_project(client, project_key, full=full, page_size=page_size)
+        return total
+    
+    def sync_project(
+        self,
+        client: "JiraClient",
+        project_key: str,
+        full: bool = False,
+        page_size: int = 100
+    ) -> int:
+        """Pull new and updated issues for one project"""
+        project_key = project_key.upper()
+        started = time.time()
+        last_sync = None if full else self.last_sync(project_key)
+        
+        jql = f'project = "{project_key}"'
+        if last_sync is not None:
+            # Relative dates avoid depending on the Jira user's time zone
+            minutes = int((started - last_sync) / 60) + SYNC_OVERLAP_MINUTES
+            jql += f' AND updated >= "-{minutes}m"'
+        jql += " ORDER BY key"
+        
+        seen = set()
+        batch: List[Dict[str, Any]] = []
+        for issue in client.iter_issues(jql, page_size=page_size, fields=MIRROR_FIELDS):
+            batch.append(issue.raw)
+            seen.add(issue.key)
+            if len(batch) >= page_size:
+                self._upsert(project_key, batch)
+                batch = []
+        if batch:
+            self._upsert(project_key, batch)
+        
+        with self._lock, self._db:
+            if last_sync is None:
+                # A full load is authoritative: drop issues Jira no longer has
+                rows = self._db.execute(
+                    "SELECT key FROM issues WHERE project = ?", (project_key,)
+                ).fetchall()
+                stale = [(row['key'],) for row in rows if row['key'] not in seen]
+                self._db.executemany("DELETE FROM issues WHERE key = ?", stale)
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (project, last_sync) VALUES (?, ?)",
+                (project_key, started)
+            )
+        
+        mode = "full" if last_sync is None else "incremental"
+        logger.info(f"Mirror {mode} sync of {project_key}: {len(seen)} issues")
+        return len(seen)
+    
+    def _upsert(self, project_key: str, raws: List[Dict[str, Any]]) -> None:
+        """Insert or replace raw issues"""
+        rows = []
+        for raw in raws:
+            fields = raw.get('fields', {})
+            rows.append((
+                raw['key'],
+                (fields.get('project') or {}).get('key', project_key),
+                fields.get('summary'),
+                (fields.get('status') or {}).get('name'),
+                user_id(fields.get('assignee')),
+                (fields.get('priority') or {}).get('name'),
+                fields.get('created'),
+                fields.get('updated'),
+                json.dumps(raw, separators=(',', ':')),
+            ))
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO issues "
+                "(key, project, summary, status, assignee, priority, created, updated, raw) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+    
+    def apply(self, raw: Dict[str, Any]) -> bool:
+        """Write one pushed issue (e.g. from a webhook) if its project is mirrored
+        
+        The issue is trimmed to ``MIRROR_FIELDS``. An event older than the
+        stored copy, judged by ``updated``, is ignored, so out-of-order
+        deliveries cannot roll an issue back. Returns whether it was written.
+        """
+        fields = raw.get('fields', {})
+        project_key = ((fields.get('project') or {}).get('key') or raw['key'].rsplit('-', 1)[0]).upper()
+        if project_key not in self.projects:
+            return False
+        trimmed = {
+            'id': raw.get('id'),
+            'key': raw['key'],
+            'fields': {name: fields.get(name) for name in MIRROR_FIELDS},
+        }
+        with self._lock:
+            row = self._db.execute(
+                "SELECT updated FROM issues WHERE key = ?", (raw['key'],)
+            ).fetchone()
+        if row and row['updated'] and (fields.get('updated') or '') < row['updated']:
+            return False
+        self._upsert(project_key, [trimmed])
+        return True
+    
+    def delete(self, issue_key: str) -> bool:
+        """Remove one issue; returns whether it was present"""
+        with self._lock, self._db:
+            cursor = self._db.execute("DELETE FROM issues WHERE key = ?", (issue_key.upper(),))
+        return cursor.rowcount > 0
+    
+    def list_issues(
+        self,
+        project_key: str,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Return raw issues newest first, filtered like ``JiraClient.list_issues``"""
+        sql = "SELECT raw FROM issues WHERE project = ?"
+        params: List[Any] = [project_key.upper()]
+        if assignee:
+            sql += " AND assignee = ?"
+            params.append(assignee)
+        if status:
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY created DESC LIMIT ?"
+        params.append(limit)
+        
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [json.loads(row['raw']) for row in rows]
+    
+    def get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        """Return one raw issue from the mirror, or None"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT raw FROM issues WHERE key = ?", (issue_key.upper(),)
+            ).fetchone()
+        return json.loads(row['raw']) if row else None
+    
+    def close(self) -> None:
+        """Close the underlying database"""
+        with self._lock:
+            self._db.close()
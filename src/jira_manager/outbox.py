@@ -0,0 +1,385 @@
+"""Durable outbox that queues Jira writes locally and replays them in the background"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .core import NON_IDEMPOTENT_OPERATIONS
+from .exceptions import ConnectionError, JiraManagerError
+from .jql import Query
+from .throttle import backoff_delay, is_retryable, request_not_sent
+
+if TYPE_CHECKING:
+    from .core import JiraClient
+
+
+logger = logging.getLogger(__name__)
+
+# Writes whose pending payload absorbs a later write of the same kind
+COALESCED_OPS = frozenset({'update_issue', 'assign_issue'})
+
+# Comment entity property holding the idempotency key of a queued comment
+STAMP_PROPERTY = 'jira-manager.outbox'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ops (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    lane TEXT NOT NULL,
+    op TEXT NOT NULL,
+    args TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    merged_into INTEGER,
+    in_doubt INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    enqueued REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ops_lane ON ops (lane, state, id);
+CREATE INDEX IF NOT EXISTS idx_ops_state ON ops (state, id);
+"""
+
+
+def _retryable(error: BaseException, idempotent: bool = True) -> bool:
+    """Return whether a failed write may succeed later (Jira down or throttling)
+    
+    Writes that are not idempotent are retried only when Jira cannot have
+    applied them, as in ``throttle.is_retryable``.
+    """
+    seen: Optional[BaseException] = error
+    while seen is not None:
+        if getattr(seen, 'status_code', None) is not None:
+            return is_retryable(seen, idempotent)
+        if idempotent and isinstance(seen, (OSError, ConnectionError)):
+            return True
+        seen = seen.__cause__ or seen.__context__
+    return not idempotent and request_not_sent(error)
+
+
+def stamp_label(idempotency_key: str) -> str:
+    """Label stamped on an issue created from the outbox, derived from its key"""
+    return f"outbox-{hashlib.sha256(idempotency_key.encode('utf-8')).hexdigest()[:16]}"
+
+
+class Outbox:
+    """Queues writes in SQLite and returns at once; workers replay them to Jira
+    
+    Each write method stores the call and returns its idempotency key (a
+    new UUID unless one is given). Enqueueing a key that is already known
+    does nothing, so callers can retry freely. Writes to the same issue are
+    sent one at a time, in order; different issues proceed in parallel on
+    ``workers`` threads. A pending ``update_issue`` or ``assign_issue``
+    absorbs a later one of the same kind on the same issue, so only the
+    merged result is sent.
+    
+    Later writes can target an issue that is still queued for creation by
+    passing the create's idempotency key as ``issue_key``. A failure that
+    may be transient (connection errors, 429, 5xx) is retried with backoff
+    while the issue's later writes wait; other failures are recorded and
+    the issue's queue moves on. Creates, comments and transitions are not
+    idempotent, so they are retried only on 429 or when the request never
+    reached Jira.
+    
+    Created issues carry a ``stamp_label`` and comments a ``STAMP_PROPERTY``
+    entity property with their idempotency key. A write that was in flight
+    when the process died is looked up by that stamp on restart and sent
+    again only if Jira does not have it; a transition cut off that way is
+    marked failed for manual review. Updates and assignments are simply
+    sent again.
+    """
+    
+    def __init__(
+        self,
+        client: "JiraClient",
+        path: str = "jira_outbox.db",
+        workers: int = 4,
+        max_attempts: int = 20,
+        backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        poll_interval: float = 1.0
+    ):
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        with self._db:
+            # Writes cut off by a crash are sent again, after checking Jira for
+            # those that may not be repeated
+            unsafe = sorted(NON_IDEMPOTENT_OPERATIONS)
+            self._db.execute(
+                f"UPDATE ops SET state = 'pending', in_doubt = op IN ({','.join('?' * len(unsafe))}) "
+                "WHERE state = 'sending'",
+                unsafe
+            )
+    
+    def create_issue(self, summary: str, idempotency_key: Optional[str] = None, **kwargs: Any) -> str:
+        """Queue ``JiraClient.create_issue``; its own key starts a new issue queue"""
+        idempotency_key = idempotency_key or str(uuid.uuid4())
+        return self._enqueue('create_issue', idempotency_key, dict(kwargs, summary=summary),
+                             idempotency_key)
+    
+    def update_issue(self, issue_key: str, idempotency_key: Optional[str] = None, **fields: Any) -> str:
+        """Queue ``JiraClient.update_issue``, replayed as a single PUT"""
+        return self._enqueue('update_issue', issue_key, fields, idempotency_key)
+    
+    def add_comment(self, issue_key: str, comment: str, idempotency_key: Optional[str] = None) -> str:
+        """Queue ``JiraClient.add_comment``"""
+        return self._enqueue('add_comment', issue_key, {'comment': comment}, idempotency_key)
+    
+    def transition_issue(
+        self,
+        issue_key: str,
+        transition_name: str,
+        idempotency_key: Optional[str] = None
+    ) -> str:
+        """Queue ``JiraClient.transition_issue``"""
+        return self._enqueue('transition_issue', issue_key,
+                             {'transition_name': transition_name}, idempotency_key)
+    
+    def assign_issue(self, issue_key: str, assignee: str, idempotency_key: Optional[str] = None) -> str:
+        """Queue ``JiraClient.assign_issue``"""
+        return self._enqueue('assign_issue', issue_key, {'assignee': assignee}, idempotency_key)
+    
+    def _enqueue(self, op: str, lane: str, args: Dict[str, Any], idempotency_key: Optional[str]) -> str:
+        idempotency_key = idempotency_key or str(uuid.uuid4())
+        with self._changed, self._db:
+            if self._db.execute(
+                "SELECT 1 FROM ops WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone():
+                return idempotency_key
+            tail = None
+            if op in COALESCED_OPS:
+                tail = self._db.execute(
+                    "SELECT id, op, args, state FROM ops WHERE lane = ? "
+                    "AND state IN ('pending', 'sending') ORDER BY id DESC LIMIT 1",
+                    (lane,)
+                ).fetchone()
+            if tail is not None and tail['op'] == op and tail['state'] == 'pending':
+                merged = dict(json.loads(tail['args']), **args)
+                self._db.execute("UPDATE ops SET args = ? WHERE id = ?",
+                                 (json.dumps(merged), tail['id']))
+                state, merged_into = 'coalesced', tail['id']
+            else:
+                state, merged_into = 'pending', None
+            self._db.execute(
+                "INSERT INTO ops (idempotency_key, lane, op, args, state, merged_into, enqueued) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (idempotency_key, lane, op, json.dumps(args), state, merged_into, time.time())
+            )
+            self._changed.notify_all()
+        return idempotency_key
+    
+    def status(self, idempotency_key: str) -> Optional[Dict[str, Any]]:
+        """Return ``state``, ``result``, ``error`` and ``attempts`` of a queued write
+        
+        ``state`` is ``pending``, ``sending``, ``done`` or ``failed``; for a
+        coalesced write it is that of the write it was merged into. The
+        result of a create is the new issue key.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM ops WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()
+            if row is not None and row['merged_into'] is not None:
+                row = self._db.execute(
+                    "SELECT * FROM ops WHERE id = ?", (row['merged_into'],)
+                ).fetchone()
+        if row is None:
+            return None
+        return {
+            'state': row['state'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'attempts': row['attempts'],
+        }
+    
+    def pending(self) -> int:
+        """Number of writes not yet sent (or being sent)"""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM ops WHERE state IN ('pending', 'sending')"
+            ).fetchone()[0]
+    
+    def start(self) -> "Outbox":
+        """Start the worker threads that replay queued writes"""
+        self._stop.clear()
+        for n in range(self.workers - len(self._threads)):
+            thread = threading.Thread(target=self._work, name=f"outbox-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the workers once their current writes finish; queued writes stay queued"""
+        self._stop.set()
+        with self._changed:
+            self._changed.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued write was sent or failed; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while self._db.execute(
+                "SELECT 1 FROM ops WHERE state IN ('pending', 'sending') LIMIT 1"
+            ).fetchone():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._changed.wait(min(self.poll_interval, remaining or self.poll_interval))
+        return True
+    
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            row = self._claim()
+            if row is None:
+                with self._changed:
+                    self._changed.wait(self.poll_interval)
+                continue
+            self._send(row)
+    
+    def _claim(self) -> Optional[sqlite3.Row]:
+        """Take the oldest write at the head of an idle issue queue"""
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT * FROM ops WHERE id IN ("
+                "SELECT MIN(id) FROM ops WHERE state IN ('pending', 'sending') GROUP BY lane"
+                ") AND state = 'pending' AND next_attempt <= ? ORDER BY id LIMIT 1",
+                (time.time(),)
+            ).fetchone()
+            if row is not None:
+                self._db.execute("UPDATE ops SET state = 'sending' WHERE id = ?", (row['id'],))
+        return row
+    
+    def _send(self, row: sqlite3.Row) -> None:
+        op, lane, key = row['op'], row['lane'], row['idempotency_key']
+        args = json.loads(row['args'])
+        attempts = row['attempts'] + 1
+        result = None
+        if row['in_doubt']:
+            try:
+                result = self._find_applied(op, lane, key)
+            except Exception as e:
+                self._failed(row, attempts, e, _retryable(e))
+                return
+        if result is None:
+            try:
+                result = self._apply(op, lane, args, key)
+            except Exception as e:
+                self._failed(row, attempts, e, _retryable(e, op not in NON_IDEMPOTENT_OPERATIONS))
+                return
+        else:
+            logger.info(f"Outbox {op} on {lane} was applied before a restart: {result}")
+        with self._changed, self._db:
+            self._db.execute(
+                "UPDATE ops SET state = 'done', attempts = ?, result = ?, error = NULL WHERE id = ?",
+                (attempts, json.dumps(result), row['id'])
+            )
+            self._changed.notify_all()
+    
+    def _failed(self, row: sqlite3.Row, attempts: int, error: Exception, retryable: bool) -> None:
+        """Schedule a retry of a failed write, or record it as failed"""
+        retry = retryable and attempts < self.max_attempts
+        delay = backoff_delay(attempts - 1, self.backoff, self.max_backoff) if retry else 0.0
+        with self._changed, self._db:
+            self._db.execute(
+                "UPDATE ops SET state = ?, attempts = ?, next_attempt = ?, error = ? WHERE id = ?",
+                ('pending' if retry else 'failed', attempts, time.time() + delay, str(error), row['id'])
+            )
+            self._changed.notify_all()
+        if retry:
+            logger.warning(f"Outbox {row['op']} on {row['lane']} failed, retrying in {delay:.1f}s: {error}")
+        else:
+            logger.error(f"Outbox {row['op']} on {row['lane']} failed: {error}")
+    
+    def _apply(self, op: str, lane: str, args: Dict[str, Any], idempotency_key: str) -> Any:
+        """Run one write through the client; returns a JSON-serialisable result"""
+        if op == 'create_issue':
+            labels = list(args.get('labels') or []) + [stamp_label(idempotency_key)]
+            return self.client.create_issue(**dict(args, labels=labels)).key
+        issue_key = self._resolve(lane)
+        if op == 'update_issue':
+            self.client.update_issue(issue_key, fetch=False, **args)
+        elif op == 'add_comment':
+            comment = self.client.add_comment(
+                issue_key, args['comment'], properties={STAMP_PROPERTY: {'key': idempotency_key}}
+            )
+            return getattr(comment, 'id', None)
+        elif op == 'transition_issue':
+            self.client.transition_issue(issue_key, args['transition_name'])
+        elif op == 'assign_issue':
+            self.client.assign_issue(issue_key, args['assignee'])
+        else:
+            raise ValueError(f"Unknown outbox operation '{op}'")
+        return issue_key
+    
+    def _find_applied(self, op: str, lane: str, idempotency_key: str) -> Any:
+        """Look up a write cut off by a crash in Jira by its stamp
+        
+        Returns its result if Jira has it and None if it must be sent again.
+        """
+        client = self.client
+        if op == 'create_issue':
+            jql = str(Query().where('labels', stamp_label(idempotency_key)))
+            page, _ = client._search_page(jql, 0, 1, ['summary'])
+            return page[0]['key'] if page else None
+        if op == 'add_comment':
+            data = client._request(
+                'get_comments', client._jira._get_json, f"issue/{self._resolve(lane)}/comment",
+                params={'expand': 'properties', 'orderBy': '-created', 'maxResults': 100}
+            )
+            for comment in data.get('comments', []):
+                for prop in comment.get('properties') or []:
+                    if prop.get('key') == STAMP_PROPERTY and prop.get('value', {}).get('key') == idempotency_key:
+                        return comment['id']
+            return None
+        if op in NON_IDEMPOTENT_OPERATIONS:
+            raise JiraManagerError(
+                f"{op} was interrupted and may have been applied; check {lane} and queue it again"
+            )
+        return None
+    
+    def _resolve(self, lane: str) -> str:
+        """Map a create's idempotency key to the issue key it produced"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT state, result FROM ops WHERE idempotency_key = ? AND op = 'create_issue'",
+                (lane,)
+            ).fetchone()
+        if row is None:
+            return lane
+        if row['state'] != 'done':
+            raise ValueError(f"Issue queued as {lane} was not created: {row['state']}")
+        return json.loads(row['result'])
+    
+    def close(self) -> None:
+        self.stop()
+        with self._lock:
+            self._db.close()
+    
+    def __enter__(self) -> "Outbox":
+        return self.start()
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
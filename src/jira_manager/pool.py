@@ -0,0 +1,295 @@
+"""Bounded pool of JiraClients for many Jira sites and service accounts"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .cache import ClientCache
+from .config import Config
+from .core import JiraClient
+from .throttle import RequestScheduler
+
+
+logger = logging.getLogger(__name__)
+
+
+class FairGate:
+    """Global in-flight limit handed out round-robin between tenants
+    
+    While the limit is reached, a freed slot goes to the next tenant in turn
+    that has a call waiting, so a tenant with hundreds of queued calls gets
+    one slot per round like everyone else.
+    """
+    
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self._in_flight = 0
+        self._waiting: "OrderedDict[str, Deque[List[bool]]]" = OrderedDict()
+        self._cond = threading.Condition()
+    
+    def acquire(self, tenant: str) -> None:
+        with self._cond:
+            if self._in_flight < self.limit and not self._waiting:
+                self._in_flight += 1
+                return
+            ticket = [False]
+            self._waiting.setdefault(tenant, deque()).append(ticket)
+            while not ticket[0]:
+                self._cond.wait()
+    
+    def release(self) -> None:
+        with self._cond:
+            if not self._waiting:
+                self._in_flight -= 1
+                return
+            # Hand the slot straight to the next tenant in turn
+            tenant, queue = self._waiting.popitem(last=False)
+            queue.popleft()[0] = True
+            if queue:
+                self._waiting[tenant] = queue
+            self._cond.notify_all()
+
+
+class TenantScheduler(RequestScheduler):
+    """A tenant's own rate budget and retries, drawing on a shared ``FairGate``
+    
+    The gate slot is taken only after the tenant's rate token, and given
+    back before any retry sleep, so a throttled tenant holds no global slot
+    while it waits.
+    """
+    
+    def __init__(self, tenant: str, gate: FairGate, **options: Any):
+        super().__init__(**options)
+        self.tenant = tenant
+        self.gate = gate
+    
+    def call(self, func: Callable[..., Any], *args: Any, idempotent: bool = True, **kwargs: Any) -> Any:
+        return super().call(self._gated, func, *args, idempotent=idempotent, **kwargs)
+    
+    def _gated(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self.gate.acquire(self.tenant)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.gate.release()
+
+
+class _Tenant:
+    """Registration of one tenant; outlives its client across evictions"""
+    
+    def __init__(self, config: Config, scheduler: TenantScheduler):
+        self.config = config
+        self.scheduler = scheduler
+        self.client: Optional[JiraClient] = None
+        self.last_used = 0.0
+
+
+class JiraClientPool:
+    """Lazily created ``JiraClient`` per tenant, bounded and fairly scheduled
+    
+    Tenants are registered by name with their own site and credentials.
+    Each gets a ``TenantScheduler`` with its own rate and concurrency budget;
+    all of them share a ``FairGate`` capping calls in flight across the
+    pool. At most ``max_clients`` clients (and their connection pools) are
+    open: the least recently used idle one is closed to make room, and
+    clients idle for ``idle_timeout`` seconds are closed too. A tenant's
+    budget survives eviction; its client is rebuilt on next use.
+    
+    Clients are leased: ``get`` counts a lease that ``release`` gives back,
+    and ``lease`` does both. A leased client is never evicted, and one that
+    is replaced by ``register`` or detached by ``close`` while leased is
+    closed only when its last lease is released.
+    """
+    
+    def __init__(
+        self,
+        max_clients: int = 16,
+        idle_timeout: Optional[float] = 300.0,
+        max_in_flight: int = 32,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: int = 4,
+        cache_size: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        **client_options: Any
+    ):
+        """``rate``, ``burst`` and ``max_concurrency`` are per-tenant defaults
+        
+        With ``cache_size`` every client gets its own ``ClientCache``, as
+        issue keys are only unique within one site. Other keyword arguments
+        (e.g. ``instrumentation``, ``pool_size``) go to every ``JiraClient``.
+        """
+        if max_clients < 1:
+            raise ValueError("max_clients must be at least 1")
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.gate = FairGate(max_in_flight)
+        self.defaults = {'rate': rate, 'burst': burst, 'max_concurrency': max_concurrency}
+        self.cache_size = cache_size
+        self.client_options = client_options
+        self.evictions = 0
+        self._clock = clock
+        self._tenants: Dict[str, _Tenant] = {}
+        self._open: "OrderedDict[str, _Tenant]" = OrderedDict()
+        self._leases: Dict[JiraClient, int] = {}
+        # Clients detached while leased, closed on their last release
+        self._retired: Dict[JiraClient, str] = {}
+        self._lock = threading.Lock()
+    
+    def register(
+        self,
+        tenant: str,
+        config: Optional[Config] = None,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        **values: Any
+    ) -> None:
+        """Add or replace a tenant
+        
+        Pass a ``Config``, or its values as keywords (``url``, ``email``,
+        ``api_token``, ``project_key``...). Budget arguments override the
+        pool defaults for this tenant.
+        """
+        config = config or Config.from_dict(values)
+        options = {
+            'rate': rate if rate is not None else self.defaults['rate'],
+            'burst': burst if burst is not None else self.defaults['burst'],
+            'max_concurrency': max_concurrency or self.defaults['max_concurrency'],
+        }
+        entry = _Tenant(config, TenantScheduler(tenant, self.gate, **options))
+        closing = []
+        with self._lock:
+            previous = self._tenants.get(tenant)
+            self._tenants[tenant] = entry
+            self._open.pop(tenant, None)
+            if previous is not None and previous.client is not None:
+                closing = self._detach(tenant, previous.client)
+        self._close(closing)
+    
+    @property
+    def tenants(self) -> List[str]:
+        return list(self._tenants)
+    
+    def get(self, tenant: str) -> JiraClient:
+        """Lease the tenant's client, opening it (and evicting others) as needed
+        
+        Give it back with ``release`` when done.
+        """
+        with self._lock:
+            entry = self._tenants.get(tenant)
+            if entry is None:
+                raise KeyError(f"Unknown tenant '{tenant}'")
+            entry.last_used = self._clock()
+            if entry.client is None:
+                entry.client = JiraClient(
+                    entry.config,
+                    lazy=True,
+                    scheduler=entry.scheduler,
+                    cache=ClientCache(self.cache_size) if self.cache_size else None,
+                    **self.client_options
+                )
+            client = entry.client
+            self._leases[client] = self._leases.get(client, 0) + 1
+            self._open[tenant] = entry
+            self._open.move_to_end(tenant)
+            closing = self._evict(keep=tenant)
+        self._close(closing)
+        return client
+    
+    def release(self, client: JiraClient) -> None:
+        """Give back a client from ``get``, closing it if it was detached meanwhile"""
+        closing = []
+        with self._lock:
+            count = self._leases.get(client, 0)
+            if count < 1:
+                raise ValueError("Client is not leased from this pool")
+            if count > 1:
+                self._leases[client] = count - 1
+            else:
+                del self._leases[client]
+                if client in self._retired:
+                    closing.append((self._retired.pop(client), client))
+            for name, entry in self._open.items():
+                if entry.client is client:
+                    # Keep _open in last-used order, which _evict relies on
+                    entry.last_used = self._clock()
+                    self._open.move_to_end(name)
+                    break
+        self._close(closing)
+    
+    @contextmanager
+    def lease(self, tenant: str) -> Iterator[JiraClient]:
+        """Use the tenant's client, keeping it from being evicted meanwhile"""
+        client = self.get(tenant)
+        try:
+            yield client
+        finally:
+            self.release(client)
+    
+    def evict_idle(self) -> int:
+        """Close clients idle past ``idle_timeout``; returns how many"""
+        with self._lock:
+            closing = self._evict()
+        self._close(closing)
+        return len(closing)
+    
+    def _evict(self, keep: Optional[str] = None) -> List[Tuple[str, JiraClient]]:
+        """Detach clients over the size bound or idle timeout, LRU first
+        
+        Called with the lock held; the caller closes what is returned.
+        """
+        closing = []
+        now = self._clock()
+        for name, entry in list(self._open.items()):
+            over = len(self._open) > self.max_clients
+            idle = self.idle_timeout is not None and now - entry.last_used >= self.idle_timeout
+            if not over and not idle:
+                break
+            if self._leases.get(entry.client) or name == keep:
+                continue
+            del self._open[name]
+            closing.append((name, entry.client))
+            entry.client = None
+            self.evictions += 1
+        return closing
+    
+    def _detach(self, name: str, client: JiraClient) -> List[Tuple[str, JiraClient]]:
+        """Return the client to close now, or retire it until its last release
+        
+        Called with the lock held.
+        """
+        if self._leases.get(client):
+            self._retired[client] = name
+            return []
+        return [(name, client)]
+    
+    def close(self) -> None:
+        """Close every open client; leased ones once they are released"""
+        closing = []
+        with self._lock:
+            for name, entry in self._open.items():
+                closing += self._detach(name, entry.client)
+                entry.client = None
+            self._open.clear()
+        self._close(closing)
+    
+    @staticmethod
+    def _close(closing: List[Tuple[str, JiraClient]]) -> None:
+        for name, client in closing:
+            logger.debug(f"Closing Jira client for tenant {name}")
+            client.close()
+    
+    def __len__(self) -> int:
+        return len(self._open)
+    
+    def __enter__(self) -> "JiraClientPool":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,85 @@
+"""Lightweight issue records built straight from REST API JSON"""
+
+import sys
+from typing import Any, Dict, Optional
+
+
+def user_id(user: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return the identifier JQL uses for a user (name on Server, accountId on Cloud)"""
+    if not user:
+        return None
+    return user.get('name') or user.get('accountId') or user.get('emailAddress')
+
+
+def _name(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return the interned ``name`` of a status/priority-like object"""
+    if not value or value.get('name') is None:
+        return None
+    return sys.intern(value['name'])
+
+
+class IssueRecord:
+    """Compact, read-only view of one issue's projected fields
+    
+    Unlike python-jira ``Issue`` resources, a record keeps no raw JSON and no
+    attribute tree: the default projection is stored in slots, with status,
+    priority and assignee interned so repeated values share one string.
+    Projected fields beyond the defaults are kept as-is in ``extra``.
+    """
+    
+    __slots__ = ('id', 'key', 'summary', 'status', 'assignee', 'priority', 'updated', 'extra')
+    
+    # Fields with a dedicated slot; everything else goes to ``extra``
+    SLOT_FIELDS = frozenset({'summary', 'status', 'assignee', 'priority', 'updated'})
+    
+    def __init__(
+        self,
+        key: str,
+        id: Optional[str] = None,
+        summary: Optional[str] = None,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        priority: Optional[str] = None,
+        updated: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.key = key
+        self.id = id
+        self.summary = summary
+        self.status = status
+        self.assignee = assignee
+        self.priority = priority
+        self.updated = updated
+        self.extra = extra
+    
+    @classmethod
+    def from_json(cls, raw: Dict[str, Any]) -> "IssueRecord":
+        """Build a record from one issue of a search or issue response"""
+        fields = raw.get('fields') or {}
+        assignee = user_id(fields.get('assignee'))
+        extra = {k: v for k, v in fields.items() if k not in cls.SLOT_FIELDS}
+        return cls(
+            key=raw['key'],
+            id=raw.get('id'),
+            summary=fields.get('summary'),
+            status=_name(fields.get('status')),
+            assignee=sys.intern(assignee) if assignee else None,
+            priority=_name(fields.get('priority')),
+            updated=fields.get('updated'),
+            extra=extra or None
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a flat dictionary"""
+        data = {name: getattr(self, name) for name in self.__slots__ if name != 'extra'}
+        if self.extra:
+            data.update(self.extra)
+        return data
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"IssueRecord(key={self.key!r}, status={self.status!r}, summary={self.summary!r})"
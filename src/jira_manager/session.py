@@ -0,0 +1,97 @@
+"""Process-wide registry of pooled Jira connections"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# requests' own default size for per-host connection pools
+DEFAULT_POOL_SIZE = 10
+
+
+def configure_pool(session: Any, pool_size: Optional[int] = None, keep_alive: bool = True) -> None:
+    """Size the HTTP connection pool of a requests session and set keep-alive"""
+    if pool_size:
+        from requests.adapters import HTTPAdapter
+        
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+
+class ConnectionRegistry:
+    """Thread-safe cache of Jira connections keyed by (url, email, options)
+    
+    ``options`` are whatever shapes the connection (pool size, server info),
+    so clients asking for different ones get their own. A cached connection
+    is rebuilt, and the old one closed, when it is requested with a
+    different API token, so rotated credentials take effect without
+    restarting the process. Connections are built outside the registry
+    lock: a slow host only holds up clients waiting for that same key.
+    """
+    
+    def __init__(self):
+        self._connections: Dict[Tuple[str, str, Hashable], Tuple[str, Future]] = {}
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        url: str,
+        email: str,
+        api_token: str,
+        factory: Callable[[], Any],
+        options: Hashable = ()
+    ) -> Any:
+        """Return the shared connection for (url, email, options), creating it if needed"""
+        key = (url.rstrip('/'), email.lower(), options)
+        with self._lock:
+            cached = self._connections.get(key)
+            if cached is not None and cached[0] == api_token:
+                return cached[1].result()
+            future: Future = Future()
+            self._connections[key] = (api_token, future)
+        
+        try:
+            connection = factory()
+        except BaseException as e:
+            with self._lock:
+                if self._connections.get(key) == (api_token, future):
+                    del self._connections[key]
+            future.set_exception(e)
+            raise
+        future.set_result(connection)
+        logger.debug(f"Registered shared connection for {email} @ {url}")
+        if cached is not None:
+            _close(cached[1])
+        return connection
+    
+    def discard(self, url: str, email: str) -> None:
+        """Forget the shared connections for (url, email)"""
+        prefix = (url.rstrip('/'), email.lower())
+        with self._lock:
+            for key in [k for k in self._connections if k[:2] == prefix]:
+                del self._connections[key]
+    
+    def clear(self) -> None:
+        """Forget all shared connections"""
+        with self._lock:
+            self._connections.clear()
+    
+    def __len__(self) -> int:
+        return len(self._connections)
+
+
+def _close(future: Future) -> None:
+    """Close a replaced connection once it is built; one that failed is skipped"""
+    def close(done: Future) -> None:
+        if done.exception() is None:
+            done.result().close()
+    future.add_done_callback(close)
+
+
+# Connections shared by every JiraClient created with ``shared_session=True``
+registry = ConnectionRegistry()
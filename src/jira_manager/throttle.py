@@ -0,0 +1,233 @@
+"""Rate limiting, retries and adaptive concurrency for Jira requests"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Failures raised before a request reached Jira (refused connection, failed
+# DNS lookup, connect timeout) from requests/urllib3 and httpx
+_NOT_SENT_ERRORS = frozenset({
+    'ConnectTimeout',
+    'NewConnectionError',
+    'NameResolutionError',
+    'ConnectError',
+})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Convert a ``Retry-After`` header (seconds or HTTP date) to seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Return the delay requested by the failed response's ``Retry-After``"""
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not hasattr(headers, 'get'):
+        return None
+    return parse_retry_after(headers.get('Retry-After'))
+
+
+def request_not_sent(error: BaseException) -> bool:
+    """Return whether a failure happened before the request reached the server"""
+    pending = [error]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if type(current).__name__ in _NOT_SENT_ERRORS:
+            return True
+        # requests wraps urllib3's MaxRetryError, which keeps the cause in ``reason``
+        pending += [current.__cause__, current.__context__, getattr(current, 'reason', None)]
+        pending += [arg for arg in getattr(current, 'args', ()) if isinstance(arg, BaseException)]
+    return False
+
+
+def is_retryable(error: BaseException, idempotent: bool = True) -> bool:
+    """Return whether a failed call may be sent again
+    
+    A 5xx on a non-idempotent call (a POST creating an issue or comment)
+    may come after the write was applied, so those are only retried on 429
+    or when the request never left this host.
+    """
+    status = getattr(error, 'status_code', None)
+    if status is not None:
+        return status in RETRYABLE_STATUSES if idempotent else status == 429
+    return request_not_sent(error)
+
+
+def backoff_delay(attempt: int, backoff: float, max_backoff: float) -> float:
+    """Return a jittered exponential backoff delay for a retry attempt"""
+    ceiling = min(max_backoff, backoff * (2 ** attempt))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is free"""
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst or max(1, int(rate)))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+class RequestScheduler:
+    """Runs Jira calls under a shared rate limit with retries and backoff
+    
+    One scheduler can be shared by every client and thread in a process.
+    Failed calls with a retryable status, or that never reached the server,
+    are retried after the server's ``Retry-After`` delay, or after jittered
+    exponential backoff; see ``is_retryable`` for non-idempotent calls. Every 429
+    halves the concurrency limit (and the request rate when ``rate`` is
+    set). Each success grows them back additively, so bulk jobs settle at
+    the highest rate the server accepts.
+    """
+    
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 60.0,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1,
+        min_rate: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate) if rate else min_rate
+        self.bucket = TokenBucket(rate, burst, sleep=sleep) if rate else None
+        self._sleep = sleep
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._slots = threading.Condition()
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+    
+    @property
+    def concurrency_limit(self) -> int:
+        """Number of calls currently allowed in flight"""
+        return max(self.min_concurrency, int(self._limit))
+    
+    def call(self, func: Callable[..., Any], *args: Any, idempotent: bool = True, **kwargs: Any) -> Any:
+        """Call ``func`` under the scheduler's limits, retrying transient failures
+        
+        Pass ``idempotent=False`` for calls that must not run twice, such
+        as POSTs creating issues, comments or attachments.
+        """
+        attempt = 0
+        while True:
+            self._enter()
+            try:
+                if self.bucket is not None:
+                    self.bucket.acquire()
+                result = func(*args, **kwargs)
+            except Exception as e:
+                status = getattr(e, 'status_code', None)
+                if not is_retryable(e, idempotent) or attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(e, attempt)
+            else:
+                self._on_success()
+                return result
+            finally:
+                self._leave()
+            
+            self._on_retry(status)
+            attempt += 1
+            reason = f"Jira returned HTTP {status}" if status else "Could not reach Jira"
+            logger.warning(f"{reason}; retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            self._sleep(delay)
+    
+    def _retry_delay(self, error: BaseException, attempt: int) -> float:
+        """Honor Retry-After, else use full-jitter exponential backoff"""
+        delay = retry_after_seconds(error)
+        if delay is not None:
+            return min(delay, self.max_backoff)
+        return backoff_delay(attempt, self.backoff, self.max_backoff)
+    
+    def _enter(self) -> None:
+        with self._slots:
+            while self._in_flight >= self.concurrency_limit:
+                self._slots.wait()
+            self._in_flight += 1
+            self.requests += 1
+    
+    def _leave(self) -> None:
+        with self._slots:
+            self._in_flight -= 1
+            self._slots.notify()
+    
+    def _on_success(self) -> None:
+        """Additive increase of the concurrency limit and request rate"""
+        with self._slots:
+            if self._limit < self.max_concurrency:
+                self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+                self._slots.notify_all()
+            if self.bucket is not None and self.bucket.rate < self.max_rate:
+                self.bucket.rate = min(self.max_rate, self.bucket.rate + 0.1)
+    
+    def _on_retry(self, status: Optional[int]) -> None:
+        """Count a retry; on 429 cut the concurrency limit and request rate"""
+        with self._slots:
+            self.retries += 1
+            if status != 429:
+                return
+            self.throttled += 1
+            self._limit = max(float(self.min_concurrency), self._limit / 2)
+            if self.bucket is not None:
+                self.bucket.rate = max(self.min_rate, self.bucket.rate / 2)
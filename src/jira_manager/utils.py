@@ -0,0 +1,91 @@
+"""Helper functions for Jira Manager"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split an iterable into lists of at most ``size`` items"""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int = 4
+) -> List[R]:
+    """Apply ``func`` to every item on a bounded thread pool, preserving order"""
+    items = list(items)
+    if concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class MicroBatcher:
+    """Merges lookups made within a short window into one bulk fetch
+    
+    The first caller in a window waits ``window`` seconds, then calls
+    ``fetch_many`` once with every key requested in the meantime (split into
+    chunks of ``max_batch``). Each ``get`` returns that key's value, or
+    ``default`` when ``fetch_many`` did not return it or the fetch failed,
+    so the caller can fall back to a single lookup.
+    """
+    
+    def __init__(
+        self,
+        fetch_many: Callable[[List[Hashable]], Dict[Hashable, R]],
+        window: float = 0.005,
+        max_batch: int = 100,
+        default: object = None
+    ):
+        self.fetch_many = fetch_many
+        self.window = window
+        self.max_batch = max_batch
+        self.default = default
+        self._pending: Dict[Hashable, Future] = {}
+        self._collecting = False
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> R:
+        """Return the value for ``key`` from the next batch"""
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+            leader = not self._collecting
+            self._collecting = True
+        
+        if leader:
+            time.sleep(self.window)
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._collecting = False
+            self._run(pending)
+        return future.result()
+    
+    def _run(self, pending: Dict[Hashable, Future]) -> None:
+        for keys in chunked(list(pending), self.max_batch):
+            try:
+                found = self.fetch_many(keys)
+            except Exception as e:
+                logger.warning(f"Batched lookup of {len(keys)} keys failed, falling back: {e}")
+                found = {}
+            for key in keys:
+                pending[key].set_result(found.get(key, self.default))
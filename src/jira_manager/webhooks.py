@@ -0,0 +1,231 @@
+"""Webhook receiver that keeps the client cache and issue mirror current"""
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
+
+from .jql import Query
+
+if TYPE_CHECKING:
+    from .cache import ClientCache
+    from .core import JiraClient
+    from .mirror import IssueMirror
+
+
+logger = logging.getLogger(__name__)
+
+# Jira webhook events that carry an issue payload
+ISSUE_EVENTS = frozenset({
+    'jira:issue_created',
+    'jira:issue_updated',
+    'jira:issue_deleted',
+})
+
+# Extra minutes re-checked by every reconcile pass to absorb clock skew
+RECONCILE_OVERLAP_MINUTES = 5
+
+# Issues whose last seen ``updated`` timestamp is remembered to drop late events
+TRACKED_ISSUES = 100_000
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check an ``X-Hub-Signature: sha256=<hex>`` header against the body"""
+    if not signature or '=' not in signature:
+        return False
+    method, _, received = signature.partition('=')
+    if method.lower() != 'sha256':
+        return False
+    expected = hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, received)
+
+
+class WebhookProcessor:
+    """Applies Jira issue events to a ``ClientCache`` and/or ``IssueMirror``
+    
+    Created and updated issues are written to the mirror and replace the
+    cached ``get_issue`` result; deleted issues are removed from both. Cached
+    searches are dropped on every applied event. An event older than the
+    last one applied for the same issue, judged by its ``updated`` field,
+    is ignored. ``reconcile`` repairs anything a missed delivery left stale.
+    """
+    
+    def __init__(
+        self,
+        client: Optional["JiraClient"] = None,
+        cache: Optional["ClientCache"] = None,
+        mirror: Optional["IssueMirror"] = None,
+        projects: Optional[Iterable[str]] = None
+    ):
+        """Attach to ``client``'s cache and mirror unless others are given
+        
+        ``projects`` limits which events are applied; by default every
+        project is accepted (the mirror still keeps only its own).
+        """
+        self.client = client
+        self.cache = cache if cache is not None else getattr(client, 'cache', None)
+        self.mirror = mirror if mirror is not None else getattr(client, 'mirror', None)
+        self.projects = {p.upper() for p in projects} if projects else None
+        self.applied = 0
+        self.ignored = 0
+        self.failed = 0
+        self.last_reconcile = time.time()
+        self._seen: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def handle(self, payload: Dict[str, Any]) -> bool:
+        """Apply one webhook payload; returns whether it changed anything
+        
+        A payload that fails to apply is logged and counted in ``failed``
+        rather than raised, so one bad event does not stop a receiver.
+        """
+        try:
+            return self._handle(payload)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Failed to apply webhook: {e}")
+            return False
+    
+    def _handle(self, payload: Dict[str, Any]) -> bool:
+        event = payload.get('webhookEvent')
+        raw = payload.get('issue')
+        if event not in ISSUE_EVENTS or not raw or 'key' not in raw:
+            self.ignored += 1
+            return False
+        issue_key = raw['key']
+        if self.projects is not None and issue_key.rsplit('-', 1)[0].upper() not in self.projects:
+            self.ignored += 1
+            return False
+        
+        with self._lock:
+            updated = (raw.get('fields') or {}).get('updated') or ''
+            last = self._seen.get(issue_key)
+            if updated and last is not None and updated < last:
+                self.ignored += 1
+                logger.debug(f"Ignored {event} for {issue_key} older than {last}")
+                return False
+            if updated:
+                self._seen[issue_key] = updated
+                self._seen.move_to_end(issue_key)
+                if len(self._seen) > TRACKED_ISSUES:
+                    self._seen.popitem(last=False)
+            if event == 'jira:issue_deleted':
+                if self.mirror is not None:
+                    self.mirror.delete(issue_key)
+                self._drop(issue_key)
+            else:
+                if self.mirror is not None:
+                    self.mirror.apply(raw)
+                self._refresh(issue_key, raw)
+            self.applied += 1
+        logger.debug(f"Applied {event} for {issue_key}")
+        return True
+    
+    def _refresh(self, issue_key: str, raw: Dict[str, Any]) -> None:
+        """Replace the cached issue with the pushed copy"""
+        if self.cache is None:
+            return
+        self.cache.invalidate('search')
+        if self.client is not None and raw.get('fields'):
+            self.cache.set('issue', issue_key, self.client._issue_from_raw(raw))
+        else:
+            self.cache.invalidate('issue', issue_key)
+    
+    def _drop(self, issue_key: str) -> None:
+        if self.cache is not None:
+            self.cache.invalidate('issue', issue_key)
+            self.cache.invalidate('search')
+    
+    def reconcile(self, full: bool = False) -> int:
+        """Catch up on events that were never delivered
+        
+        Runs an incremental mirror sync (a full one with ``full=True``, which
+        also drops deleted issues) and evicts cached issues updated since the
+        previous pass. Needs ``client``. Returns the number of issues touched.
+        """
+        if self.client is None:
+            raise ValueError("reconcile needs a JiraClient")
+        started = time.time()
+        touched = 0
+        if self.mirror is not None:
+            touched += self.mirror.sync(self.client, full=full)
+        if self.cache is not None:
+            minutes = int((started - self.last_reconcile) / 60) + RECONCILE_OVERLAP_MINUTES
+            query = Query().where('updated', f'-{minutes}m', '>=')
+            if self.projects:
+                query = query.where('project', sorted(self.projects), 'IN')
+            for record in self.client.iter_issues(str(query), fields=['updated'], records=True):
+                self._drop(record.key)
+                touched += 1
+        self.last_reconcile = started
+        logger.info(f"Webhook reconcile touched {touched} issues")
+        return touched
+
+
+def serve_webhooks(
+    processor: WebhookProcessor,
+    host: str = '127.0.0.1',
+    port: int = 8085,
+    path: str = '/webhooks',
+    secret: Optional[str] = None,
+    reconcile_interval: Optional[float] = None
+) -> Any:
+    """Receive Jira webhooks at ``path`` on a daemon thread
+    
+    With ``secret`` every delivery must carry a valid ``X-Hub-Signature``.
+    With ``reconcile_interval`` (seconds) ``processor.reconcile`` also runs
+    periodically. Returns the ``ThreadingHTTPServer``; call ``shutdown()``
+    on it to stop both.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            if self.path.split('?')[0] != path:
+                self.send_error(404)
+                return
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            if secret and not verify_signature(secret, body, self.headers.get('X-Hub-Signature')):
+                logger.warning("Rejected webhook with a missing or bad signature")
+                self.send_error(401)
+                return
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                self.send_error(400)
+                return
+            processor.handle(payload)
+            self.send_response(204)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+    
+    stop = threading.Event()
+    
+    class WebhookServer(ThreadingHTTPServer):
+        daemon_threads = True
+        
+        def shutdown(self) -> None:
+            stop.set()
+            super().shutdown()
+    
+    def reconcile_loop() -> None:
+        while not stop.wait(reconcile_interval):
+            try:
+                processor.reconcile()
+            except Exception as e:
+                logger.error(f"Webhook reconcile failed: {e}")
+    
+    server = WebhookServer((host, port), WebhookHandler)
+    server.thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server.thread.start()
+    if reconcile_interval:
+        threading.Thread(target=reconcile_loop, daemon=True).start()
+    logger.info(f"Receiving webhooks on http://{host}:{server.server_port}{path}")
+    return server
@@ -1,7 +1,10 @@
 """Tests for Jira Manager"""
 
+import json
+import re
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from jira import JIRAError
 from src.jira_manager import JiraClient, Config
 from src.jira_manager.exceptions import (
     AuthenticationError,
@@ -33,6 +36,28 @@ class TestConfig:
         assert config.jira_email == 'test@example.com'
         assert config.jira_api_token == 'test-token'
         assert config.project_key == 'TEST'
+    
+    @patch.dict('os.environ', {'JIRA_URL': 'https://env.atlassian.net'})
+    def test_config_ini_reload(self, tmp_path, monkeypatch):
+        """Test env-style keys in config.ini and picking up an edited file"""
+        import os
+        
+        monkeypatch.chdir(tmp_path)
+        for name in ('JIRA_EMAIL', 'JIRA_API_TOKEN', 'JIRA_PROJECT_KEY'):
+            monkeypatch.delenv(name, raising=False)
+        ini = tmp_path / 'config.ini'
+        ini.write_text('[jira]\nJIRA_EMAIL = a@example.com\nJIRA_API_TOKEN = old\n')
+        config = Config(str(ini), reload_interval=0)
+        
+        assert config.jira_url == 'https://env.atlassian.net'
+        assert config.jira_email == 'a@example.com'
+        assert config.get('JIRA_API_TOKEN') == config.get('api_token') == 'old'
+        version = config.version
+        
+        ini.write_text('[jira]\nJIRA_EMAIL = a@example.com\nJIRA_API_TOKEN = rotated\n')
+        os.utime(ini, ns=(0, 0))
+        assert config.jira_api_token == 'rotated'
+        assert config.version != version
 
 
 class TestJiraClient:
@@ -120,5 +145,1821 @@ class TestJiraClient:
             mock_jira_instance.add_comment.assert_called_once_with('TEST-123', 'Test comment')
 
 
+    @patch('src.jira_manager.core.JIRA')
+    def test_iter_issues_walks_pages(self, mock_jira):
+        """Test iterating issues page by page until the total is reached"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            # Setup mock
+            pages = {
+                0: {'total': 5, 'issues': [{'key': 'TEST-1'}, {'key': 'TEST-2'}]},
+                2: {'total': 5, 'issues': [{'key': 'TEST-3'}, {'key': 'TEST-4'}]},
+                4: {'total': 5, 'issues': [{'key': 'TEST-5'}]},
+            }
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = (
+                lambda jql, startAt, **kwargs: pages[startAt]
+            )
+            
+            # Test
+            client = JiraClient()
+            keys = [i.key for i in client.iter_issues('project = TEST', page_size=2)]
+            
+            assert keys == ['TEST-1', 'TEST-2', 'TEST-3', 'TEST-4', 'TEST-5']
+            assert mock_jira_instance.search_issues.call_count == 3
+
+
+    @patch('src.jira_manager.core.JIRA')
+    def test_bulk_create_issues(self, mock_jira):
+        """Test bulk creation batches rows and reports per-row results"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            # Setup mock
+            def create_issues(field_list, prefetch=True):
+                results = []
+                for fields in field_list:
+                    if fields['summary'] == 'bad':
+                        results.append({'status': 'Error', 'issue': None,
+                                        'error': {'summary': 'invalid'}})
+                    else:
+                        issue = MagicMock()
+                        issue.key = f"TEST-{fields['summary']}"
+                        results.append({'status': 'Success', 'issue': issue, 'error': None})
+                return results
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.create_issues.side_effect = create_issues
+            
+            # Test
+            rows = [{'summary': str(n)} for n in range(120)]
+            rows[75] = {'summary': 'bad'}
+            client = JiraClient()
+            results = client.bulk_create_issues(rows, concurrency=3)
+            
+            assert mock_jira_instance.create_issues.call_count == 3
+            assert [r['row'] for r in results] == list(range(120))
+            assert results[0]['key'] == 'TEST-0'
+            assert results[75]['status'] == 'Error'
+            assert results[119]['key'] == 'TEST-119'
+
+
+    @patch('src.jira_manager.core.JIRA')
+    def test_search_issues_default_projection(self, mock_jira):
+        """Test search requests a minimal field set unless told otherwise"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = []
+            
+            client = JiraClient()
+            client.list_issues()
+            _, kwargs = mock_jira_instance.search_issues.call_args
+            assert kwargs['fields'] == ['summary', 'status', 'assignee', 'priority', 'updated']
+            assert kwargs['expand'] is None
+            
+            client.search_issues('project = TEST', all_fields=True, expand=['changelog'])
+            _, kwargs = mock_jira_instance.search_issues.call_args
+            assert kwargs['fields'] == '*all'
+            assert kwargs['expand'] == 'changelog'
+            
+            with pytest.raises(ValueError):
+                client.search_issues('project = TEST', expand=['everything'])
+
+
+    @patch('src.jira_manager.core.JIRA')
+    def test_shared_session_reused(self, mock_jira):
+        """Test clients with shared_session reuse one registered connection"""
+        from src.jira_manager.session import registry
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            registry.clear()
+            try:
+                first = JiraClient(shared_session=True, server_info=False, pool_size=32)
+                second = JiraClient(shared_session=True, server_info=False, pool_size=32)
+                
+                assert first._jira is second._jira
+                mock_jira.assert_called_once()
+                assert mock_jira.call_args.kwargs['get_server_info'] is False
+                
+                with patch.dict('os.environ', {'JIRA_API_TOKEN': 'rotated-token'}):
+                    JiraClient(shared_session=True, server_info=False, pool_size=32)
+                assert mock_jira.call_count == 2
+                # The connection built with the old token is closed
+                mock_jira.return_value.close.assert_called_once()
+                
+                # Different connection options get a connection of their own
+                JiraClient(shared_session=True, server_info=False, pool_size=8)
+                assert mock_jira.call_count == 3
+            finally:
+                registry.clear()
+    
+    def test_shared_session_reports_to_each_clients_instrumentation(self):
+        """Test responses on a shared session reach only the client that made them"""
+        from benchmarks.mock_jira import MockJiraServer
+        from src.jira_manager.metrics import MetricsRecorder
+        from src.jira_manager.session import registry
+        
+        with MockJiraServer() as server:
+            server.jira.seed_issues(2, 'TEST')
+            config = Config.from_dict({
+                'url': server.url, 'email': 'test@example.com',
+                'api_token': 'test-token', 'project_key': 'TEST',
+            })
+            registry.clear()
+            try:
+                plain = JiraClient(config, shared_session=True, server_info=False)
+                recorder = MetricsRecorder()
+                measured = JiraClient(config, shared_session=True, server_info=False,
+                                      instrumentation=recorder)
+                assert plain._jira is measured._jira
+                
+                plain.get_issue('TEST-1')
+                measured.get_issue('TEST-2')
+                
+                endpoints = recorder.snapshot()['endpoints']
+                assert endpoints['GET /rest/api/2/issue/{key}']['count'] == 1
+            finally:
+                registry.clear()
+    
+    def test_shared_connections_are_built_outside_the_registry_lock(self):
+        """Test a slow host does not hold up connections to other hosts"""
+        import threading
+        from src.jira_manager.session import ConnectionRegistry
+        
+        registry = ConnectionRegistry()
+        started, release = threading.Event(), threading.Event()
+        
+        def slow():
+            started.set()
+            release.wait(5)
+            return 'slow connection'
+        
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(
+            registry.get('https://slow.example.com', 'a@example.com', 't', slow)
+        ))
+        waiter.start()
+        assert started.wait(5)
+        assert registry.get('https://fast.example.com', 'a@example.com', 't', lambda: 'fast') == 'fast'
+        release.set()
+        waiter.join(5)
+        assert results == ['slow connection']
+        assert registry.get('https://slow.example.com', 'a@example.com', 't', slow) == 'slow connection'
+
+
+    @patch('src.jira_manager.core.JIRA')
+    def test_lazy_client_connects_on_first_call(self, mock_jira):
+        """Test lazy clients defer connecting until the first API call"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            client = JiraClient(lazy=True)
+            mock_jira.assert_not_called()
+            
+            client.get_issue('TEST-1')
+            client.get_issue('TEST-2')
+            mock_jira.assert_called_once()
+
+
+    @patch('src.jira_manager.core.JIRA')
+    def test_bulk_transition_resolves_once_per_state(self, mock_jira):
+        """Test bulk transitions look up transition ids once per workflow state"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            # Setup mock
+            state = {
+                'project': {'key': 'TEST'},
+                'issuetype': {'name': 'Task'},
+                'status': {'name': 'In Progress'},
+            }
+            issues = [{'key': f'TEST-{n}', 'fields': state} for n in range(10)]
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 10, 'issues': issues}
+            mock_jira_instance.transitions.return_value = [
+                {'id': '31', 'name': 'Done'}, {'id': '11', 'name': 'To Do'}
+            ]
+            
+            # Test
+            client = JiraClient()
+            keys = [f'TEST-{n}' for n in range(10)] + ['TEST-404']
+            results = client.bulk_transition(keys, 'done', concurrency=4)
+            
+            assert mock_jira_instance.search_issues.call_count == 1
+            assert mock_jira_instance.transitions.call_count == 1
+            assert mock_jira_instance.transition_issue.call_count == 10
+            mock_jira_instance.transition_issue.assert_any_call('TEST-3', '31')
+            assert results[-1] == {'key': 'TEST-404', 'status': 'Error', 'error': 'Issue not found'}
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_search_issues_as_records(self, mock_jira):
+        """Test records=True builds compact records from the page JSON"""
+        from src.jira_manager.records import IssueRecord
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            raw = {
+                'id': '10001',
+                'key': 'TEST-1',
+                'fields': {
+                    'summary': 'Compact',
+                    'status': {'name': 'Done', 'id': '3', 'iconUrl': 'x'},
+                    'assignee': {'name': 'alice', 'displayName': 'Alice'},
+                    'priority': None,
+                    'labels': ['a'],
+                },
+            }
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 1, 'issues': [raw]}
+            
+            client = JiraClient()
+            issues = client.search_issues('project = TEST', records=True)
+            
+            assert issues == [IssueRecord(
+                key='TEST-1', id='10001', summary='Compact', status='Done',
+                assignee='alice', extra={'labels': ['a']}
+            )]
+            assert not hasattr(issues[0], '__dict__')
+            assert mock_jira_instance.search_issues.call_args.kwargs['json_result'] is True
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_search_records_without_limit(self, mock_jira):
+        """Test records=True with max_results=None pages until exhausted"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def search_issues(jql, startAt, maxResults, **kwargs):
+                keys = range(startAt, min(startAt + maxResults, 250))
+                return {'total': 250, 'issues': [{'key': f'TEST-{n}', 'fields': {}} for n in keys]}
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search_issues
+            
+            client = JiraClient()
+            issues = client.search_issues('project = TEST', max_results=None, records=True)
+            
+            assert [i.key for i in issues] == [f'TEST-{n}' for n in range(250)]
+            assert mock_jira_instance.search_issues.call_count == 3
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_bulk_update_sends_only_changed_fields(self, mock_jira):
+        """Test bulk updates diff against one projected search"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 2, 'issues': [
+                {'key': 'TEST-1', 'fields': {'priority': {'id': '2', 'name': 'High'},
+                                             'labels': ['b', 'a']}},
+                {'key': 'TEST-2', 'fields': {'priority': {'id': '3', 'name': 'Low'},
+                                             'labels': ['a']}},
+            ]}
+            mock_jira_instance._get_url.side_effect = lambda path: f'https://jira/{path}'
+            
+            client = JiraClient()
+            wanted = {'priority': {'name': 'High'}, 'labels': ['a', 'b']}
+            results = client.bulk_update({'TEST-1': wanted, 'TEST-2': wanted})
+            
+            assert mock_jira_instance.search_issues.call_count == 1
+            assert [r['status'] for r in results] == ['Unchanged', 'Updated']
+            mock_jira_instance._session.put.assert_called_once_with(
+                'https://jira/issue/TEST-2', data=json.dumps({'fields': wanted})
+            )
+            mock_jira_instance.issue.assert_not_called()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_bulk_comment_skips_existing(self, mock_jira):
+        """Test bulk comments are not posted twice"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 2, 'issues': [
+                {'key': 'TEST-1', 'fields': {'comment': {'comments': [{'body': 'Released'}]}}},
+                {'key': 'TEST-2', 'fields': {'comment': {'comments': []}}},
+            ]}
+            
+            client = JiraClient()
+            results = client.bulk_comment(['TEST-1', 'TEST-2'], 'Released')
+            
+            assert [r['status'] for r in results] == ['Skipped', 'Added']
+            mock_jira_instance.add_comment.assert_called_once_with('TEST-2', 'Released')
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_identical_searches_share_one_request(self, mock_jira):
+        """Test concurrent equal queries coalesce and results are cached"""
+        import threading
+        import time
+        from src.jira_manager.cache import ClientCache
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            release = threading.Event()
+            
+            def search(jql, **kwargs):
+                release.wait(5)
+                return ['TEST-1']
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search
+            client = JiraClient(cache=ClientCache())
+            
+            results = []
+            queries = ['project = TEST order by key', 'project=TEST  ORDER BY key'] * 3
+            threads = [
+                threading.Thread(target=lambda q=q: results.append(client.search_issues(q)))
+                for q in queries
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join()
+            
+            assert results == [['TEST-1']] * 6
+            assert mock_jira_instance.search_issues.call_count == 1
+            client.search_issues('project = TEST  order by key')
+            assert mock_jira_instance.search_issues.call_count == 1
+            
+            # A write through the client drops cached searches
+            client.add_comment('TEST-1', 'hi')
+            client.search_issues('project = TEST ORDER BY key')
+            assert mock_jira_instance.search_issues.call_count == 2
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_get_issue_coalesces_and_batches(self, mock_jira):
+        """Test concurrent get_issue calls become one search plus fallbacks"""
+        import threading
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 2, 'issues': [
+                {'id': '1', 'key': 'TEST-1', 'fields': {'summary': 'One'}},
+                {'id': '2', 'key': 'TEST-2', 'fields': {'summary': 'Two'}},
+            ]}
+            moved = Mock(key='NEW-7')
+            mock_jira_instance.issue.return_value = moved
+            
+            client = JiraClient(batch_window=0.1)
+            results = {}
+            keys = ['TEST-1', 'TEST-2', 'TEST-1', 'OLD-7', 'TEST-2']
+            threads = [
+                threading.Thread(target=lambda i=i, k=k: results.__setitem__(i, client.get_issue(k)))
+                for i, k in enumerate(keys)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            
+            assert [results[i].key for i in range(5)] == ['TEST-1', 'TEST-2', 'TEST-1', 'NEW-7', 'TEST-2']
+            assert mock_jira_instance.search_issues.call_count == 1
+            jql = mock_jira_instance.search_issues.call_args.args[0]
+            assert jql.startswith('key IN ("') and jql.count('TEST-1') == 1
+            # The key the search did not return falls back to a plain GET
+            mock_jira_instance.issue.assert_called_once_with('OLD-7')
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_batch_fetch_isolates_missing_key(self, mock_jira):
+        """Test a key Jira rejects does not fail the rest of its batch"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            state = {
+                'project': {'key': 'TEST'},
+                'issuetype': {'name': 'Task'},
+                'status': {'name': 'To Do'},
+            }
+            
+            def search(jql, **kwargs):
+                if '"TEST-404"' in jql:
+                    raise JIRAError(status_code=400, text="An issue with key 'TEST-404' does not exist")
+                keys = re.findall(r'"([^"]+)"', jql)
+                return {'total': len(keys), 'issues': [{'key': k, 'fields': state} for k in keys]}
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search
+            mock_jira_instance.transitions.return_value = [{'id': '31', 'name': 'Done'}]
+            
+            client = JiraClient()
+            keys = [f'TEST-{n}' for n in range(1, 8)] + ['TEST-404']
+            results = client.bulk_transition(keys, 'Done')
+            
+            assert [r['status'] for r in results] == ['Success'] * 7 + ['Error']
+            assert results[-1]['error'] == 'Issue not found'
+            assert 'key IN ("TEST-1", "TEST-2"' in mock_jira_instance.search_issues.call_args_list[0].args[0]
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_list_issues_quotes_values(self, mock_jira):
+        """Test list_issues escapes user-supplied values"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = []
+            
+            client = JiraClient()
+            client.list_issues(assignee='o"brien OR 1=1', status="Won't Fix")
+            jql = mock_jira_instance.search_issues.call_args.args[0]
+            assert jql == (
+                'assignee = "o\\"brien OR 1=1" AND project = "TEST" '
+                'AND status = "Won\'t Fix" ORDER BY created DESC'
+            )
+            
+            client.list_issues(assignee='currentUser()')
+            assert mock_jira_instance.search_issues.call_args.args[0].startswith(
+                'assignee = currentUser() AND'
+            )
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_parallel_search_by_offset_dedupes(self, mock_jira):
+        """Test parallel search fetches offsets concurrently and merges in order"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            issues = [{'id': str(n), 'key': f'TEST-{n}'} for n in range(1, 8)]
+            # An issue shifted between pages shows up twice
+            pages = {0: issues[0:3], 3: issues[2:5], 6: issues[5:7]}
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = (
+                lambda jql, startAt, maxResults, **kwargs: {'total': 8, 'issues': pages[startAt]}
+            )
+            
+            client = JiraClient()
+            found = client.search_issues(
+                'project = TEST ORDER BY key', max_results=None, records=True, concurrency=4
+            )
+            
+            assert [r.key for r in found] == [f'TEST-{n}' for n in range(1, 8)]
+            starts = sorted(c.kwargs['startAt'] for c in mock_jira_instance.search_issues.call_args_list)
+            assert starts == [0, 3, 6]
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_parallel_search_shards_by_id(self, mock_jira):
+        """Test id sharding covers the whole range with open-ended outer windows"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def search(jql, startAt, maxResults, **kwargs):
+                if jql.endswith('ORDER BY id ASC') and maxResults == 1:
+                    return {'total': 1, 'issues': [{'id': '100', 'key': 'TEST-1'}]}
+                if jql.endswith('ORDER BY id DESC'):
+                    return {'total': 1, 'issues': [{'id': '139', 'key': 'TEST-40'}]}
+                return {'total': 1, 'issues': [{'id': jql, 'key': jql}]}
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search
+            
+            client = JiraClient()
+            found = client.search_parallel(
+                'status = Open ORDER BY updated DESC', concurrency=4, shard_by='id'
+            )
+            
+            assert [raw['key'] for raw in found] == [
+                '(status = Open) AND id < 110 ORDER BY id ASC',
+                '(status = Open) AND id >= 110 AND id < 120 ORDER BY id ASC',
+                '(status = Open) AND id >= 120 AND id < 130 ORDER BY id ASC',
+                '(status = Open) AND id >= 130 ORDER BY id ASC',
+            ]
+            with pytest.raises(ValueError):
+                client.search_parallel('project = TEST', shard_by='random')
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_cloud_recognised_without_server_info(self, mock_jira):
+        """Test an atlassian.net host marks the connection as Cloud when serverInfo is skipped"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira.return_value.deploymentType = None
+            assert JiraClient(server_info=False)._jira.deploymentType == 'Cloud'
+            
+            mock_jira.return_value.deploymentType = None
+            assert JiraClient(server_info=False, cloud=False)._jira.deploymentType == 'Server'
+    
+    def test_cloud_searches_without_server_info(self):
+        """Test every search path avoids the removed legacy endpoint on Cloud"""
+        from benchmarks.mock_jira import MockJiraServer
+        
+        with MockJiraServer(cloud=True, max_page_size=3) as server:
+            server.jira.seed_issues(7, 'TEST')
+            config = Config.from_dict({
+                'url': server.url, 'email': 'test@example.com',
+                'api_token': 'test-token', 'project_key': 'TEST',
+            })
+            client = JiraClient(config, server_info=False, cloud=True)
+            
+            assert len(list(client.iter_issues('project = TEST ORDER BY id', page_size=3))) == 7
+            assert len(client.search_issues('project = TEST', max_results=3)) == 3
+            assert len(client.search_parallel('project = TEST', concurrency=2)) == 7
+            assert sorted(client._fetch_raw_issues(['TEST-1', 'TEST-7'], ['summary'])) == ['TEST-1', 'TEST-7']
+            assert server.jira.requests.get(('GET', 'search'), 0) == 0
+            assert server.jira.requests.get(('POST', 'search'), 0) == 0
+            assert ('GET', 'serverInfo') not in server.jira.requests
+            client.close()
+
+
+class TestJql:
+    """Test the JQL builder"""
+    
+    def test_query_is_escaped_and_canonical(self):
+        """Test clause order and spacing do not change the query text"""
+        from src.jira_manager.jql import Query, canonical
+        
+        a = Query().where('Project', 'PROJ').where('labels', ['b', 'a']).order_by('created', 'desc')
+        b = Query().where('labels', ['a', 'b']).where('project', 'PROJ').order_by('Created', 'DESC')
+        assert a == b
+        assert str(a) == 'labels IN ("a", "b") AND project = "PROJ" ORDER BY created DESC'
+        assert str(Query().where('summary', 'say "hi" \\ bye', '~')) == 'summary ~ "say \\"hi\\" \\\\ bye"'
+        assert canonical("project=PROJ and status in ('To Do' ,Done) order  by key") == \
+            'project = PROJ AND status IN ("To Do", Done) ORDER BY key'
+        with pytest.raises(ValueError):
+            Query().where('status', 'Done', 'LIKE')
+
+
+class TestClientCache:
+    """Test client-side caching"""
+    
+    def test_ttl_and_lru_eviction(self):
+        """Test entries expire per kind and the least recently used is evicted"""
+        from src.jira_manager.cache import ClientCache, MISSING
+        
+        now = [0.0]
+        cache = ClientCache(max_size=2, ttls={'issue': 10}, clock=lambda: now[0])
+        cache.set('issue', 'A', 1)
+        cache.set('transitions', 'A', 2)
+        assert cache.get('issue', 'A') == 1
+        
+        cache.set('issue', 'B', 3)
+        assert cache.get('transitions', 'A') is MISSING
+        
+        now[0] = 11.0
+        assert cache.get('issue', 'B') is MISSING
+        assert cache.stats()['hits'] == {'issue': 1}
+        assert cache.stats()['evictions'] == 1
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_update_reuses_cached_issue_and_invalidates(self, mock_jira):
+        """Test update_issue hits the cache and drops the entry afterwards"""
+        from src.jira_manager.cache import ClientCache
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            cache = ClientCache()
+            client = JiraClient(cache=cache)
+            
+            client.get_issue('TEST-1')
+            client.update_issue('TEST-1', summary='New summary')
+            assert mock_jira_instance.issue.call_count == 1
+            
+            client.get_issue('TEST-1')
+            assert mock_jira_instance.issue.call_count == 2
+            assert cache.stats()['hits'] == {'issue': 1}
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_transitions_cached_per_workflow_state(self, mock_jira):
+        """Test transitions are shared by issues in one state and follow status changes"""
+        from src.jira_manager.cache import ClientCache
+        from src.jira_manager.webhooks import WebhookProcessor
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def raw(key, status):
+                return {'key': key, 'fields': {
+                    'project': {'key': 'TEST'},
+                    'issuetype': {'name': 'Task'},
+                    'status': {'name': status},
+                    'updated': '2024-01-01T00:00:00.000+0000',
+                }}
+            mock_jira_instance = mock_jira.return_value
+            # An issue that is not cached is read with its transitions in one request
+            mock_jira_instance._get_json.side_effect = lambda path, params: dict(
+                raw(path.split('/')[-1], 'To Do'), transitions=[{'id': '21', 'name': 'Start', 'to': {}}]
+            )
+            mock_jira_instance.transitions.return_value = [{'id': '31', 'name': 'Done'}]
+            client = JiraClient(cache=ClientCache())
+            
+            assert client.get_transitions('TEST-1') == [{'id': '21', 'name': 'Start'}]
+            assert client.get_transitions('TEST-2') == [{'id': '21', 'name': 'Start'}]
+            assert mock_jira_instance._get_json.call_count == 2
+            mock_jira_instance.search_issues.assert_not_called()
+            
+            # A status change seen through a webhook caches the issue in another state
+            WebhookProcessor(client).handle({
+                'webhookEvent': 'jira:issue_updated', 'issue': raw('TEST-1', 'In Progress')
+            })
+            assert client.get_transitions('TEST-1') == [{'id': '31', 'name': 'Done'}]
+            assert client.get_transitions('TEST-1') == [{'id': '31', 'name': 'Done'}]
+            assert mock_jira_instance.transitions.call_count == 1
+            assert mock_jira_instance._get_json.call_count == 2
+            
+            # The cached issue now finds its state's transitions without a request
+            WebhookProcessor(client).handle({
+                'webhookEvent': 'jira:issue_updated', 'issue': raw('TEST-1', 'To Do')
+            })
+            assert client.get_transitions('TEST-1') == [{'id': '21', 'name': 'Start'}]
+            assert mock_jira_instance._get_json.call_count == 2
+            assert mock_jira_instance.transitions.call_count == 1
+
+
+
+class TestRequestScheduler:
+    """Test retrying and throttling of Jira requests"""
+    
+    @staticmethod
+    def _error(status, headers=None):
+        error = Exception(f"HTTP {status}")
+        error.status_code = status
+        error.response = Mock(headers=headers or {})
+        return error
+    
+    def test_retries_429_honoring_retry_after(self):
+        """Test a 429 is retried after Retry-After and halves concurrency"""
+        from src.jira_manager.throttle import RequestScheduler
+        
+        sleeps = []
+        scheduler = RequestScheduler(max_concurrency=8, sleep=sleeps.append)
+        func = Mock(side_effect=[self._error(429, {'Retry-After': '3'}), 'ok'])
+        
+        assert scheduler.call(func, 'TEST-1') == 'ok'
+        assert sleeps == [3.0]
+        assert scheduler.concurrency_limit == 4
+        assert scheduler.retries == 1
+    
+    def test_non_retryable_errors_raise_immediately(self):
+        """Test client errors are not retried"""
+        from src.jira_manager.throttle import RequestScheduler
+        
+        scheduler = RequestScheduler(sleep=lambda delay: None)
+        func = Mock(side_effect=self._error(404))
+        
+        with pytest.raises(Exception):
+            scheduler.call(func)
+        assert func.call_count == 1
+    
+    def test_gives_up_after_max_retries(self):
+        """Test transient errors are retried with backoff up to max_retries"""
+        from src.jira_manager.throttle import RequestScheduler
+        
+        sleeps = []
+        scheduler = RequestScheduler(max_retries=3, backoff=1, sleep=sleeps.append)
+        func = Mock(side_effect=self._error(503))
+        
+        with pytest.raises(Exception):
+            scheduler.call(func)
+        assert func.call_count == 4
+        assert [0.5 <= sleeps[0] <= 1, 1 <= sleeps[1] <= 2, 2 <= sleeps[2] <= 4] == [True] * 3
+    
+    def test_non_idempotent_calls_retry_only_unsent_or_throttled(self):
+        """Test a write is retried on 429 or a refused connection, never on 5xx"""
+        from src.jira_manager.throttle import RequestScheduler
+        
+        class NewConnectionError(Exception):
+            pass
+        
+        scheduler = RequestScheduler(sleep=lambda delay: None)
+        refused = Exception('Max retries exceeded')
+        refused.__cause__ = NewConnectionError('Connection refused')
+        func = Mock(side_effect=[self._error(429), refused, 'created'])
+        assert scheduler.call(func, idempotent=False) == 'created'
+        
+        func = Mock(side_effect=[self._error(503), 'created'])
+        with pytest.raises(Exception):
+            scheduler.call(func, idempotent=False)
+        assert func.call_count == 1
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_create_issue_not_retried_on_503(self, mock_jira):
+        """Test a POST that failed with 503 is not sent again"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            from src.jira_manager.throttle import RequestScheduler
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.create_issue.side_effect = JIRAError(status_code=503, text='Unavailable')
+            mock_jira_instance.issue.side_effect = [JIRAError(status_code=503, text='Unavailable'), Mock()]
+            client = JiraClient(scheduler=RequestScheduler(sleep=lambda delay: None))
+            
+            with pytest.raises(JiraManagerError):
+                client.create_issue('Once only')
+            assert mock_jira_instance.create_issue.call_count == 1
+            # Reads are still retried
+            client.get_issue('TEST-1')
+            assert mock_jira_instance.issue.call_count == 2
+
+
+class TestMetricsRecorder:
+    """Test request instrumentation"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_records_operations_retries_and_errors(self, mock_jira):
+        """Test operations are timed with retry and error counts"""
+        from src.jira_manager.metrics import MetricsRecorder
+        from src.jira_manager.throttle import RequestScheduler
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            throttled = Exception("HTTP 429")
+            throttled.status_code = 429
+            throttled.response = Mock(headers={'Retry-After': '0'})
+            missing = JIRAError(status_code=404, text='missing')
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.issue.side_effect = [throttled, MagicMock(), missing]
+            recorder = MetricsRecorder()
+            client = JiraClient(
+                instrumentation=recorder,
+                scheduler=RequestScheduler(sleep=lambda delay: None)
+            )
+            
+            client.get_issue('TEST-1')
+            with pytest.raises(IssueNotFoundError):
+                client.get_issue('TEST-2')
+            
+            stats = recorder.snapshot()['operations']['get_issue']
+            assert stats['count'] == 2
+            assert stats['retries'] == 1
+            assert stats['errors'] == {'JIRAError': 1}
+            mock_jira_instance._session.hooks.__getitem__.return_value.append.assert_called_once()
+            
+            text = recorder.to_prometheus()
+            assert 'jira_manager_operation_duration_seconds_count{operation="get_issue"} 2' in text
+            assert 'jira_manager_operation_retries_total{operation="get_issue"} 1' in text
+    
+    def test_response_hook_groups_endpoints(self):
+        """Test HTTP responses are grouped by normalized endpoint"""
+        from datetime import timedelta
+        from src.jira_manager.metrics import MetricsRecorder
+        
+        recorder = MetricsRecorder()
+        for key in ('TEST-1', 'TEST-22'):
+            response = Mock(status_code=200, content=b'{"key": 1}', elapsed=timedelta(seconds=0.2))
+            response.request = Mock(method='GET', body=None,
+                                    url=f'https://jira/rest/api/2/issue/{key}?fields=summary')
+            recorder.response_hook(response)
+        
+        endpoint = recorder.snapshot()['endpoints']['GET /rest/api/2/issue/{key}']
+        assert endpoint['count'] == 2
+        assert endpoint['response_bytes'] == 20
+        assert 0.1 <= endpoint['p99'] <= 0.25
+    
+    def test_response_hook_does_not_read_streamed_bodies(self):
+        """Test streamed downloads are sized from headers and grouped by attachment id"""
+        from datetime import timedelta
+        from unittest.mock import PropertyMock
+        from src.jira_manager.metrics import MetricsRecorder, normalize_endpoint
+        
+        recorder = MetricsRecorder()
+        for name, length in (('a.log', '5000'), ('b.log', None)):
+            response = Mock(status_code=200, elapsed=timedelta(seconds=0.1), _content=False,
+                            headers={'Content-Length': length} if length else {})
+            type(response).content = PropertyMock(side_effect=AssertionError('body read'))
+            response.request = Mock(method='GET', body=None, headers={},
+                                    url=f'https://jira/secure/attachment/100{len(name)}/{name}')
+            recorder.response_hook(response)
+        
+        endpoint = recorder.snapshot()['endpoints']['GET /secure/attachment/{id}/{filename}']
+        assert endpoint['count'] == 2
+        assert endpoint['response_bytes'] == 5000
+        assert normalize_endpoint('https://jira/rest/api/2/attachment/content/10042') == (
+            '/rest/api/2/attachment/content/{id}'
+        )
+
+
+class TestAsyncJiraClient:
+    """Test the asyncio client against an in-memory transport"""
+    
+    @patch.dict('os.environ', {
+        'JIRA_URL': 'https://test.example.com',
+        'JIRA_EMAIL': 'test@example.com',
+        'JIRA_API_TOKEN': 'test-token',
+        'JIRA_PROJECT_KEY': 'TEST'
+    })
+    def test_gather_and_retry(self):
+        """Test concurrent reads, 429 retries and error mapping"""
+        httpx = pytest.importorskip('httpx')
+        import asyncio
+        from src.jira_manager.async_client import AsyncJiraClient
+        
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            key = request.url.path.rsplit('/', 1)[-1]
+            if key == 'TEST-0' and calls.count(request.url.path) == 1:
+                return httpx.Response(429, headers={'Retry-After': '0'})
+            if key == 'TEST-404':
+                return httpx.Response(404, json={'errorMessages': ['missing']})
+            return httpx.Response(200, json={'key': key, 'fields': {}})
+        
+        async def run():
+            async with AsyncJiraClient(
+                concurrency=5, transport=httpx.MockTransport(handler)
+            ) as client:
+                issues = await client.get_issues([f'TEST-{n}' for n in range(20)])
+                with pytest.raises(IssueNotFoundError):
+                    await client.get_issue('TEST-404')
+                return issues
+        
+        issues = asyncio.run(run())
+        assert [i['key'] for i in issues] == [f'TEST-{n}' for n in range(20)]
+        assert calls.count('/rest/api/2/issue/TEST-0') == 2
+    
+    @patch.dict('os.environ', {
+        'JIRA_URL': 'https://test.example.com',
+        'JIRA_EMAIL': 'test@example.com',
+        'JIRA_API_TOKEN': 'test-token',
+        'JIRA_PROJECT_KEY': 'TEST'
+    })
+    def test_post_not_retried_on_503(self):
+        """Test creates are sent once on 5xx while searches are retried"""
+        httpx = pytest.importorskip('httpx')
+        import asyncio
+        from src.jira_manager.async_client import AsyncJiraClient
+        
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.endswith('/search') and calls.count(request.url.path) == 1:
+                return httpx.Response(503)
+            if request.url.path.endswith('/search'):
+                return httpx.Response(200, json={'total': 0, 'issues': []})
+            return httpx.Response(503)
+        
+        async def run():
+            async with AsyncJiraClient(transport=httpx.MockTransport(handler), cloud=False) as client:
+                client.backoff = 0
+                with pytest.raises(JiraManagerError):
+                    await client.create_issue('Once only')
+                return await client.search_issues('project = TEST')
+        
+        asyncio.run(run())
+        assert calls.count('/rest/api/2/issue') == 1
+        assert calls.count('/rest/api/2/search') == 2
+
+
+class TestExport:
+    """Test streaming export of search results"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_gzip_jsonl_export_resumes_after_crash(self, mock_jira, tmp_path):
+        """Test an interrupted export continues from its checkpoint"""
+        import gzip
+        import json
+        from src.jira_manager.export import export_issues
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def page(start):
+                issues = [{'key': f'TEST-{n}', 'fields': {'summary': str(n)}}
+                          for n in range(start, min(start + 2, 5))]
+                return {'total': 5, 'issues': issues}
+            
+            crash = [True]
+            
+            def search_issues(jql, startAt, **kwargs):
+                if startAt == 4 and crash[0]:
+                    raise RuntimeError("connection lost")
+                return page(startAt)
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search_issues
+            client = JiraClient()
+            target = str(tmp_path / 'issues.jsonl.gz')
+            
+            with pytest.raises(RuntimeError):
+                export_issues(client, 'project = TEST ORDER BY key', target, page_size=2)
+            
+            crash[0] = False
+            assert export_issues(client, 'project = TEST ORDER BY key', target, page_size=2) == 5
+            
+            with gzip.open(target, 'rt') as handle:
+                keys = [json.loads(line)['key'] for line in handle]
+            assert keys == [f'TEST-{n}' for n in range(5)]
+            assert not (tmp_path / 'issues.jsonl.gz.checkpoint').exists()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_parquet_parts_share_string_schema(self, mock_jira, tmp_path):
+        """Test a column empty in one part file keeps the string type"""
+        pytest.importorskip('pyarrow')
+        import pyarrow.parquet as pq
+        from src.jira_manager.export import export_issues
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def search_issues(jql, startAt, **kwargs):
+                issues = [
+                    {'id': str(n), 'key': f'TEST-{n}', 'fields': {
+                        'summary': str(n),
+                        'assignee': {'name': 'alice'} if n >= 2 else None,
+                    }}
+                    for n in range(startAt, min(startAt + 2, 4))
+                ]
+                return {'total': 4, 'issues': issues}
+            
+            mock_jira.return_value.search_issues.side_effect = search_issues
+            target = tmp_path / 'issues.parquet'
+            with patch('src.jira_manager.export.PARQUET_PAGES_PER_PART', 1):
+                assert export_issues(JiraClient(), 'project = TEST ORDER BY key', str(target), page_size=2) == 4
+            
+            parts = sorted(target.glob('part-*.parquet'))
+            assert len(parts) == 2
+            schemas = {str(pq.read_schema(part)) for part in parts}
+            assert len(schemas) == 1 and 'null' not in schemas.pop()
+            assert pq.read_table(str(target)).column('assignee').to_pylist() == [None, None, 'alice', 'alice']
+
+
+class TestIssueMirror:
+    """Test the local SQLite issue mirror"""
+    
+    @staticmethod
+    def _raw(key, status, created, assignee='alice'):
+        return {
+            'key': key,
+            'fields': {
+                'project': {'key': 'TEST'},
+                'summary': f'Issue {key}',
+                'status': {'name': status},
+                'assignee': {'name': assignee},
+                'priority': {'name': 'Medium'},
+                'created': created,
+                'updated': created,
+            },
+        }
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_sync_and_list_from_mirror(self, mock_jira, tmp_path):
+        """Test full then incremental sync and answering list_issues locally"""
+        from src.jira_manager.mirror import IssueMirror
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 2, 'issues': [
+                self._raw('TEST-1', 'To Do', '2024-01-01T00:00:00.000+0000'),
+                self._raw('TEST-2', 'Done', '2024-01-02T00:00:00.000+0000'),
+            ]}
+            mirror = IssueMirror(str(tmp_path / 'mirror.db'), projects=['TEST'])
+            client = JiraClient(mirror=mirror)
+            
+            assert mirror.sync(client) == 2
+            mock_jira_instance.search_issues.return_value = {'total': 1, 'issues': [
+                self._raw('TEST-1', 'Done', '2024-01-01T00:00:00.000+0000'),
+            ]}
+            assert mirror.sync(client) == 1
+            jql = mock_jira_instance.search_issues.call_args.args[0]
+            assert 'updated >= "-5m"' in jql
+            
+            calls = mock_jira_instance.search_issues.call_count
+            issues = client.list_issues(status='done')
+            assert [i.key for i in issues] == ['TEST-2', 'TEST-1']
+            assert issues[0].fields.summary == 'Issue TEST-2'
+            assert mock_jira_instance.search_issues.call_count == calls
+            mirror.close()
+
+
+
+class TestWebhooks:
+    """Test applying pushed Jira events"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_events_update_cache_and_mirror(self, mock_jira, tmp_path):
+        """Test created/updated/deleted events and out-of-order deliveries"""
+        from src.jira_manager.cache import ClientCache, MISSING
+        from src.jira_manager.mirror import IssueMirror
+        from src.jira_manager.webhooks import WebhookProcessor
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mirror = IssueMirror(str(tmp_path / 'mirror.db'), projects=['TEST'])
+            client = JiraClient(cache=ClientCache(), mirror=mirror)
+            processor = WebhookProcessor(client)
+            
+            def event(name, status, updated):
+                raw = TestIssueMirror._raw('TEST-1', status, '2024-01-01T00:00:00.000+0000')
+                raw['fields']['updated'] = updated
+                return {'webhookEvent': name, 'issue': raw}
+            
+            assert processor.handle(event('jira:issue_created', 'To Do', '2024-01-01T00:00:00.000+0000'))
+            processor.handle(event('jira:issue_updated', 'Done', '2024-01-03T00:00:00.000+0000'))
+            client.cache.set('search', 'project = TEST', ['stale'])
+            # A late delivery of an older update must not roll anything back
+            assert not processor.handle(
+                event('jira:issue_updated', 'In Progress', '2024-01-02T00:00:00.000+0000')
+            )
+            assert mirror.get_issue('TEST-1')['fields']['status']['name'] == 'Done'
+            assert client.cache.get('issue', 'TEST-1').raw['fields']['status']['name'] == 'Done'
+            assert client.cache.get('search', 'project = TEST') == ['stale']
+            processor.handle(event('jira:issue_updated', 'Done', '2024-01-03T12:00:00.000+0000'))
+            assert client.cache.get('search', 'project = TEST') is MISSING
+            
+            # A payload that fails to apply is counted, not raised
+            with patch.object(mirror, 'apply', side_effect=ValueError('bad payload')):
+                assert not processor.handle(event('jira:issue_updated', 'Done', '2024-01-03T13:00:00.000+0000'))
+            assert processor.failed == 1
+            assert not processor.handle({'webhookEvent': 'comment_created'})
+            
+            processor.handle(event('jira:issue_deleted', 'Done', '2024-01-04T00:00:00.000+0000'))
+            assert mirror.get_issue('TEST-1') is None
+            assert client.cache.get('issue', 'TEST-1') is MISSING
+            mirror.close()
+    
+    def test_receiver_checks_signature(self):
+        """Test the HTTP receiver rejects unsigned deliveries"""
+        import hashlib
+        import hmac
+        import urllib.error
+        import urllib.request
+        from src.jira_manager.webhooks import WebhookProcessor, serve_webhooks
+        
+        processor = WebhookProcessor()
+        server = serve_webhooks(processor, port=0, secret='s3cret')
+        url = f'http://127.0.0.1:{server.server_port}/webhooks'
+        body = json.dumps({'webhookEvent': 'jira:issue_deleted', 'issue': {'key': 'TEST-9'}}).encode()
+        try:
+            with pytest.raises(urllib.error.HTTPError) as excinfo:
+                urllib.request.urlopen(urllib.request.Request(url, data=body))
+            assert excinfo.value.code == 401
+            
+            signature = 'sha256=' + hmac.new(b's3cret', body, hashlib.sha256).hexdigest()
+            request = urllib.request.Request(url, data=body, headers={'X-Hub-Signature': signature})
+            assert urllib.request.urlopen(request).status == 204
+            assert processor.applied == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestImporter:
+    """Test the resumable CSV import"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_import_validates_and_resumes(self, mock_jira, tmp_path):
+        """Test invalid rows are not sent and an interrupted batch is not duplicated"""
+        from src.jira_manager.importer import import_csv
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def get_json(path, params=None):
+                if path.endswith('/issuetypes'):
+                    return {'values': [{'id': '3', 'name': 'Task'}], 'isLast': True}
+                return {'values': [
+                    {'fieldId': 'summary', 'name': 'Summary', 'required': True},
+                    {'fieldId': 'description', 'name': 'Description', 'required': False},
+                    {'fieldId': 'priority', 'name': 'Priority', 'required': False,
+                     'allowedValues': [{'id': '1', 'name': 'High'}, {'id': '2', 'name': 'Low'}]},
+                ], 'isLast': True}
+            
+            def create_issues(field_list, prefetch=True):
+                results = []
+                for fields in field_list:
+                    issue = MagicMock()
+                    issue.key = f"TEST-{fields['summary']}"
+                    results.append({'status': 'Success', 'issue': issue, 'error': None})
+                return results
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance._get_json.side_effect = get_json
+            mock_jira_instance.create_issues.side_effect = create_issues
+            # Of the batch in flight when the last run died, only row 0 made it
+            mock_jira_instance.search_issues.return_value = {'total': 1, 'issues': [
+                {'key': 'TEST-10', 'fields': {'summary': 'first'}},
+            ]}
+            
+            csv_path = tmp_path / 'issues.csv'
+            csv_path.write_text(
+                'summary,priority\nfirst,High\nsecond,Low\nthird,Urgent\nfourth,\n'
+            )
+            journal = tmp_path / 'issues.csv.journal'
+            journal.write_text(json.dumps({
+                'event': 'sent', 'batch': 0, 'time': 0,
+                'rows': [[0, 'first', 'TEST'], [1, 'second', 'TEST']],
+            }) + '\n{"event": "do')
+            
+            client = JiraClient()
+            summary = import_csv(str(csv_path), client, workers=1, batch_size=2)
+            
+            assert summary['created'] == 2
+            assert summary['skipped'] == 1
+            assert summary['errors'] == [
+                {'row': 2, 'error': "'Urgent' is not an allowed value for 'Priority'"}
+            ]
+            sent = [f['summary'] for call in mock_jira_instance.create_issues.call_args_list
+                    for f in call.args[0]]
+            assert sent == ['second', 'fourth']
+            assert 'reporter = currentUser()' in mock_jira_instance.search_issues.call_args.args[0]
+            
+            # A rerun finds everything done
+            mock_jira_instance.create_issues.reset_mock()
+            summary = import_csv(str(csv_path), client, workers=1, batch_size=2)
+            assert summary['skipped'] == 3
+            assert mock_jira_instance.create_issues.call_count == 0
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_reconcile_matches_rows_in_one_project(self, mock_jira, tmp_path):
+        """Test interrupted rows with the same summary and project get distinct issues"""
+        from src.jira_manager.importer import ImportJournal, import_csv
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = {'total': 2, 'issues': [
+                {'key': f'TEST-{n}', 'fields': {'summary': 'Same', 'project': {'key': 'TEST'}}}
+                for n in (11, 12)
+            ]}
+            csv_path = tmp_path / 'issues.csv'
+            csv_path.write_text('summary,project_key\nSame,test\nSame,test\n')
+            journal_path = tmp_path / 'issues.csv.journal'
+            journal_path.write_text(json.dumps({
+                'event': 'sent', 'batch': 0, 'time': 0,
+                'rows': [[1, 'Same', 'test'], [0, 'Same', 'test']],
+            }) + '\n')
+            
+            summary = import_csv(str(csv_path), JiraClient(), workers=1, validate=False)
+            
+            assert summary['skipped'] == 2
+            assert mock_jira_instance.create_issues.call_count == 0
+            journal = ImportJournal(str(journal_path))
+            assert journal.created == {0: 'TEST-11', 1: 'TEST-12'}
+            journal.close()
+    
+    def test_workers_use_client_config(self, tmp_path):
+        """Test worker processes use the parent's config, not config.ini"""
+        from benchmarks.mock_jira import MockJiraServer
+        from src.jira_manager.importer import import_csv
+        
+        csv_path = tmp_path / 'issues.csv'
+        csv_path.write_text('summary\n' + ''.join(f'Row {n}\n' for n in range(6)))
+        with MockJiraServer() as server, patch.dict('os.environ', {}, clear=True):
+            config = Config.from_dict({
+                'url': server.url, 'email': 'test@example.com',
+                'api_token': 'test-token', 'project_key': 'TEST',
+            })
+            client = JiraClient(config, server_info=False)
+            summary = import_csv(str(csv_path), client, workers=2, batch_size=2, validate=False)
+        
+        assert summary['errors'] == []
+        assert summary['created'] == 6
+
+
+
+class TestJiraClientPool:
+    """Test the multi-tenant client pool"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_clients_per_tenant_with_lru_eviction(self, mock_jira):
+        """Test lazy clients per tenant, LRU and idle eviction, and leases"""
+        from src.jira_manager.pool import JiraClientPool
+        
+        now = [0.0]
+        pool = JiraClientPool(max_clients=2, idle_timeout=60, clock=lambda: now[0], rate=5)
+        for name in ('a', 'b', 'c'):
+            pool.register(name, url=f'https://{name}.atlassian.net', email='bot@example.com',
+                          api_token=f'{name}-token', JIRA_PROJECT_KEY=name.upper())
+        
+        client_a = pool.get('a')
+        assert pool.get('a') is client_a
+        assert client_a.config.jira_url == 'https://a.atlassian.net'
+        assert client_a.config.project_key == 'A'
+        assert client_a.scheduler.bucket.rate == 5
+        assert mock_jira.call_count == 0
+        pool.release(client_a)
+        pool.release(client_a)
+        
+        with pool.lease('b'):
+            pass
+        with pool.lease('a'):
+            with pool.lease('c'):
+                # 'b' was least recently used and not leased
+                assert sorted(pool._open) == ['a', 'c']
+        assert pool.evictions == 1
+        
+        now[0] = 61
+        assert pool.evict_idle() == 2
+        assert len(pool) == 0
+        with pool.lease('a') as client:
+            assert client is not client_a
+        with pytest.raises(ValueError):
+            pool.release(client_a)
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_idle_eviction_follows_release_order(self, mock_jira):
+        """Test a client released late does not hide idle clients opened after it"""
+        from src.jira_manager.pool import JiraClientPool
+        
+        now = [0.0]
+        pool = JiraClientPool(idle_timeout=10, clock=lambda: now[0])
+        for name in ('a', 'b'):
+            pool.register(name, url=f'https://{name}.atlassian.net', email='bot@example.com',
+                          api_token='t')
+        
+        client_a = pool.get('a')
+        now[0] = 1
+        pool.release(pool.get('b'))
+        now[0] = 9
+        pool.release(client_a)
+        
+        now[0] = 15
+        assert pool.evict_idle() == 1
+        assert list(pool._open) == ['a']
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_leased_client_closed_after_release(self, mock_jira):
+        """Test a client replaced or detached while leased is closed only once released"""
+        from src.jira_manager.pool import JiraClientPool
+        
+        pool = JiraClientPool(max_clients=1)
+        pool.register('a', url='https://a.atlassian.net', email='bot@example.com', api_token='t')
+        
+        with pool.lease('a') as client:
+            client.close = Mock()
+            pool.register('a', url='https://a2.atlassian.net', email='bot@example.com', api_token='t')
+            client.close.assert_not_called()
+        client.close.assert_called_once()
+        
+        client = pool.get('a')
+        client.close = Mock()
+        pool.close()
+        client.close.assert_not_called()
+        pool.release(client)
+        client.close.assert_called_once()
+    
+    def test_fair_gate_round_robin(self):
+        """Test a freed slot goes to the next waiting tenant in turn"""
+        import threading
+        import time
+        from src.jira_manager.pool import FairGate
+        
+        gate = FairGate(1)
+        gate.acquire('noisy')
+        order = []
+        
+        def call(tenant):
+            gate.acquire(tenant)
+            order.append(tenant)
+            gate.release()
+        
+        threads = []
+        for tenant in ['noisy', 'noisy', 'noisy', 'quiet']:
+            thread = threading.Thread(target=call, args=(tenant,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.02)
+        gate.release()
+        for thread in threads:
+            thread.join(timeout=5)
+        
+        assert order == ['noisy', 'quiet', 'noisy', 'noisy']
+
+
+
+class TestHistory:
+    """Test bulk status-transition history"""
+    
+    @staticmethod
+    def _history(created, to_status, from_status='To Do'):
+        return {
+            'created': created,
+            'author': {'name': 'alice'},
+            'items': [{'field': 'status', 'fromString': from_status, 'toString': to_status}],
+        }
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_transitions_with_truncated_changelog_and_store(self, mock_jira, tmp_path):
+        """Test events stream from one search, long histories are completed, and cache hits"""
+        from src.jira_manager.history import HistoryStore, iter_status_transitions
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            updated = '2024-01-05T00:00:00.000+0000'
+            full = [
+                self._history('2024-01-02T00:00:00.000+0000', 'In Progress'),
+                {'created': '2024-01-03T00:00:00.000+0000', 'items': [{'field': 'summary'}]},
+                self._history('2024-01-04T00:00:00.000+0000', 'Done', 'In Progress'),
+            ]
+            
+            def search_issues(jql, startAt=0, maxResults=50, fields=None, expand=None, json_result=True):
+                issues = [
+                    {'key': 'TEST-1', 'fields': {'updated': updated}},
+                    {'key': 'TEST-2', 'fields': {'updated': updated}},
+                ]
+                if expand == 'changelog':
+                    issues[0]['changelog'] = {'total': 1, 'histories': [
+                        self._history('2024-01-02T00:00:00.000+0000', 'In Progress'),
+                    ]}
+                    # Truncated: only the newest entry came back
+                    issues[1]['changelog'] = {'total': 3, 'histories': full[2:]}
+                return {'total': 2, 'issues': issues}
+            
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.side_effect = search_issues
+            mock_jira_instance._get_json.return_value = {'values': full, 'total': 3, 'isLast': True}
+            client = JiraClient()
+            store = HistoryStore(str(tmp_path / 'history.db'))
+            
+            events = list(iter_status_transitions(client, 'project = TEST', store=store))
+            assert [(e.issue, e.from_status, e.to_status) for e in events] == [
+                ('TEST-1', 'To Do', 'In Progress'),
+                ('TEST-2', 'To Do', 'In Progress'),
+                ('TEST-2', 'In Progress', 'Done'),
+            ]
+            assert events[2].timestamp.day == 4 and events[2].author == 'alice'
+            mock_jira_instance._get_json.assert_called_once()
+            assert mock_jira_instance._get_json.call_args.args[0] == 'issue/TEST-2/changelog'
+            
+            # Nothing changed, so the second run only lists keys and stamps
+            mock_jira_instance.search_issues.reset_mock()
+            assert list(iter_status_transitions(client, 'project = TEST', store=store)) == events
+            assert mock_jira_instance.search_issues.call_count == 1
+            assert mock_jira_instance.search_issues.call_args.kwargs['expand'] is None
+            store.close()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_rejected_stale_key_is_skipped(self, mock_jira, tmp_path):
+        """Test a key that vanished between the two passes does not end the walk"""
+        from src.jira_manager.history import HistoryStore, iter_status_transitions
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            updated = '2024-01-05T00:00:00.000+0000'
+            keys = ['TEST-1', 'TEST-2', 'TEST-3']
+            queries = []
+            
+            def search_issues(jql, startAt=0, maxResults=50, fields=None, expand=None, json_result=True):
+                queries.append(jql)
+                if expand is None:
+                    return {'total': 3, 'issues': [{'key': k, 'fields': {'updated': updated}} for k in keys]}
+                if '"TEST-2"' in jql:
+                    raise JIRAError(status_code=400, text="An issue with key 'TEST-2' does not exist")
+                issues = [
+                    {'key': k, 'fields': {'updated': updated}, 'changelog': {'total': 1, 'histories': [
+                        self._history('2024-01-02T00:00:00.000+0000', 'Done'),
+                    ]}}
+                    for k in keys if f'"{k}"' in jql
+                ]
+                return {'total': len(issues), 'issues': issues}
+            
+            mock_jira.return_value.search_issues.side_effect = search_issues
+            store = HistoryStore(str(tmp_path / 'history.db'))
+            
+            events = list(iter_status_transitions(JiraClient(), 'project = TEST', store=store))
+            assert [e.issue for e in events] == ['TEST-1', 'TEST-3']
+            assert queries[1] == 'key IN ("TEST-1", "TEST-2", "TEST-3")'
+            assert sorted(store.lookup({k: updated for k in keys})) == ['TEST-1', 'TEST-3']
+            store.close()
+
+
+
+class TestOutbox:
+    """Test the durable write queue"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_writes_replay_in_order_coalesced_and_deduplicated(self, mock_jira, tmp_path):
+        """Test per-issue order, coalescing, idempotency keys and retry of outages"""
+        from src.jira_manager.outbox import Outbox
+        from src.jira_manager.throttle import RequestScheduler
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            calls = []
+            mock_jira_instance = mock_jira.return_value
+            created = MagicMock()
+            created.key = 'TEST-7'
+            mock_jira_instance.create_issue.side_effect = (
+                lambda fields: calls.append(('create', fields['summary'])) or created
+            )
+            mock_jira_instance._session.put.side_effect = (
+                lambda url, data: calls.append(('update', json.loads(data)['fields']))
+            )
+            mock_jira_instance._get_url.side_effect = lambda path: f"https://test/{path}"
+            
+            def post(url, data):
+                body = json.loads(data)
+                calls.append(('comment', url.split('/')[-2], body['body']))
+                return Mock(json=Mock(return_value={'id': '100', 'body': body['body']}))
+            mock_jira_instance._session.post.side_effect = post
+            # Jira throttles the first transition attempt
+            outage = [True]
+            
+            def transition(key, name):
+                if outage.pop() if outage else False:
+                    raise JIRAError(status_code=429, text='Too Many Requests')
+                calls.append(('transition', key, name))
+            mock_jira_instance.transition_issue.side_effect = transition
+            
+            client = JiraClient(scheduler=RequestScheduler(max_retries=0))
+            outbox = Outbox(client, str(tmp_path / 'outbox.db'), backoff=0.01, poll_interval=0.01)
+            
+            new = outbox.create_issue('Queued', idempotency_key='req-1')
+            assert outbox.create_issue('Queued', idempotency_key='req-1') == 'req-1'
+            outbox.add_comment(new, 'first')
+            outbox.transition_issue('TEST-1', 'Start Progress')
+            outbox.update_issue('TEST-1', summary='New title')
+            second = outbox.update_issue('TEST-1', priority='High')
+            assert outbox.pending() == 4
+            assert calls == []
+            
+            outbox.start()
+            assert outbox.flush(timeout=5)
+            
+            assert calls.count(('create', 'Queued')) == 1
+            assert ('comment', 'TEST-7', 'first') in calls
+            assert calls.index(('create', 'Queued')) < calls.index(('comment', 'TEST-7', 'first'))
+            updates = [c for c in calls if c[0] == 'update']
+            assert updates == [('update', {'summary': 'New title', 'priority': {'name': 'High'}})]
+            # Updates are sent as one PUT, without fetching the issue
+            assert mock_jira_instance.issue.call_count == 0
+            assert calls.index(('transition', 'TEST-1', 'Start Progress')) < calls.index(updates[0])
+            assert outbox.status('req-1')['result'] == 'TEST-7'
+            assert outbox.status(second)['state'] == 'done'
+            outbox.close()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_non_idempotent_writes_are_not_retried_on_server_errors(self, mock_jira, tmp_path):
+        """Test a 5xx on a create is recorded as failed instead of risking a duplicate"""
+        from src.jira_manager.outbox import Outbox, stamp_label
+        from src.jira_manager.throttle import RequestScheduler
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.create_issue.side_effect = JIRAError(status_code=502, text='Bad Gateway')
+            client = JiraClient(scheduler=RequestScheduler(max_retries=0))
+            with Outbox(client, str(tmp_path / 'outbox.db'), backoff=0.01, poll_interval=0.01) as outbox:
+                key = outbox.create_issue('Once', labels=['ops'])
+                assert outbox.flush(timeout=5)
+                
+                assert outbox.status(key)['state'] == 'failed'
+                assert mock_jira_instance.create_issue.call_count == 1
+                fields = mock_jira_instance.create_issue.call_args.kwargs['fields']
+                assert fields['labels'] == ['ops', stamp_label(key)]
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_writes_interrupted_by_a_crash_are_checked_before_resending(self, mock_jira, tmp_path):
+        """Test in-flight writes are looked up by their stamp on restart"""
+        from src.jira_manager.outbox import STAMP_PROPERTY, Outbox, stamp_label
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            path = str(tmp_path / 'outbox.db')
+            outbox = Outbox(JiraClient(), path)
+            created = outbox.create_issue('Applied before the crash')
+            applied = outbox.add_comment('TEST-1', 'posted', idempotency_key='comment-1')
+            lost = outbox.add_comment('TEST-2', 'never arrived', idempotency_key='comment-2')
+            moved = outbox.transition_issue('TEST-3', 'Done')
+            renamed = outbox.update_issue('TEST-4', summary='Again')
+            outbox._db.execute("UPDATE ops SET state = 'sending'")
+            outbox._db.commit()
+            outbox.close()
+            
+            def search(jql, **kwargs):
+                assert jql == f'labels = "{stamp_label(created)}"'
+                return {'total': 1, 'issues': [{'key': 'TEST-9', 'fields': {}}]}
+            mock_jira_instance.search_issues.side_effect = search
+            mock_jira_instance._get_json.side_effect = lambda path, params: {'comments': [
+                {'id': '55', 'properties': [{'key': STAMP_PROPERTY, 'value': {'key': 'comment-1'}}]},
+            ]}
+            mock_jira_instance._session.post.return_value = Mock(json=Mock(return_value={'id': '56'}))
+            with Outbox(JiraClient(), path, backoff=0.01, poll_interval=0.01) as outbox:
+                assert outbox.flush(timeout=5)
+                
+                assert outbox.status(created)['result'] == 'TEST-9'
+                mock_jira_instance.create_issue.assert_not_called()
+                assert outbox.status(applied)['result'] == '55'
+                assert outbox.status(lost)['result'] == '56'
+                assert mock_jira_instance._session.post.call_count == 1
+                assert outbox.status(moved)['state'] == 'failed'
+                mock_jira_instance.transition_issue.assert_not_called()
+                assert outbox.status(renamed)['state'] == 'done'
+                assert mock_jira_instance._session.put.call_count == 1
+
+
+
+class TestAttachments:
+    """Test streaming attachment transfers"""
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_upload_and_download_skip_unchanged(self, mock_jira, tmp_path):
+        """Test uploads stream open files and downloads skip verified local copies"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            
+            def add_attachment(issue_key, handle, filename):
+                assert not isinstance(handle, (bytes, str)) and handle.read(4) == b'data'
+                return Mock(id=f'{filename}-id')
+            mock_jira_instance.add_attachment.side_effect = add_attachment
+            
+            upload = tmp_path / 'report.txt'
+            upload.write_bytes(b'data')
+            client = JiraClient()
+            results = client.upload_attachments('TEST-1', [str(upload), str(tmp_path / 'missing')])
+            assert [r['status'] for r in results] == ['Success', 'Error']
+            assert results[0]['id'] == 'report.txt-id'
+            
+            contents = {'10': b'x' * 5000, '11': b'second copy'}
+            mock_jira_instance.search_issues.return_value = {'total': 1, 'issues': [{
+                'key': 'TEST-1',
+                'fields': {'attachment': [
+                    {'id': '10', 'filename': 'log.txt', 'size': 5000, 'content': 'https://test/10'},
+                    {'id': '11', 'filename': 'log.txt', 'size': 11, 'content': 'https://test/11'},
+                ]},
+            }]}
+            
+            def get(url, stream=False):
+                body = contents[url.rsplit('/', 1)[1]]
+                response = Mock(status_code=200)
+                response.iter_content.side_effect = lambda size: (
+                    body[i:i + size] for i in range(0, len(body), size)
+                )
+                return response
+            mock_jira_instance._session.get.side_effect = get
+            
+            dest = tmp_path / 'archive'
+            results = client.download_attachments(str(dest), issue_keys=['TEST-1'], chunk_size=1024)
+            assert [r['status'] for r in results] == ['Downloaded', 'Downloaded']
+            assert (dest / 'TEST-1' / 'log.txt').read_bytes() == contents['10']
+            assert (dest / 'TEST-1' / '11_log.txt').read_bytes() == contents['11']
+            
+            # Unchanged files are verified locally, a damaged copy is fetched again
+            (dest / 'TEST-1' / '11_log.txt').write_bytes(b'second cop!')
+            mock_jira_instance._session.get.reset_mock()
+            results = client.download_attachments(str(dest), jql='project = TEST')
+            assert [r['status'] for r in results] == ['Skipped', 'Downloaded']
+            assert mock_jira_instance._session.get.call_count == 1
+            assert (dest / 'TEST-1' / '11_log.txt').read_bytes() == contents['11']
+    
+    @staticmethod
+    def _search_result(size):
+        return {'total': 1, 'issues': [{'key': 'TEST-1', 'fields': {'attachment': [
+            {'id': '10', 'filename': 'log.txt', 'size': size, 'content': 'https://test/10'},
+        ]}}]}
+    
+    @staticmethod
+    def _response(chunks):
+        response = Mock(status_code=200)
+        response.iter_content.side_effect = lambda size: iter(chunks)
+        return response
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_upload_reports_missing_file(self, mock_jira, tmp_path):
+        """Test a missing file is reported without sending anything"""
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            results = JiraClient().upload_attachments('TEST-1', [str(tmp_path / 'gone.log')])
+            
+            assert results[0]['status'] == 'Error'
+            assert 'No such file' in results[0]['error']
+            mock_jira.return_value.add_attachment.assert_not_called()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_interrupted_download_leaves_only_part_file(self, mock_jira, tmp_path):
+        """Test a broken or short stream never replaces the file, and a rerun completes it"""
+        from requests.exceptions import ChunkedEncodingError
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            def broken(size):
+                yield b'x' * 4
+                raise ChunkedEncodingError('Connection broken')
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = self._search_result(8)
+            response = Mock(status_code=200)
+            response.iter_content.side_effect = broken
+            mock_jira_instance._session.get.return_value = response
+            client = JiraClient()
+            target = tmp_path / 'TEST-1' / 'log.txt'
+            
+            results = client.download_attachments(str(tmp_path), issue_keys=['TEST-1'])
+            assert results[0]['status'] == 'Error'
+            assert not target.exists()
+            assert (tmp_path / 'TEST-1' / 'log.txt.part').read_bytes() == b'xxxx'
+            
+            # A body shorter than the size Jira reported is not accepted either
+            mock_jira_instance._session.get.return_value = self._response([b'x' * 6])
+            results = client.download_attachments(str(tmp_path), issue_keys=['TEST-1'])
+            assert results[0]['error'] == 'Downloaded 6 of 8 bytes'
+            assert not target.exists()
+            
+            mock_jira_instance._session.get.return_value = self._response([b'x' * 4, b'y' * 4])
+            results = client.download_attachments(str(tmp_path), issue_keys=['TEST-1'])
+            assert results[0]['status'] == 'Downloaded'
+            assert target.read_bytes() == b'xxxxyyyy'
+            assert not (tmp_path / 'TEST-1' / 'log.txt.part').exists()
+    
+    @patch('src.jira_manager.core.JIRA')
+    def test_checksum_mismatch_downloads_again(self, mock_jira, tmp_path):
+        """Test a local file of the right size but wrong checksum is replaced"""
+        import hashlib
+        
+        with patch.dict('os.environ', {
+            'JIRA_URL': 'https://test.atlassian.net',
+            'JIRA_EMAIL': 'test@example.com',
+            'JIRA_API_TOKEN': 'test-token',
+            'JIRA_PROJECT_KEY': 'TEST'
+        }):
+            mock_jira_instance = mock_jira.return_value
+            mock_jira_instance.search_issues.return_value = self._search_result(8)
+            mock_jira_instance._session.get.side_effect = lambda url, stream: self._response([b'original'])
+            client = JiraClient()
+            client.download_attachments(str(tmp_path), issue_keys=['TEST-1'])
+            
+            target = tmp_path / 'TEST-1' / 'log.txt'
+            target.write_bytes(b'tampered')
+            results = client.download_attachments(str(tmp_path), issue_keys=['TEST-1'])
+            
+            assert results[0]['status'] == 'Downloaded'
+            assert target.read_bytes() == b'original'
+            assert mock_jira_instance._session.get.call_count == 2
+            manifest = json.loads((tmp_path / 'TEST-1' / '.attachments.json').read_text())
+            assert manifest['10']['sha256'] == hashlib.sha256(b'original').hexdigest()
+
+
+
+class TestLazyImport:
+    """Test lazy clients in a fresh process, before python-jira is imported"""
+    
+    PRELUDE = (
+        "import sys\n"
+        "from src.jira_manager import JiraClient\n"
+        "from src.jira_manager.cache import ClientCache\n"
+        "from src.jira_manager.mirror import IssueMirror\n"
+        "raw = {'key': 'TEST-1', 'fields': {'project': {'key': 'TEST'}, 'summary': 'Lazy',\n"
+        "       'status': {'name': 'Done'}, 'created': '2024-01-01T00:00:00.000+0000',\n"
+        "       'updated': '2024-01-01T00:00:00.000+0000'}}\n"
+        "client = JiraClient(lazy=True, server_info=False, cache=ClientCache(),\n"
+        "                    mirror=IssueMirror('mirror.db', projects=['TEST']))\n"
+        "assert 'jira' not in sys.modules\n"
+    )
+    
+    def _run(self, tmp_path, script):
+        import os
+        import subprocess
+        import sys
+        
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root, JIRA_URL='https://test.atlassian.net',
+                   JIRA_EMAIL='test@example.com', JIRA_API_TOKEN='test-token',
+                   JIRA_PROJECT_KEY='TEST')
+        result = subprocess.run([sys.executable, '-c', self.PRELUDE + script], cwd=str(tmp_path),
+                                env=env, capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr
+    
+    def test_list_issues_from_mirror(self, tmp_path):
+        """Test wrapping mirrored issues binds the Issue class first"""
+        self._run(tmp_path, (
+            "client.mirror._upsert('TEST', [raw])\n"
+            "client.mirror._db.execute('INSERT INTO sync_state VALUES (?, ?)', ('TEST', 1.0))\n"
+            "assert [i.fields.summary for i in client.list_issues()] == ['Lazy']\n"
+        ))
+    
+    def test_webhook_refreshes_cache(self, tmp_path):
+        """Test a pushed update is cached as an Issue"""
+        self._run(tmp_path, (
+            "from src.jira_manager.webhooks import WebhookProcessor\n"
+            "assert WebhookProcessor(client).handle({'webhookEvent': 'jira:issue_updated', 'issue': raw})\n"
+            "assert client.cache.get('issue', 'TEST-1').key == 'TEST-1'\n"
+        ))
+    
+    def test_upload_missing_file(self, tmp_path):
+        """Test a missing file is reported rather than raising NameError"""
+        self._run(tmp_path, (
+            "results = client.upload_attachments('TEST-1', ['missing.txt'])\n"
+            "assert results[0]['status'] == 'Error', results\n"
+        ))
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
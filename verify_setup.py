@@ -1,6 +1,8 @@
 """Quick verification script to check if the project is set up correctly"""
 
 import sys
+import time
+from importlib.util import find_spec
 from pathlib import Path
 
 print("🔍 Verifying Jira Manager Setup...\n")
@@ -13,10 +15,10 @@ required_packages = ['jira', 'dotenv', 'pytest']
 missing_packages = []
 
 for package in required_packages:
-    try:
-        __import__(package)
+    # find_spec locates the package without paying for importing it
+    if find_spec(package) is not None:
         print(f"✅ Package '{package}' installed")
-    except ImportError:
+    else:
         print(f"❌ Package '{package}' NOT installed")
         missing_packages.append(package)
 
@@ -67,8 +69,10 @@ else:
 # Try importing the package
 print("\n📦 Testing package import:")
 try:
+    started = time.perf_counter()
     from src.jira_manager import JiraClient, Config
-    print("✅ Successfully imported JiraClient")
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"✅ Successfully imported JiraClient ({elapsed_ms:.1f} ms)")
     print("✅ Successfully imported Config")
 except Exception as e:
     print(f"❌ Failed to import: {e}")